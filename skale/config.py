@@ -29,3 +29,22 @@ DEFAULT_GAS_MULTIPLIER = float(os.getenv('DEFAULT_GAS_MULTIPLIER') or 1.2)
 DEFAULT_PRIORITY = int(os.getenv('DEFAULT_PRIORITY') or 5)
 NO_SYNC_TS_DIFF = int(os.getenv('NO_SYNC_TS_DIFF') or -1)
 TXRECORD_EXPIRATION = int(os.getenv('TXRECORD_EXPIRATION') or 24 * 60 * 60)  # 1 day
+TXRECORD_FORMAT = os.getenv('TXRECORD_FORMAT') or 'json'
+BATCH_CHUNK_SIZE = int(os.getenv('BATCH_CHUNK_SIZE') or 100)
+CALL_CACHE_SIZE = int(os.getenv('CALL_CACHE_SIZE') or 4096)
+CALL_CACHE_BLOCK_CHECK_INTERVAL = float(os.getenv('CALL_CACHE_BLOCK_CHECK_INTERVAL') or 1)
+CLIENT_CHECK_INTERVAL = float(os.getenv('CLIENT_CHECK_INTERVAL') or 1)
+BATCH_WORKERS = int(os.getenv('BATCH_WORKERS') or 4)
+ITER_PAGE_SIZE = int(os.getenv('ITER_PAGE_SIZE') or 100)
+ESCROW_CONTRACTS_CACHE_SIZE = int(os.getenv('ESCROW_CONTRACTS_CACHE_SIZE') or 1024)
+LOCAL_NONCE_ALLOCATION = os.getenv('LOCAL_NONCE_ALLOCATION', 'False') == 'True'
+NONCE_SYNC_INTERVAL = float(os.getenv('NONCE_SYNC_INTERVAL') or 10)
+GAS_ESTIMATE_CACHE_SIZE = int(os.getenv('GAS_ESTIMATE_CACHE_SIZE') or 1024)
+GAS_ESTIMATE_CACHE_TTL = float(os.getenv('GAS_ESTIMATE_CACHE_TTL') or 60)
+GAS_ESTIMATE_CACHE_BLOCKS = int(os.getenv('GAS_ESTIMATE_CACHE_BLOCKS') or 50)
+EIP1559_FEES = os.getenv('EIP1559_FEES', 'False') == 'True'
+FEE_HISTORY_BLOCKS = int(os.getenv('FEE_HISTORY_BLOCKS') or 10)
+FEE_HISTORY_PERCENTILE = float(os.getenv('FEE_HISTORY_PERCENTILE') or 50)
+FEE_ORACLE_REFRESH_INTERVAL = float(os.getenv('FEE_ORACLE_REFRESH_INTERVAL') or 1)
+BLOCK_POLL_MIN_INTERVAL = float(os.getenv('BLOCK_POLL_MIN_INTERVAL') or 0.2)
+BLOCK_POLL_MAX_INTERVAL = float(os.getenv('BLOCK_POLL_MAX_INTERVAL') or 3)
@@ -18,13 +18,16 @@
 #   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
 """ SKALE Allocator Core Escrow methods """
 
-from typing import Any, Dict, List
+from __future__ import annotations
 
-from eth_typing import ChecksumAddress
+import threading
+from typing import Any, Dict, Iterator, List, Tuple
+
+from eth_typing import BlockNumber, ChecksumAddress
 from web3 import Web3
 from web3.contract.contract import ContractFunction
 from web3.exceptions import ContractLogicError
-from web3.types import Wei
+from web3.types import BlockIdentifier, Wei
 
 from skale.contracts.allocator_contract import AllocatorContract
 from skale.contracts.base_contract import transaction_method
@@ -36,7 +39,9 @@ from skale.types.allocation import (
     PlanWithId,
     TimeUnit
 )
+from skale.utils.batch_utils import batch_call, iter_pages
 from skale.utils.helper import format_fields
+from skale.utils.web3_utils import get_pinned_block_number
 
 
 PLAN_FIELDS = [
@@ -58,9 +63,15 @@ BENEFICIARY_FIELDS = [
 
 MAX_NUM_OF_PLANS = 9999
 MAX_NUM_OF_BENEFICIARIES = 9999
+PLANS_PROBE_SIZE = 16
 
 
 class Allocator(AllocatorContract):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._plans: Tuple[BlockNumber, List[PlanWithId]] | None = None
+        self._plans_lock = threading.Lock()
+
     def is_beneficiary_registered(self, beneficiary_address: ChecksumAddress) -> bool:
         """Confirms whether the beneficiary is registered in a Plan.
 
@@ -174,17 +185,86 @@ class Allocator(AllocatorContract):
             return self._to_plan(untyped_plan)
         raise TypeError(plan_id)
 
-    def get_all_plans(self) -> List[PlanWithId]:
+    def _get_block_number(self, block_number: BlockNumber | None = None) -> BlockNumber:
+        pinned_block_number = get_pinned_block_number(self.skale.web3, block_number)
+        if pinned_block_number is None:
+            return self.skale.web3.eth.block_number
+        return pinned_block_number
+
+    def get_all_plans(self, block_number: BlockNumber | None = None) -> List[PlanWithId]:
+        """
+        Returns all plans at block_number (active block session or the latest block by default).
+        Plans can only be added, so plans loaded at an earlier block are reused
+        and only the new ones are fetched.
+        """
+        block_number = self._get_block_number(block_number)
+        with self._plans_lock:
+            cached = self._plans
+        if cached is not None and cached[0] == block_number:
+            plans = cached[1]
+        else:
+            known = cached[1] if cached is not None and cached[0] < block_number else []
+            plans = known + self._load_plans(len(known) + 1, block_number)
+            with self._plans_lock:
+                if self._plans is None or self._plans[0] < block_number:
+                    self._plans = (block_number, plans)
+        return [PlanWithId({**plan}) for plan in plans]
+
+    def _load_plans(self, first_plan_id: int, block_number: BlockNumber) -> List[PlanWithId]:
+        """
+        Fetches plans starting from first_plan_id until the first missing one.
+        Plans are requested by batches growing exponentially from PLANS_PROBE_SIZE,
+        so the end is found in a logarithmic number of round trips.
+        """
+        plans: List[PlanWithId] = []
+        plan_id, limit = first_plan_id, PLANS_PROBE_SIZE
+        while plan_id < MAX_NUM_OF_PLANS:
+            limit = min(limit, MAX_NUM_OF_PLANS - plan_id)
+            chunk = self._get_plans_range(plan_id, limit, block_number)
+            plans.extend(chunk)
+            if len(chunk) < limit:
+                break
+            plan_id, limit = plan_id + limit, limit * 2
+        return plans
+
+    def _get_plans_range(
+            self,
+            first_plan_id: int,
+            limit: int,
+            block_identifier: BlockIdentifier | None = None
+    ) -> List[PlanWithId]:
+        """Returns existing plans with ids starting from first_plan_id using batched requests"""
+        plan_ids = [PlanId(plan_id) for plan_id in range(first_plan_id, first_plan_id + limit)]
+        raw_plans = batch_call(
+            self.skale.web3,
+            [self.contract.functions.getPlan(plan_id) for plan_id in plan_ids],
+            block_identifier=block_identifier,
+            return_exceptions=True
+        )
         plans = []
-        for i in range(1, MAX_NUM_OF_PLANS):
-            try:
-                plan_id = PlanId(i)
-                plan = PlanWithId({**self.get_plan(plan_id), 'planId': plan_id})
-                plans.append(plan)
-            except (ContractLogicError, ValueError):
+        for plan_id, raw_plan in zip(plan_ids, raw_plans):
+            if isinstance(raw_plan, ContractLogicError):
                 break
+            if isinstance(raw_plan, Exception):
+                raise raw_plan
+            plan = self._to_plan(dict(zip(PLAN_FIELDS, raw_plan)))
+            plans.append(PlanWithId({**plan, 'planId': plan_id}))
         return plans
 
+    def iter_plans(
+            self,
+            page_size: int | None = None,
+            prefetch: bool = True
+    ) -> Iterator[PlanWithId]:
+        """Yields all plans fetched by pages of page_size plans at the same block"""
+        block_number = self._get_block_number()
+        return iter_pages(
+            lambda offset, limit: self._get_plans_range(offset + 1, limit, block_number),
+            total=MAX_NUM_OF_PLANS - 1,
+            page_size=page_size,
+            prefetch=prefetch
+        )
+
     def calculate_vested_amount(self, address: ChecksumAddress) -> Wei:
         return Wei(self.contract.functions.calculateVestedAmount(address).call())
 
@@ -19,13 +19,18 @@
 """ SKALE Allocator Core Escrow methods """
 
 from __future__ import annotations
+import copy
 import functools
-from typing import Any, Callable, TYPE_CHECKING
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, TYPE_CHECKING, cast
 
 from eth_typing import ChecksumAddress
-from web3.contract.contract import ContractFunction
+from web3 import Web3
+from web3.contract.contract import Contract, ContractFunction
 from web3.types import Wei
 
+import skale.config as config
 from skale.contracts.allocator_contract import AllocatorContract
 from skale.contracts.base_contract import transaction_method
 from skale.transactions.result import TxRes
@@ -39,25 +44,57 @@ if TYPE_CHECKING:
 def beneficiary_escrow(transaction: Callable[..., TxRes]) -> Callable[..., TxRes]:
     @functools.wraps(transaction)
     def wrapper(
-            self: AllocatorContract,
+            self: Escrow,
             *args: Any,
             beneficiary_address: ChecksumAddress,
             **kwargs: Any
     ) -> TxRes:
-        self.contract = self.skale.instance.get_contract('Escrow', beneficiary_address)
-        return transaction(self, *args, **kwargs)
+        return transaction(self.for_beneficiary(beneficiary_address), *args, **kwargs)
     return wrapper
 
 
 class Escrow(AllocatorContract):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._escrow_contracts: OrderedDict[ChecksumAddress, Contract] = OrderedDict()
+        self._escrow_contracts_lock = threading.Lock()
+
     @property
-    @functools.lru_cache()
     def allocator(self) -> Allocator:
         return self.skale.allocator
 
     def init_contract(self, *args: Any) -> None:
         self.contract = self.allocator.contract
 
+    def get_escrow_contract(self, beneficiary_address: ChecksumAddress) -> Contract:
+        """Returns Escrow contract of the beneficiary.
+        Contracts are cached, at most ESCROW_CONTRACTS_CACHE_SIZE recently used are kept.
+        """
+        beneficiary_address = Web3.to_checksum_address(beneficiary_address)
+        with self._escrow_contracts_lock:
+            contract = self._escrow_contracts.get(beneficiary_address)
+            if contract is not None:
+                self._escrow_contracts.move_to_end(beneficiary_address)
+                return contract
+        contract = cast(Contract, self.skale.instance.get_contract('Escrow', beneficiary_address))
+        # escrow is not deployed until the beneficiary is connected to a plan
+        if int(contract.address, 16) != 0:
+            with self._escrow_contracts_lock:
+                self._escrow_contracts[beneficiary_address] = contract
+                while len(self._escrow_contracts) > config.ESCROW_CONTRACTS_CACHE_SIZE:
+                    self._escrow_contracts.popitem(last=False)
+        return contract
+
+    def for_beneficiary(self, beneficiary_address: ChecksumAddress) -> Escrow:
+        """Returns a shallow copy of the wrapper bound to the Escrow contract of the beneficiary.
+        The shared wrapper is not modified, so copies for different beneficiaries
+        can be used from several threads. Copies share the escrow contracts cache
+        and its lock with the original wrapper.
+        """
+        escrow = copy.copy(self)
+        escrow.contract = self.get_escrow_contract(beneficiary_address)
+        return escrow
+
     @beneficiary_escrow
     @transaction_method
     def retrieve(self) -> ContractFunction:
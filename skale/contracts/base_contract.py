@@ -18,36 +18,43 @@
 #   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
 """ SKALE base contract class """
 from __future__ import annotations
+import asyncio
 import logging
 from functools import wraps
-from typing import Any, Callable, TYPE_CHECKING, Generic, TypeVar
+from typing import Any, Awaitable, Callable, Coroutine, Generic, TypeVar, cast
 
 from eth_typing import ChecksumAddress
 from web3 import Web3
+from web3.contract.async_contract import AsyncContractFunction
 from web3.contract.contract import ContractFunction
 from web3.types import ABI, Nonce, Wei
 
 import skale.config as config
+from skale.transactions.nonce_manager import async_reserve_nonce, reserve_nonce
 from skale.transactions.result import TxRes, TxStatus
-from skale.transactions.tools import make_dry_run_call, transaction_from_method
+from skale.transactions.tools import (
+    async_make_dry_run_call,
+    async_transaction_from_method,
+    make_dry_run_call,
+    resolve_fees,
+    transaction_from_method
+)
 from skale.utils.web3_utils import (
     DEFAULT_BLOCKS_TO_WAIT,
-    get_eth_nonce,
     MAX_WAITING_TIME,
+    suspend_block_session,
     wait_for_confirmation_blocks
 )
 
-from skale.skale_base import SkaleBase
+from skale.skale_base import AsyncSkaleBase, SkaleBase
 from skale.utils.helper import to_camel_case
 
-if TYPE_CHECKING:
-    pass
-
 
 logger = logging.getLogger(__name__)
 
 
 SkaleType = TypeVar('SkaleType', bound=SkaleBase)
+AsyncSkaleType = TypeVar('AsyncSkaleType', bound=AsyncSkaleBase)
 
 
 class BaseContract(Generic[SkaleType]):
@@ -66,19 +73,70 @@ class BaseContract(Generic[SkaleType]):
     def init_contract(self, skale: SkaleBase, address: ChecksumAddress, abi: ABI) -> None:
         self.contract = skale.web3.eth.contract(address=address, abi=abi)
 
-    def __getattr__(self, attr: str) -> Callable[..., Any]:
+    def __getattr__(self, attr: str) -> ContractFallback:
         """Fallback for contract calls"""
+        # special methods are looked up by copy and pickle protocols
+        if attr.startswith('__'):
+            raise AttributeError(attr)
         logger.debug("Calling contract function: %s", attr)
+        return ContractFallback(self, attr)
+
+
+class ContractFallback:
+    """
+    Contract function called by its snake case or original name.
+    It can be passed to skale.batch().call() to defer the read until the batch execution.
+    """
+
+    def __init__(self, base_contract: BaseContract[Any], attr: str) -> None:
+        self.base_contract = base_contract
+        self.attr = attr
+
+    def function(self, *args: Any, **kw: Any) -> ContractFunction:
+        functions = self.base_contract.contract.functions
+        camel_case_fn_name = to_camel_case(self.attr)
+        if hasattr(functions, camel_case_fn_name):
+            return cast(ContractFunction, getattr(functions, camel_case_fn_name)(*args, **kw))
+        if hasattr(functions, self.attr):
+            return cast(ContractFunction, getattr(functions, self.attr)(*args, **kw))
+        raise AttributeError(self.attr)
+
+    def __call__(self, *args: Any, **kw: Any) -> Any:
+        logger.debug('called with %r and %r' % (args, kw))
+        return self.function(*args, **kw).call()
+
 
-        def wrapper(*args: Any, **kw: Any) -> Any:
+class AsyncBaseContract(Generic[AsyncSkaleType]):
+    """Contract wrapper that makes calls using AsyncWeb3 client of the AsyncSkaleBase"""
+
+    def __init__(
+            self,
+            skale: AsyncSkaleType,
+            name: str,
+            address: ChecksumAddress | str | bytes,
+            abi: ABI
+    ):
+        self.skale = skale
+        self.name = name
+        self.address = Web3.to_checksum_address(address)
+        self.init_contract(skale, self.address, abi)
+
+    def init_contract(self, skale: AsyncSkaleBase, address: ChecksumAddress, abi: ABI) -> None:
+        self.contract = skale.async_web3.eth.contract(address=address, abi=abi)
+
+    def __getattr__(self, attr: str) -> Callable[..., Awaitable[Any]]:
+        """Fallback for contract calls"""
+        logger.debug("Calling contract function: %s", attr)
+
+        async def wrapper(*args: Any, **kw: Any) -> Any:
             logger.debug('called with %r and %r' % (args, kw))
             camel_case_fn_name = to_camel_case(attr)
             if hasattr(self.contract.functions, camel_case_fn_name):
-                return getattr(self.contract.functions,
-                               camel_case_fn_name)(*args, **kw).call()
+                return await getattr(self.contract.functions,
+                                     camel_case_fn_name)(*args, **kw).call()
             if hasattr(self.contract.functions, attr):
-                return getattr(self.contract.functions,
-                               attr)(*args, **kw).call()
+                return await getattr(self.contract.functions,
+                                     attr)(*args, **kw).call()
             raise AttributeError(attr)
         return wrapper
 
@@ -107,47 +165,152 @@ def transaction_method(transaction: Callable[..., ContractFunction]) -> Callable
     ) -> TxRes:
         method = transaction(self, *args, **kwargs)
 
-        nonce = get_eth_nonce(self.skale.web3, self.skale.wallet.address)
-
-        call_result, tx_hash, receipt = None, None, None
-        should_dry_run = not skip_dry_run and not config.DISABLE_DRY_RUN
-
-        dry_run_success = False
-        if should_dry_run:
-            call_result = make_dry_run_call(self.skale, method, gas_limit, value)
-            if call_result.status == TxStatus.SUCCESS:
-                gas_limit = gas_limit or int(call_result.data['gas'])
-                dry_run_success = True
-
-        should_send = not dry_run_only and \
-            (not should_dry_run or dry_run_success)
-
-        if should_send:
-            gas_limit = gas_limit or config.DEFAULT_GAS_LIMIT
-            gas_price = gas_price or config.DEFAULT_GAS_PRICE_WEI or self.skale.gas_price
-            tx = transaction_from_method(
-                method=method,
-                gas_limit=gas_limit,
-                gas_price=gas_price,
-                max_fee_per_gas=max_fee_per_gas,
-                max_priority_fee_per_gas=max_priority_fee_per_gas,
-                nonce=nonce,
-                value=value
-            )
-            method_name = f'{self.name}.{method.abi.get("name")}'
-            tx_hash = self.skale.wallet.sign_and_send(
-                tx,
-                multiplier=multiplier,
-                priority=priority,
-                method=method_name
-            )
-
-        if tx_hash is not None and wait_for:
-            receipt = self.skale.wallet.wait(tx_hash)
-
-        should_confirm = receipt is not None and confirmation_blocks > 0
-        if should_confirm:
-            wait_for_confirmation_blocks(self.skale.web3, confirmation_blocks)
+        with suspend_block_session(self.skale.web3):
+            call_result, tx_hash, receipt = None, None, None
+            should_dry_run = not skip_dry_run and not config.DISABLE_DRY_RUN
+
+            dry_run_success = False
+            if should_dry_run:
+                call_result = make_dry_run_call(self.skale, method, gas_limit, value)
+                if call_result.status == TxStatus.SUCCESS:
+                    gas_limit = gas_limit or int(call_result.data['gas'])
+                    dry_run_success = True
+
+            should_send = not dry_run_only and \
+                (not should_dry_run or dry_run_success)
+
+            if should_send:
+                gas_limit = gas_limit or config.DEFAULT_GAS_LIMIT
+                fees = resolve_fees(
+                    self.skale,
+                    call_result,
+                    gas_price=gas_price,
+                    max_fee_per_gas=max_fee_per_gas,
+                    max_priority_fee_per_gas=max_priority_fee_per_gas
+                )
+                method_name = f'{self.name}.{method.abi.get("name")}'
+                with reserve_nonce(
+                    self.skale.web3,
+                    self.skale.tx_nonce_manager,
+                    self.skale.wallet.address,
+                    nonce
+                ) as tx_nonce:
+                    tx = transaction_from_method(
+                        method=method,
+                        gas_limit=gas_limit,
+                        nonce=tx_nonce,
+                        value=value,
+                        **fees.as_kwargs()
+                    )
+                    tx_hash = self.skale.wallet.sign_and_send(
+                        tx,
+                        multiplier=multiplier,
+                        priority=priority,
+                        method=method_name
+                    )
+
+            if tx_hash is not None and wait_for:
+                receipt = self.skale.wallet.wait(tx_hash)
+
+            should_confirm = receipt is not None and confirmation_blocks > 0
+            if should_confirm:
+                wait_for_confirmation_blocks(self.skale.web3, confirmation_blocks)
+
+        tx_res = TxRes(call_result, tx_hash, receipt)
+
+        if raise_for_status:
+            tx_res.raise_for_status()
+        return tx_res
+
+    return wrapper
+
+
+def async_transaction_method(
+        transaction: Callable[..., AsyncContractFunction]
+) -> Callable[..., Coroutine[Any, Any, TxRes]]:
+    """
+    Async version of transaction_method.
+    Wallets are synchronous, so signing, sending and waiting are run in a thread.
+    """
+    @wraps(transaction)
+    async def wrapper(
+        self: AsyncBaseContract[AsyncSkaleType],
+        *args: Any,
+        wait_for: bool = True,
+        blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
+        timeout: int = MAX_WAITING_TIME,
+        gas_limit: int | None = None,
+        gas_price: int | None = None,
+        nonce: Nonce | None = None,
+        max_fee_per_gas: int | None = None,
+        max_priority_fee_per_gas: int | None = None,
+        value: Wei = Wei(0),
+        dry_run_only: bool = False,
+        skip_dry_run: bool = False,
+        raise_for_status: bool = True,
+        multiplier: float | None = None,
+        priority: int | None = None,
+        confirmation_blocks: int = 0,
+        **kwargs: Any
+    ) -> TxRes:
+        method = transaction(self, *args, **kwargs)
+
+        with suspend_block_session(self.skale.web3):
+            call_result, tx_hash, receipt = None, None, None
+            should_dry_run = not skip_dry_run and not config.DISABLE_DRY_RUN
+
+            dry_run_success = False
+            if should_dry_run:
+                call_result = await async_make_dry_run_call(self.skale, method, gas_limit, value)
+                if call_result.status == TxStatus.SUCCESS:
+                    gas_limit = gas_limit or int(call_result.data['gas'])
+                    dry_run_success = True
+
+            should_send = not dry_run_only and \
+                (not should_dry_run or dry_run_success)
+
+            if should_send:
+                gas_limit = gas_limit or config.DEFAULT_GAS_LIMIT
+                fees = await asyncio.to_thread(
+                    resolve_fees,
+                    self.skale,
+                    call_result,
+                    gas_price=gas_price,
+                    max_fee_per_gas=max_fee_per_gas,
+                    max_priority_fee_per_gas=max_priority_fee_per_gas
+                )
+                method_name = f'{self.name}.{method.abi.get("name")}'
+                async with async_reserve_nonce(
+                    self.skale.async_web3,
+                    self.skale.tx_nonce_manager,
+                    self.skale.wallet.address,
+                    nonce
+                ) as tx_nonce:
+                    tx = await async_transaction_from_method(
+                        method=method,
+                        gas_limit=gas_limit,
+                        nonce=tx_nonce,
+                        value=value,
+                        **fees.as_kwargs()
+                    )
+                    tx_hash = await asyncio.to_thread(
+                        self.skale.wallet.sign_and_send,
+                        tx,
+                        multiplier=multiplier,
+                        priority=priority,
+                        method=method_name
+                    )
+
+            if tx_hash is not None and wait_for:
+                receipt = await asyncio.to_thread(self.skale.wallet.wait, tx_hash)
+
+            should_confirm = receipt is not None and confirmation_blocks > 0
+            if should_confirm:
+                await asyncio.to_thread(
+                    wait_for_confirmation_blocks,
+                    self.skale.web3,
+                    confirmation_blocks
+                )
 
         tx_res = TxRes(call_result, tx_hash, receipt)
 
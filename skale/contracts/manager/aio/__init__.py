@@ -0,0 +1,14 @@
+# flake8: noqa
+
+from skale.contracts.skale_manager_contract import AsyncSkaleManagerContract
+
+from skale.contracts.manager.aio.nodes import AsyncNodes
+from skale.contracts.manager.aio.schains import AsyncSChains
+from skale.contracts.manager.aio.schains_internal import AsyncSChainsInternal
+
+__all__ = [
+    'AsyncNodes',
+    'AsyncSChains',
+    'AsyncSChainsInternal',
+    'AsyncSkaleManagerContract'
+]
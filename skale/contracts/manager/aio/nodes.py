@@ -0,0 +1,140 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE.py
+#
+#   Copyright (C) 2019-Present SKALE Labs
+#
+#   SKALE.py is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   SKALE.py is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
+""" Async Nodes.sol functions """
+
+import asyncio
+import socket
+from typing import Any, List, Sequence, Tuple, cast
+
+from web3.contract.async_contract import AsyncContractFunction
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
+from skale.contracts.base_contract import async_transaction_method
+from skale.contracts.manager.nodes import FIELDS, Nodes
+from skale.contracts.skale_manager_contract import AsyncSkaleManagerContract
+from skale.types.node import Node, NodeId, NodeStatus
+from skale.utils.exceptions import InvalidNodeIdError
+
+
+class AsyncNodes(AsyncSkaleManagerContract):
+    """Async wrapper for some of the Nodes.sol functions"""
+
+    async def __get_raw(self, node_id: NodeId) -> List[Any]:
+        try:
+            return list(await self.contract.functions.nodes(node_id).call())
+        except (ContractLogicError, ValueError, BadFunctionCallOutput):
+            raise InvalidNodeIdError(node_id)
+
+    async def get(self, node_id: NodeId) -> Node:
+        raw_node, public_key, domain_name = await asyncio.gather(
+            self.__get_raw(node_id),
+            self.get_node_public_key(node_id),
+            self.get_domain_name(node_id)
+        )
+        return Nodes._to_node(dict(zip(FIELDS, [*raw_node, public_key, domain_name])))
+
+    async def get_many(self, node_ids: Sequence[NodeId]) -> List[Node]:
+        return list(await asyncio.gather(*(self.get(node_id) for node_id in node_ids)))
+
+    async def get_by_name(self, name: str) -> Node:
+        return await self.get(await self.node_name_to_index(name))
+
+    async def get_nodes_number(self) -> int:
+        return int(await self.contract.functions.getNumberOfNodes().call())
+
+    async def get_active_node_ids(self) -> List[NodeId]:
+        node_ids = [NodeId(node_id) for node_id in range(0, await self.get_nodes_number())]
+        statuses = await asyncio.gather(*(self.get_node_status(node_id) for node_id in node_ids))
+        return [
+            node_id
+            for node_id, status in zip(node_ids, statuses)
+            if status == NodeStatus.ACTIVE
+        ]
+
+    async def get_active_node_ips(self) -> List[bytes]:
+        active_node_ids = await self.get_active_node_ids()
+        raw_nodes = await asyncio.gather(*(self.__get_raw(node_id) for node_id in active_node_ids))
+        return [bytes(raw_node[FIELDS.index('ip')]) for raw_node in raw_nodes]
+
+    def name_to_id(self, name: str) -> bytes:
+        return Nodes.name_to_id(name)
+
+    async def is_node_name_available(self, name: str) -> bool:
+        node_id = self.name_to_id(name)
+        return not await self.contract.functions.nodesNameCheck(node_id).call()
+
+    async def is_node_ip_available(self, ip: str) -> bool:
+        ip_bytes = socket.inet_aton(ip)
+        return not await self.contract.functions.nodesIPCheck(ip_bytes).call()
+
+    async def node_name_to_index(self, name: str) -> NodeId:
+        name_hash = self.name_to_id(name)
+        return NodeId(await self.contract.functions.nodesNameToIndex(name_hash).call())
+
+    async def get_node_status(self, node_id: NodeId) -> NodeStatus:
+        try:
+            return NodeStatus(await self.contract.functions.getNodeStatus(node_id).call())
+        except (ContractLogicError, ValueError, BadFunctionCallOutput):
+            raise InvalidNodeIdError(node_id)
+
+    async def get_node_finish_time(self, node_id: NodeId) -> int:
+        try:
+            return int(await self.contract.functions.getNodeFinishTime(node_id).call())
+        except (ContractLogicError, ValueError, BadFunctionCallOutput):
+            raise InvalidNodeIdError(node_id)
+
+    async def get_node_public_key(self, node_id: NodeId) -> str:
+        try:
+            raw_key = cast(
+                Tuple[bytes, bytes],
+                await self.contract.functions.getNodePublicKey(node_id).call()
+            )
+        except (ContractLogicError, ValueError, BadFunctionCallOutput):
+            raise InvalidNodeIdError(node_id)
+        return self.skale.async_web3.to_hex(raw_key[0] + raw_key[1])
+
+    async def get_validator_node_indices(self, validator_id: int) -> list[NodeId]:
+        return [
+            NodeId(id)
+            for id
+            in await self.contract.functions.getValidatorNodeIndexes(validator_id).call()
+        ]
+
+    async def get_domain_name(self, node_id: NodeId) -> str:
+        return str(await self.contract.functions.getNodeDomainName(node_id).call())
+
+    @async_transaction_method
+    def set_node_in_maintenance(self, node_id: NodeId) -> AsyncContractFunction:
+        return self.contract.functions.setNodeInMaintenance(node_id)
+
+    @async_transaction_method
+    def remove_node_from_in_maintenance(self, node_id: NodeId) -> AsyncContractFunction:
+        return self.contract.functions.removeNodeFromInMaintenance(node_id)
+
+    @async_transaction_method
+    def set_domain_name(self, node_id: NodeId, domain_name: str) -> AsyncContractFunction:
+        return self.contract.functions.setDomainName(node_id, domain_name)
+
+    @async_transaction_method
+    def init_exit(self, node_id: NodeId) -> AsyncContractFunction:
+        return self.contract.functions.initExit(node_id)
+
+    @async_transaction_method
+    def change_ip(self, node_id: NodeId, ip: bytes, public_ip: bytes) -> AsyncContractFunction:
+        return self.contract.functions.changeIP(node_id, ip, public_ip)
@@ -0,0 +1,130 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE.py
+#
+#   Copyright (C) 2019-Present SKALE Labs
+#
+#   SKALE.py is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   SKALE.py is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
+""" Async Schains.sol functions """
+
+import asyncio
+from dataclasses import asdict
+from typing import List
+
+from eth_typing import ChecksumAddress
+from web3.contract.async_contract import AsyncContractFunction
+from web3.types import Wei
+
+from skale.contracts.base_contract import async_transaction_method
+from skale.contracts.manager.schains import SChains
+from skale.contracts.skale_manager_contract import AsyncSkaleManagerContract
+from skale.dataclasses.schain_options import (
+    SchainOptions, get_default_schain_options, parse_schain_options
+)
+from skale.types.node import NodeId
+from skale.types.schain import (
+    Schain, SchainHash, SchainName, SchainStructure, SchainStructureWithStatus
+)
+
+
+class AsyncSChains(AsyncSkaleManagerContract):
+    """Async wrapper for some of the Schains.sol functions"""
+
+    async def get(self, id_: SchainHash) -> SchainStructure:
+        schains_internal = self.skale.schains_internal
+        raw_schain, raw_options = await asyncio.gather(
+            schains_internal.contract.functions.schains(id_).call(),
+            self.contract.functions.getOptions(id_).call()
+        )
+        res = Schain(*raw_schain)
+        options = parse_schain_options(raw_options=list(raw_options))
+        return SchainStructure(**asdict(res), chainId=self.name_to_id(res.name), options=options)
+
+    async def get_many(self, ids: List[SchainHash]) -> List[SchainStructure]:
+        return list(await asyncio.gather(*(self.get(id_) for id_ in ids)))
+
+    async def get_by_name(self, name: SchainName) -> SchainStructure:
+        return await self.get(self.name_to_id(name))
+
+    async def get_schains_for_owner(self, account: ChecksumAddress) -> List[SchainStructure]:
+        schains_internal = self.skale.schains_internal
+        list_size = await schains_internal.get_schain_list_size(account)
+        ids = await asyncio.gather(*(
+            schains_internal.get_schain_id_by_index_for_owner(account, i)
+            for i in range(0, list_size)
+        ))
+        return await self.get_many(list(ids))
+
+    async def get_schains_for_node(self, node_id: NodeId) -> List[SchainStructureWithStatus]:
+        schain_ids = await self.skale.schains_internal.get_schain_ids_for_node(node_id)
+        return [
+            SchainStructureWithStatus(**asdict(schain), active=self.schain_active(schain))
+            for schain in await self.get_many(schain_ids)
+        ]
+
+    async def get_active_schains_for_node(
+            self,
+            node_id: NodeId
+    ) -> List[SchainStructureWithStatus]:
+        schain_ids = await self.skale.schains_internal.get_active_schain_ids_for_node(node_id)
+        return [
+            SchainStructureWithStatus(**asdict(schain), active=True)
+            for schain in await self.get_many(schain_ids)
+        ]
+
+    def name_to_id(self, name: SchainName) -> SchainHash:
+        return SChains.name_to_id(name)
+
+    def schain_active(self, schain: SchainStructure) -> bool:
+        return SChains.schain_active(schain)
+
+    async def get_schain_price(self, index_of_type: int, lifetime: int) -> Wei:
+        return Wei(
+            await self.contract.functions.getSchainPrice(index_of_type, lifetime).call()
+        )
+
+    async def get_options(self, schain_id: SchainHash) -> SchainOptions:
+        raw_options = await self.contract.functions.getOptions(schain_id).call()
+        return parse_schain_options(raw_options=list(raw_options))
+
+    async def get_options_by_name(self, name: SchainName) -> SchainOptions:
+        return await self.get_options(self.name_to_id(name))
+
+    @async_transaction_method
+    def add_schain_by_foundation(
+        self,
+        lifetime: int,
+        type_of_nodes: int,
+        nonce: int,
+        name: SchainName,
+        options: SchainOptions | None = None,
+        schain_owner: ChecksumAddress | None = None,
+        schain_originator: ChecksumAddress | None = None
+    ) -> AsyncContractFunction:
+        if schain_owner is None:
+            schain_owner = self.skale.wallet.address
+        if schain_originator is None:
+            schain_originator = self.skale.wallet.address
+        if not options:
+            options = get_default_schain_options()
+
+        return self.contract.functions.addSchainByFoundation(
+            lifetime,
+            type_of_nodes,
+            nonce,
+            name,
+            schain_owner,
+            schain_originator,
+            options.to_tuples()
+        )
@@ -0,0 +1,101 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE.py
+#
+#   Copyright (C) 2019-Present SKALE Labs
+#
+#   SKALE.py is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   SKALE.py is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
+""" Async SchainsInternal.sol functions """
+
+from typing import List
+
+from eth_typing import ChecksumAddress
+from web3.contract.async_contract import AsyncContractFunction
+
+from skale.contracts.base_contract import async_transaction_method
+from skale.contracts.manager.schains import SChains
+from skale.contracts.skale_manager_contract import AsyncSkaleManagerContract
+from skale.types.node import NodeId
+from skale.types.schain import Schain, SchainHash, SchainName
+
+
+class AsyncSChainsInternal(AsyncSkaleManagerContract):
+    """Async wrapper for some of the SchainsInternal.sol functions"""
+
+    async def get_raw(self, name: SchainHash) -> Schain:
+        return Schain(*await self.contract.functions.schains(name).call())
+
+    async def get_all_schains_ids(self) -> List[SchainHash]:
+        return [
+            SchainHash(schain_hash)
+            for schain_hash
+            in await self.contract.functions.getSchains().call()
+        ]
+
+    async def get_schains_number(self) -> int:
+        return int(await self.contract.functions.numberOfSchains().call())
+
+    async def get_schain_list_size(self, account: ChecksumAddress) -> int:
+        return int(await self.contract.functions.getSchainListSize(account).call(
+            {'from': account}))
+
+    async def get_schain_id_by_index_for_owner(
+            self,
+            account: ChecksumAddress,
+            index: int
+    ) -> SchainHash:
+        return SchainHash(await self.contract.functions.schainIndexes(account, index).call())
+
+    async def get_node_ids_for_schain(self, name: SchainName) -> List[NodeId]:
+        id_ = SChains.name_to_id(name)
+        return [
+            NodeId(node)
+            for node
+            in await self.contract.functions.getNodesInGroup(id_).call()
+        ]
+
+    async def get_schain_ids_for_node(self, node_id: NodeId) -> List[SchainHash]:
+        return [
+            SchainHash(schain)
+            for schain
+            in await self.contract.functions.getSchainHashesForNode(node_id).call()
+        ]
+
+    async def is_schain_exist(self, name: SchainName) -> bool:
+        id_ = SChains.name_to_id(name)
+        return bool(await self.contract.functions.isSchainExist(id_).call())
+
+    async def get_active_schain_ids_for_node(self, node_id: NodeId) -> List[SchainHash]:
+        return [
+            SchainHash(schain)
+            for schain
+            in await self.contract.functions.getActiveSchains(node_id).call()
+        ]
+
+    async def number_of_schain_types(self) -> int:
+        return int(await self.contract.functions.numberOfSchainTypes().call())
+
+    async def current_generation(self) -> int:
+        return int(await self.contract.functions.currentGeneration().call())
+
+    @async_transaction_method
+    def add_schain_type(
+        self, part_of_node: int, number_of_nodes: int
+    ) -> AsyncContractFunction:
+        return self.contract.functions.addSchainType(
+            part_of_node, number_of_nodes)
+
+    @async_transaction_method
+    def new_generation(self) -> AsyncContractFunction:
+        return self.contract.functions.newGeneration()
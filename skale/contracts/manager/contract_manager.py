@@ -18,12 +18,11 @@
 #   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
 """ SKALE Contract manager class """
 
-from Crypto.Hash import keccak
 from eth_typing import ChecksumAddress
 from web3 import Web3
 
 from skale.contracts.skale_manager_contract import SkaleManagerContract
-from skale.utils.helper import add_0x_prefix
+from skale.utils.helper import add_0x_prefix, name_to_id
 
 
 class ContractManager(SkaleManagerContract):
@@ -32,5 +31,4 @@ class ContractManager(SkaleManagerContract):
         return Web3.to_checksum_address(self.contract.functions.contracts(contract_hash).call())
 
     def get_contract_hash_by_name(self, name: str) -> str:
-        keccak_hash = keccak.new(data=name.encode("utf8"), digest_bits=256)
-        return keccak_hash.hexdigest()
+        return name_to_id(name).hex()
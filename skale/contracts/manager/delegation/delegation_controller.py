@@ -17,7 +17,10 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any, Dict, List
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Sequence
 
 from eth_typing import ChecksumAddress
 from web3.contract.contract import ContractFunction
@@ -27,6 +30,7 @@ from skale.contracts.base_contract import transaction_method
 from skale.contracts.skale_manager_contract import SkaleManagerContract
 from skale.types.delegation import Delegation, DelegationId, DelegationStatus, FullDelegation
 from skale.types.validator import ValidatorId
+from skale.utils.batch_utils import batch_call, iter_pages
 from skale.utils.helper import format_fields
 
 
@@ -82,20 +86,22 @@ class DelegationController(SkaleManagerContract):
     def _get_delegation_ids_by_validator(self, validator_id: ValidatorId) -> List[DelegationId]:
         delegation_ids_len = self._get_delegation_ids_len_by_validator(
             validator_id)
-        return [
-            DelegationId(
-                self.contract.functions.delegationsByValidator(validator_id, _id).call()
-            )
+        return self._get_delegation_ids([
+            self.contract.functions.delegationsByValidator(validator_id, _id)
             for _id in range(delegation_ids_len)
-        ]
+        ])
 
     def _get_delegation_ids_by_holder(self, address: ChecksumAddress) -> List[DelegationId]:
         delegation_ids_len = self._get_delegation_ids_len_by_holder(address)
-        return [
-            DelegationId(
-                self.contract.functions.delegationsByHolder(address, _id).call()
-            )
+        return self._get_delegation_ids([
+            self.contract.functions.delegationsByHolder(address, _id)
             for _id in range(delegation_ids_len)
+        ])
+
+    def _get_delegation_ids(self, functions: Sequence[ContractFunction]) -> List[DelegationId]:
+        return [
+            DelegationId(delegation_id)
+            for delegation_id in batch_call(self.skale.web3, functions)
         ]
 
     def _get_delegation_ids_len_by_validator(self, validator_id: ValidatorId) -> int:
@@ -113,16 +119,30 @@ class DelegationController(SkaleManagerContract):
 
     def get_all_delegations(self, delegation_ids: List[DelegationId]) -> List[FullDelegation]:
         """Returns list of formatted delegations with particular status.
+        Delegations and their states are fetched using batched requests.
 
         :param delegation_ids: List of delegation IDs
         :type address: list
         :returns: List of formatted delegations
         :rtype: list
         """
-        return [
-            self.skale.delegation_controller.get_delegation_full(_id)
-            for _id in delegation_ids
-        ]
+        functions = []
+        for delegation_id in delegation_ids:
+            functions.extend([
+                self.contract.functions.getDelegation(delegation_id),
+                self.contract.functions.getState(delegation_id)
+            ])
+        results = batch_call(self.skale.web3, functions)
+        delegations = []
+        for index, delegation_id in enumerate(delegation_ids):
+            raw_delegation, state = results[index * 2:index * 2 + 2]
+            delegation = self._to_delegation(dict(zip(FIELDS, raw_delegation)))
+            delegations.append(FullDelegation({
+                'id': delegation_id,
+                'status': DelegationStatus(state),
+                **delegation
+            }))
+        return delegations
 
     def get_all_delegations_by_holder(self, address: ChecksumAddress) -> List[FullDelegation]:
         """Returns list of formatted delegations for token holder.
@@ -146,6 +166,45 @@ class DelegationController(SkaleManagerContract):
         delegation_ids = self._get_delegation_ids_by_validator(validator_id)
         return self.get_all_delegations(delegation_ids)
 
+    def iter_delegations(
+            self,
+            address: ChecksumAddress | None = None,
+            validator_id: ValidatorId | None = None,
+            page_size: int | None = None,
+            prefetch: bool = True
+    ) -> Iterator[FullDelegation]:
+        """Yields delegations of the token holder or the validator
+        fetched by pages of page_size delegations.
+
+        :param address: Token holder address
+        :type address: str
+        :param validator_id: ID of the validator
+        :type validator_id: int
+        :returns: Iterator over formatted delegations
+        :rtype: iterator
+        """
+        get_delegation_id: Callable[[int], ContractFunction]
+        if address is not None and validator_id is None:
+            total = self._get_delegation_ids_len_by_holder(address)
+            get_delegation_id = partial(self.contract.functions.delegationsByHolder, address)
+        elif validator_id is not None and address is None:
+            total = self._get_delegation_ids_len_by_validator(validator_id)
+            get_delegation_id = partial(
+                self.contract.functions.delegationsByValidator,
+                validator_id
+            )
+        else:
+            raise ValueError('Either token holder address or validator id should be provided')
+
+        def fetch_page(offset: int, limit: int) -> List[FullDelegation]:
+            delegation_ids = self._get_delegation_ids([
+                get_delegation_id(index)
+                for index in range(offset, offset + limit)
+            ])
+            return self.get_all_delegations(delegation_ids)
+
+        return iter_pages(fetch_page, total=total, page_size=page_size, prefetch=prefetch)
+
     @transaction_method
     def delegate(
             self,
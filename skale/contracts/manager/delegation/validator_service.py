@@ -17,15 +17,18 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import Any, Dict, List
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Sequence
 from eth_typing import ChecksumAddress
 from web3 import Web3
 from web3.contract.contract import ContractFunction
-from web3.types import Wei
+from web3.types import BlockIdentifier, Wei
 
 from skale.contracts.base_contract import transaction_method
 from skale.contracts.skale_manager_contract import SkaleManagerContract
-from skale.types.validator import Validator, ValidatorId, ValidatorWithId
+from skale.types.validator import Validator, ValidatorId, ValidatorSnapshot, ValidatorWithId
+from skale.utils.batch_utils import batch_call, iter_pages
 from skale.utils.helper import format_fields
 
 
@@ -78,6 +81,75 @@ class ValidatorService(SkaleManagerContract):
         validator = self.get(_id)
         return ValidatorWithId({'id': _id, **validator})
 
+    def get_many(
+            self,
+            ids: Sequence[ValidatorId],
+            block_identifier: BlockIdentifier | None = None
+    ) -> List[ValidatorWithId]:
+        """Returns validators with provided ids using batched requests.
+
+        :returns: List of validators
+        :rtype: list
+        """
+        functions = []
+        for _id in ids:
+            functions.extend([
+                self.contract.functions.validators(_id),
+                self.contract.functions.isAuthorizedValidator(_id)
+            ])
+        results = batch_call(self.skale.web3, functions, block_identifier=block_identifier)
+        return [
+            self._to_validator_with_id(_id, *results[index * 2:index * 2 + 2])
+            for index, _id in enumerate(ids)
+        ]
+
+    def get_snapshot(
+            self,
+            trusted_only: bool = False,
+            block_identifier: BlockIdentifier | None = None
+    ) -> List[ValidatorSnapshot]:
+        """Returns registered validators with linked node addresses and bond amounts.
+        All fields are read with two batches of requests,
+        block_identifier should be provided to read them at the same block.
+
+        :returns: List of validators
+        :rtype: list
+        """
+        number_of_validators, trusted_ids = batch_call(
+            self.skale.web3,
+            [
+                self.contract.functions.numberOfValidators(),
+                self.contract.functions.getTrustedValidators()
+            ],
+            block_identifier=block_identifier
+        )
+        ids = [ValidatorId(val_id) for val_id in trusted_ids] if trusted_only else [
+            ValidatorId(val_id)
+            for val_id in range(1, number_of_validators + 1)
+        ]
+        functions = []
+        for _id in ids:
+            functions.extend([
+                self.contract.functions.validators(_id),
+                self.contract.functions.isAuthorizedValidator(_id),
+                self.contract.functions.getNodeAddresses(_id),
+                self.contract.functions.getAndUpdateBondAmount(_id)
+            ])
+        results = batch_call(self.skale.web3, functions, block_identifier=block_identifier)
+        snapshot = []
+        for index, _id in enumerate(ids):
+            raw_validator, trusted, linked_addresses, bond_amount = \
+                results[index * 4:index * 4 + 4]
+            snapshot.append(ValidatorSnapshot({
+                **self._to_validator_with_id(_id, raw_validator, trusted),
+                'linked_addresses': [
+                    Web3.to_checksum_address(address)
+                    for address in linked_addresses
+                ],
+                'bond_amount': Wei(bond_amount)
+            }))
+        return snapshot
+
     def number_of_validators(self) -> int:
         """Returns number of registered validators.
 
@@ -87,20 +159,39 @@ class ValidatorService(SkaleManagerContract):
         return int(self.contract.functions.numberOfValidators().call())
 
     def ls(self, trusted_only: bool = False) -> List[ValidatorWithId]:
-        """Returns list of registered validators.
+        """Returns list of registered validators using batched requests.
 
         :returns: List of validators
         :rtype: list
         """
-        number_of_validators = self.number_of_validators()
-        validators = [
-            self.get_with_id(val_id)
-            for val_id in self.get_trusted_validator_ids()
-        ] if trusted_only else [
-            self.get_with_id(ValidatorId(val_id))
-            for val_id in range(1, number_of_validators + 1)
+        return self.get_many(self._get_validator_ids(trusted_only))
+
+    def _get_validator_ids(self, trusted_only: bool = False) -> List[ValidatorId]:
+        if trusted_only:
+            return self.get_trusted_validator_ids()
+        return [
+            ValidatorId(val_id)
+            for val_id in range(1, self.number_of_validators() + 1)
         ]
-        return validators
+
+    def iter_validators(
+            self,
+            trusted_only: bool = False,
+            page_size: int | None = None,
+            prefetch: bool = True
+    ) -> Iterator[ValidatorWithId]:
+        """Yields registered validators fetched by pages of page_size validators.
+
+        :returns: Iterator over validators
+        :rtype: iterator
+        """
+        ids = self._get_validator_ids(trusted_only)
+        return iter_pages(
+            lambda offset, limit: self.get_many(ids[offset:offset + limit]),
+            total=len(ids),
+            page_size=page_size,
+            prefetch=prefetch
+        )
 
     def get_linked_addresses_by_validator_address(
             self,
@@ -340,6 +431,15 @@ class ValidatorService(SkaleManagerContract):
     def has_role(self, role: bytes, address: ChecksumAddress) -> bool:
         return bool(self.contract.functions.hasRole(role, address).call())
 
+    def _to_validator_with_id(
+            self,
+            _id: ValidatorId,
+            raw_validator: Sequence[Any],
+            trusted: bool
+    ) -> ValidatorWithId:
+        validator = self._to_validator(dict(zip(FIELDS, [*raw_validator, trusted])))
+        return ValidatorWithId({'id': _id, **validator})
+
     def _to_validator(self, untyped_validator: Dict[str, Any]) -> Validator:
         return Validator({
             'name': str(untyped_validator['name']),
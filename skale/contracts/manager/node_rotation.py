@@ -21,18 +21,23 @@
 from __future__ import annotations
 import logging
 import functools
-from typing import TYPE_CHECKING, List
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
 
-from eth_typing import ChecksumAddress
+from eth_typing import BlockNumber, ChecksumAddress
 
 from skale.contracts.base_contract import transaction_method
 from web3.contract.contract import ContractFunction
 from web3.exceptions import ContractLogicError
+from web3.types import BlockIdentifier
 
 from skale.contracts.skale_manager_contract import SkaleManagerContract
 from skale.types.node import NodeId
 from skale.types.rotation import Rotation, RotationSwap
 from skale.types.schain import SchainHash, SchainName
+from skale.utils.batch_utils import batch_call
+from skale.utils.web3_utils import get_pinned_block_number
 
 if TYPE_CHECKING:
     from skale.contracts.manager.schains import SChains
@@ -42,11 +47,22 @@ logger = logging.getLogger(__name__)
 
 
 NO_PREVIOUS_NODE_EXCEPTION_TEXT = 'No previous node'
+LEAVING_HISTORY_CACHE_SIZE = 1024
+
+LeavingHistoryIndex = Dict[SchainHash, int]
 
 
 class NodeRotation(SkaleManagerContract):
     """Wrapper for NodeRotation.sol functions"""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._leaving_history_indexes: OrderedDict[
+            Tuple[BlockNumber, NodeId],
+            LeavingHistoryIndex
+        ] = OrderedDict()
+        self._leaving_history_lock = threading.Lock()
+
     @property
     @functools.lru_cache()
     def schains(self) -> SChains:
@@ -59,22 +75,85 @@ class NodeRotation(SkaleManagerContract):
 
     def get_leaving_history(self, node_id: NodeId) -> List[RotationSwap]:
         raw_history = self.contract.functions.getLeavingHistory(node_id).call()
-        history = [
+        return self._to_leaving_history(raw_history)
+
+    def get_leaving_histories(
+            self,
+            node_ids: Sequence[NodeId],
+            block_identifier: BlockIdentifier | None = None
+    ) -> List[List[RotationSwap]]:
+        """Returns leaving histories for provided nodes using batched requests"""
+        raw_histories = batch_call(
+            self.skale.web3,
+            [
+                self.contract.functions.getLeavingHistory(node_id)
+                for node_id in node_ids
+            ],
+            block_identifier=block_identifier
+        )
+        return [self._to_leaving_history(raw_history) for raw_history in raw_histories]
+
+    @staticmethod
+    def _to_leaving_history(raw_history: List[Any]) -> List[RotationSwap]:
+        return [
             RotationSwap({
                 'schain_id': SchainHash(schain[0]),
                 'finished_rotation': int(schain[1])
             })
             for schain in raw_history
         ]
-        return history
 
-    def get_schain_finish_ts(self, node_id: NodeId, schain_name: SchainName) -> int | None:
-        history = self.get_leaving_history(node_id)
+    @staticmethod
+    def _to_leaving_history_index(history: List[RotationSwap]) -> LeavingHistoryIndex:
+        index: LeavingHistoryIndex = {}
+        for swap in history:
+            index.setdefault(swap['schain_id'], swap['finished_rotation'])
+        return index
+
+    def get_leaving_history_indexes(
+            self,
+            node_ids: Sequence[NodeId],
+            block_number: BlockNumber | None = None
+    ) -> List[LeavingHistoryIndex]:
+        """
+        Returns mappings of schain id to the finish timestamp from the leaving history
+        of provided nodes at block_number (active block session or the latest block by default).
+        Indexes for the explicit or session block are cached, missing ones are fetched
+        using batched requests. Reads at the latest block are not cached.
+        """
+        block_number = get_pinned_block_number(self.skale.web3, block_number)
+        if block_number is None:
+            return [
+                self._to_leaving_history_index(history)
+                for history in self.get_leaving_histories(node_ids)
+            ]
+        with self._leaving_history_lock:
+            cached = {
+                node_id: self._leaving_history_indexes[(block_number, node_id)]
+                for node_id in node_ids
+                if (block_number, node_id) in self._leaving_history_indexes
+            }
+        missing = list(dict.fromkeys(node_id for node_id in node_ids if node_id not in cached))
+        if missing:
+            histories = self.get_leaving_histories(missing, block_identifier=block_number)
+            with self._leaving_history_lock:
+                for node_id, history in zip(missing, histories):
+                    index = self._to_leaving_history_index(history)
+                    cached[node_id] = index
+                    self._leaving_history_indexes[(block_number, node_id)] = index
+                while len(self._leaving_history_indexes) > LEAVING_HISTORY_CACHE_SIZE:
+                    self._leaving_history_indexes.popitem(last=False)
+        return [cached[node_id] for node_id in node_ids]
+
+    def get_schain_finish_ts(
+            self,
+            node_id: NodeId,
+            schain_name: SchainName,
+            block_number: BlockNumber | None = None
+    ) -> int | None:
+        index = self.get_leaving_history_indexes([node_id], block_number)[0]
         schain_id = self.skale.schains.name_to_id(schain_name)
-        finish_ts = next(
-            (swap['finished_rotation'] for swap in history if swap['schain_id'] == schain_id),
-            None
-        )
+        finish_ts = index.get(schain_id)
         if not finish_ts:
             return None
         return int(finish_ts)
@@ -96,15 +175,19 @@ class NodeRotation(SkaleManagerContract):
         return self.is_rotation_in_progress(schain_name) and not finish_ts_reached
 
     def is_finish_ts_reached(self, schain_name: SchainName) -> bool:
+        latest_block = self.skale.web3.eth.get_block('latest')
+        current_ts = latest_block['timestamp']
+
         rotation = self.skale.node_rotation.get_rotation(schain_name)
-        schain_finish_ts = self.get_schain_finish_ts(rotation.leaving_node_id, schain_name)
+        schain_finish_ts = self.get_schain_finish_ts(
+            rotation.leaving_node_id,
+            schain_name,
+            block_number=latest_block['number']
+        )
 
         if not schain_finish_ts:
             schain_finish_ts = 0
 
-        latest_block = self.skale.web3.eth.get_block('latest')
-        current_ts = latest_block['timestamp']
-
         logger.info(f'current_ts: {current_ts}, schain_finish_ts: {schain_finish_ts}')
         return current_ts > schain_finish_ts
 
@@ -130,3 +213,28 @@ class NodeRotation(SkaleManagerContract):
             if NO_PREVIOUS_NODE_EXCEPTION_TEXT in str(e):
                 return None
             raise e
+
+    def get_previous_nodes(
+            self,
+            schain_name: SchainName,
+            node_ids: Sequence[NodeId]
+    ) -> List[NodeId | None]:
+        """Returns previous nodes for provided nodes using batched requests"""
+        schain_id = self.schains.name_to_id(schain_name)
+        results = batch_call(
+            self.skale.web3,
+            [
+                self.contract.functions.getPreviousNode(schain_id, node_id)
+                for node_id in node_ids
+            ],
+            return_exceptions=True
+        )
+        previous_nodes: List[NodeId | None] = []
+        for result in results:
+            if isinstance(result, Exception):
+                if NO_PREVIOUS_NODE_EXCEPTION_TEXT in str(result):
+                    previous_nodes.append(None)
+                    continue
+                raise result
+            previous_nodes.append(NodeId(result))
+        return previous_nodes
@@ -19,9 +19,8 @@
 """ Nodes.sol functions """
 
 import socket
-from typing import Any, Dict, List, Tuple, cast
+from typing import Any, Dict, List, Sequence, Tuple, cast
 
-from Crypto.Hash import keccak
 from eth_typing import BlockNumber, ChecksumAddress
 from web3.contract.contract import ContractFunction
 from web3.exceptions import BadFunctionCallOutput, ContractLogicError
@@ -31,8 +30,9 @@ from skale.contracts.base_contract import transaction_method
 from skale.contracts.skale_manager_contract import SkaleManagerContract
 from skale.types.node import Node, NodeId, NodeStatus, Port
 from skale.types.validator import ValidatorId
+from skale.utils.batch_utils import batch_call
 from skale.utils.exceptions import InvalidNodeIdError
-from skale.utils.helper import format_fields
+from skale.utils.helper import format_fields, name_to_id, names_to_ids
 
 FIELDS = [
     'name', 'ip', 'publicIP', 'port', 'start_block',
@@ -57,6 +57,17 @@ class Nodes(SkaleManagerContract):
         raw_node_struct_w_pk.append(self.get_domain_name(node_id))
         return raw_node_struct_w_pk
 
+    def __get_raw_many(self, node_ids: Sequence[NodeId]) -> List[List[Any]]:
+        raw_nodes = batch_call(
+            self.skale.web3,
+            [self.contract.functions.nodes(node_id) for node_id in node_ids],
+            return_exceptions=True
+        )
+        for node_id, raw_node in zip(node_ids, raw_nodes):
+            if isinstance(raw_node, Exception):
+                raise InvalidNodeIdError(node_id)
+        return [list(raw_node) for raw_node in raw_nodes]
+
     @format_fields(FIELDS)
     def untyped_get(self, node_id: NodeId) -> List[Any]:
         return self.__get_raw_w_pk_w_domain(node_id)
@@ -71,6 +82,26 @@ class Nodes(SkaleManagerContract):
             return self._to_node(node[0])
         raise ValueError("Can't process returned node type")
 
+    def get_many(self, node_ids: Sequence[NodeId]) -> List[Node]:
+        """Returns nodes with provided ids using batched requests"""
+        functions = []
+        for node_id in node_ids:
+            functions.extend([
+                self.contract.functions.nodes(node_id),
+                self.contract.functions.getNodePublicKey(node_id),
+                self.contract.functions.getNodeDomainName(node_id)
+            ])
+        results = batch_call(self.skale.web3, functions, return_exceptions=True)
+        nodes = []
+        for index, node_id in enumerate(node_ids):
+            raw_node, raw_key, domain_name = results[index * 3:index * 3 + 3]
+            if any(isinstance(result, Exception) for result in (raw_node, raw_key, domain_name)):
+                raise InvalidNodeIdError(node_id)
+            public_key = self.skale.web3.to_hex(raw_key[0] + raw_key[1])
+            raw_node_struct = [*raw_node, public_key, domain_name]
+            nodes.append(self._to_node(dict(zip(FIELDS, raw_node_struct))))
+        return nodes
+
     @format_fields(FIELDS)
     def get_by_name(self, name: str) -> List[Any]:
         name_hash = self.name_to_id(name)
@@ -81,24 +112,27 @@ class Nodes(SkaleManagerContract):
         return int(self.contract.functions.getNumberOfNodes().call())
 
     def get_active_node_ids(self) -> List[NodeId]:
-        nodes_number = self.get_nodes_number()
+        node_ids = [NodeId(node_id) for node_id in range(0, self.get_nodes_number())]
         return [
-            NodeId(node_id)
-            for node_id in range(0, nodes_number)
-            if self.get_node_status(NodeId(node_id)) == NodeStatus.ACTIVE
+            node_id
+            for node_id, status in zip(node_ids, self.get_node_statuses(node_ids))
+            if status == NodeStatus.ACTIVE
         ]
 
     def get_active_node_ips(self) -> List[bytes]:
-        nodes_number = self.get_nodes_number()
+        active_node_ids = self.get_active_node_ids()
         return [
-            self.get(NodeId(node_id))['ip']
-            for node_id in range(0, nodes_number)
-            if self.get_node_status(NodeId(node_id)) == NodeStatus.ACTIVE
+            bytes(raw_node[FIELDS.index('ip')])
+            for raw_node in self.__get_raw_many(active_node_ids)
         ]
 
-    def name_to_id(self, name: str) -> bytes:
-        keccak_hash = keccak.new(data=name.encode("utf8"), digest_bits=256)
-        return keccak_hash.digest()
+    @staticmethod
+    def name_to_id(name: str) -> bytes:
+        return name_to_id(name)
+
+    @staticmethod
+    def names_to_ids(names: Sequence[str]) -> List[bytes]:
+        return names_to_ids(names)
 
     def is_node_name_available(self, name: str) -> bool:
         node_id = self.name_to_id(name)
@@ -118,6 +152,17 @@ class Nodes(SkaleManagerContract):
         except (ContractLogicError, ValueError, BadFunctionCallOutput):
             raise InvalidNodeIdError(node_id)
 
+    def get_node_statuses(self, node_ids: Sequence[NodeId]) -> List[NodeStatus]:
+        statuses = batch_call(
+            self.skale.web3,
+            [self.contract.functions.getNodeStatus(node_id) for node_id in node_ids],
+            return_exceptions=True
+        )
+        for node_id, status in zip(node_ids, statuses):
+            if isinstance(status, Exception):
+                raise InvalidNodeIdError(node_id)
+        return [NodeStatus(status) for status in statuses]
+
     def get_node_finish_time(self, node_id: NodeId) -> int:
         try:
             return int(self.contract.functions.getNodeFinishTime(node_id).call())
@@ -138,6 +183,19 @@ class Nodes(SkaleManagerContract):
         key_bytes = raw_key[0] + raw_key[1]
         return self.skale.web3.to_hex(key_bytes)
 
+    def get_node_public_keys(self, node_ids: Sequence[NodeId]) -> List[str]:
+        raw_keys = batch_call(
+            self.skale.web3,
+            [self.contract.functions.getNodePublicKey(node_id) for node_id in node_ids],
+            return_exceptions=True
+        )
+        public_keys: List[str] = []
+        for node_id, raw_key in zip(node_ids, raw_keys):
+            if isinstance(raw_key, Exception):
+                raise InvalidNodeIdError(node_id)
+            public_keys.append(self.skale.web3.to_hex(raw_key[0] + raw_key[1]))
+        return public_keys
+
     def get_validator_node_indices(self, validator_id: int) -> list[NodeId]:
         """Returns list of node indices to the validator
 
@@ -189,7 +247,8 @@ class Nodes(SkaleManagerContract):
     def change_ip(self, node_id: NodeId, ip: bytes, public_ip: bytes) -> ContractFunction:
         return self.contract.functions.changeIP(node_id, ip, public_ip)
 
-    def _to_node(self, untyped_node: Dict[str, Any]) -> Node:
+    @staticmethod
+    def _to_node(untyped_node: Dict[str, Any]) -> Node:
         for key in Node.__annotations__:
             if key not in untyped_node:
                 raise ValueError(f"Key: {key} is not available in node.")
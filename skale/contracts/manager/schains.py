@@ -20,21 +20,23 @@
 
 import functools
 from dataclasses import asdict
-from typing import Any, List
+from typing import Any, Iterator, List, Sequence
 
-from Crypto.Hash import keccak
-from eth_typing import ChecksumAddress, HexStr
+from eth_typing import ChecksumAddress
 from hexbytes import HexBytes
-from web3 import Web3
 from web3.contract.contract import ContractFunction
-from web3.types import Wei
+from web3.types import BlockIdentifier, Wei
 
 from skale.contracts.base_contract import transaction_method
 from skale.contracts.manager.node_rotation import NodeRotation
 from skale.contracts.manager.schains_internal import SChainsInternal
 from skale.contracts.skale_manager_contract import SkaleManagerContract
 from skale.types.node import NodeId
-from skale.types.schain import SchainHash, SchainName, SchainStructure, SchainStructureWithStatus
+from skale.types.schain import (
+    Schain, SchainHash, SchainName, SchainStructure, SchainStructureWithStatus
+)
+from skale.utils.batch_utils import batch_call, iter_pages
+from skale.utils.helper import name_to_id, names_to_ids
 from skale.dataclasses.schain_options import (
     SchainOptions, get_default_schain_options, parse_schain_options
 )
@@ -50,7 +52,7 @@ class SChains(SkaleManagerContract):
     """Wrapper for some of the Schains.sol functions"""
 
     def name_to_group_id(self, name: SchainName) -> HexBytes:
-        return self.skale.web3.keccak(text=name)
+        return HexBytes(name_to_id(name))
 
     @property
     @functools.lru_cache()
@@ -63,57 +65,106 @@ class SChains(SkaleManagerContract):
         return self.skale.node_rotation
 
     def get(self, id_: SchainHash) -> SchainStructure:
-        res = self.schains_internal.get_raw(id_)
-        options = self.get_options(id_)
-        return SchainStructure(**asdict(res), chainId=self.name_to_id(res.name), options=options)
+        return self.get_many([id_])[0]
+
+    def get_many(
+            self,
+            ids: Sequence[SchainHash],
+            block_identifier: BlockIdentifier | None = None,
+            workers: int | None = None
+    ) -> List[SchainStructure]:
+        """Returns schains with provided ids using batched requests"""
+        functions = []
+        for id_ in ids:
+            functions.extend([
+                self.schains_internal.contract.functions.schains(id_),
+                self.contract.functions.getOptions(id_)
+            ])
+        results = batch_call(
+            self.skale.web3,
+            functions,
+            block_identifier=block_identifier,
+            workers=workers
+        )
+        schains = []
+        for raw_schain, raw_options in zip(results[::2], results[1::2]):
+            res = Schain(*raw_schain)
+            options = parse_schain_options(raw_options=list(raw_options))
+            schains.append(SchainStructure(
+                **asdict(res),
+                chainId=self.name_to_id(res.name),
+                options=options
+            ))
+        return schains
+
+    def iter_schains(
+            self,
+            page_size: int | None = None,
+            prefetch: bool = True
+    ) -> Iterator[SchainStructure]:
+        """Yields all schains fetched by pages of page_size schains"""
+        ids = self.schains_internal.get_all_schains_ids()
+        return iter_pages(
+            lambda offset, limit: self.get_many(ids[offset:offset + limit]),
+            total=len(ids),
+            page_size=page_size,
+            prefetch=prefetch
+        )
 
     def get_by_name(self, name: SchainName) -> SchainStructure:
         id_ = self.name_to_id(name)
         return self.get(id_)
 
     def get_schains_for_owner(self, account: ChecksumAddress) -> List[SchainStructure]:
-        schains = []
-        list_size = self.schains_internal.get_schain_list_size(account)
-
-        for i in range(0, list_size):
-            id_ = self.schains_internal.get_schain_id_by_index_for_owner(account, i)
-            schain = self.get(id_)
-            schains.append(schain)
-        return schains
-
-    def get_schains_for_node(self, node_id: NodeId) -> list[SchainStructureWithStatus]:
-        schains = []
-        schain_ids = self.schains_internal.get_schain_ids_for_node(node_id)
-        for schain_id in schain_ids:
-            simple_schain = self.get(schain_id)
-            schain = SchainStructureWithStatus(
-                **asdict(simple_schain),
-                active=self.schain_active(simple_schain)
-            )
-            schains.append(schain)
-        return schains
-
-    def get_active_schains_for_node(self, node_id: NodeId) -> List[SchainStructureWithStatus]:
-        schains = []
-        schain_ids = self.schains_internal.get_active_schain_ids_for_node(node_id)
-        for schain_id in schain_ids:
-            simple_schain = self.get(schain_id)
-            schain = SchainStructureWithStatus(
-                **asdict(simple_schain),
-                active=True
-            )
-            schains.append(schain)
-        return schains
-
-    def name_to_id(self, name: SchainName) -> SchainHash:
-        keccak_hash = keccak.new(data=name.encode("utf8"), digest_bits=256)
-        return SchainHash(Web3.to_bytes(hexstr=Web3.to_hex(hexstr=HexStr(keccak_hash.hexdigest()))))
+        with self.skale.at_block():
+            list_size = self.schains_internal.get_schain_list_size(account)
+            ids = batch_call(self.skale.web3, [
+                self.schains_internal.contract.functions.schainIndexes(account, i)
+                for i in range(0, list_size)
+            ])
+            return self.get_many([SchainHash(id_) for id_ in ids])
+
+    def get_schains_for_node(
+            self,
+            node_id: NodeId,
+            workers: int | None = None
+    ) -> list[SchainStructureWithStatus]:
+        with self.skale.at_block():
+            schain_ids = self.schains_internal.get_schain_ids_for_node(node_id)
+            return [
+                SchainStructureWithStatus(
+                    **asdict(simple_schain),
+                    active=self.schain_active(simple_schain)
+                )
+                for simple_schain in self.get_many(schain_ids, workers=workers)
+            ]
+
+    def get_active_schains_for_node(
+            self,
+            node_id: NodeId,
+            workers: int | None = None
+    ) -> List[SchainStructureWithStatus]:
+        with self.skale.at_block():
+            schain_ids = self.schains_internal.get_active_schain_ids_for_node(node_id)
+            return [
+                SchainStructureWithStatus(**asdict(simple_schain), active=True)
+                for simple_schain in self.get_many(schain_ids, workers=workers)
+            ]
+
+    @staticmethod
+    def name_to_id(name: SchainName) -> SchainHash:
+        return SchainHash(name_to_id(name))
+
+    @staticmethod
+    def names_to_ids(names: Sequence[SchainName]) -> List[SchainHash]:
+        return [SchainHash(id_) for id_ in names_to_ids(names)]
 
     def get_last_rotation_id(self, schain_name: SchainName) -> int:
         rotation_data = self.node_rotation.get_rotation(schain_name)
         return rotation_data.rotation_counter
 
-    def schain_active(self, schain: SchainStructure) -> bool:
+    @staticmethod
+    def schain_active(schain: SchainStructure) -> bool:
         if schain.name != '' and \
                 schain.mainnetOwner != '0x0000000000000000000000000000000000000000':
             return True
@@ -16,9 +16,13 @@
 #
 #   You should have received a copy of the GNU Affero General Public License
 #   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
-from skale.contracts.base_contract import BaseContract
-from skale.skale_manager import SkaleManager
+from skale.contracts.base_contract import AsyncBaseContract, BaseContract
+from skale.skale_manager import AsyncSkaleManager, SkaleManager
 
 
 class SkaleManagerContract(BaseContract[SkaleManager]):
     pass
+
+
+class AsyncSkaleManagerContract(AsyncBaseContract[AsyncSkaleManager]):
+    pass
@@ -19,7 +19,7 @@
 
 from __future__ import annotations
 import logging
-from typing import TYPE_CHECKING, Dict, List, TypedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, TypedDict, TypeVar
 from skale.types.rotation import RotationNodeData
 
 if TYPE_CHECKING:
@@ -32,11 +32,57 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+T = TypeVar('T')
+
+
 class PreviousNodeData(TypedDict):
     finish_ts: int
     previous_node_id: NodeId
 
 
+def _missing_node_ids(node_ids: Iterable[NodeId], cache: Mapping[NodeId, T]) -> List[NodeId]:
+    return list(dict.fromkeys(node_id for node_id in node_ids if node_id not in cache))
+
+
+class RotationData:
+    """
+    Memoizes nodes data used during the rotation history reconstruction.
+    Missing entries are fetched once per node using batched requests.
+    """
+
+    def __init__(self, skale: SkaleManager, schain_name: SchainName) -> None:
+        self.skale = skale
+        self.schain_name = schain_name
+        self.schain_id = skale.schains.name_to_id(schain_name)
+        self.public_keys: Dict[NodeId, str] = {}
+        self.previous_nodes: Dict[NodeId, NodeId | None] = {}
+        self.finish_ts: Dict[NodeId, int | None] = {}
+
+    def prefetch_public_keys(self, node_ids: Iterable[NodeId]) -> None:
+        missing = _missing_node_ids(node_ids, self.public_keys)
+        if missing:
+            self.public_keys.update(zip(missing, self.skale.nodes.get_node_public_keys(missing)))
+
+    def prefetch_finish_ts(self, node_ids: Iterable[NodeId]) -> None:
+        missing = _missing_node_ids(node_ids, self.finish_ts)
+        if not missing:
+            return
+        indexes = self.skale.node_rotation.get_leaving_history_indexes(missing)
+        for node_id, index in zip(missing, indexes):
+            finish_ts = index.get(self.schain_id)
+            self.finish_ts[node_id] = int(finish_ts) if finish_ts else None
+
+    def prefetch_previous_nodes(self, node_ids: Iterable[NodeId]) -> None:
+        missing = _missing_node_ids(node_ids, self.previous_nodes)
+        if not missing:
+            return
+        previous_nodes = self.skale.node_rotation.get_previous_nodes(self.schain_name, missing)
+        self.previous_nodes.update(zip(missing, previous_nodes))
+        found = [node_id for node_id in previous_nodes if node_id is not None]
+        self.prefetch_finish_ts(found)
+        self.prefetch_public_keys(found)
+
+
 def get_previous_schain_groups(
     skale: SkaleManager,
     schain_name: SchainName,
@@ -49,27 +95,37 @@ def get_previous_schain_groups(
     logger.info(f'Collecting rotation history for {schain_name}...')
     node_groups: dict[int, NodesGroup] = {}
 
-    group_id = skale.schains.name_to_id(schain_name)
-
-    previous_public_keys = skale.key_storage.get_all_previous_public_keys(group_id)
-    current_public_key = skale.key_storage.get_common_public_key(group_id)
+    with skale.at_block():
+        group_id = skale.schains.name_to_id(schain_name)
 
-    rotation = skale.node_rotation.get_rotation(schain_name)
+        previous_public_keys = skale.key_storage.get_all_previous_public_keys(group_id)
+        current_public_key = skale.key_storage.get_common_public_key(group_id)
 
-    logger.info(f'Rotation data for {schain_name}: {rotation}')
+        rotation = skale.node_rotation.get_rotation(schain_name)
 
-    _add_current_schain_state(skale, node_groups, rotation, schain_name, current_public_key)
-    if rotation.rotation_counter == 0:
-        return node_groups
+        logger.info(f'Rotation data for {schain_name}: {rotation}')
 
-    _add_previous_schain_rotations_state(
-        skale=skale,
-        node_groups=node_groups,
-        rotation=rotation,
-        schain_name=schain_name,
-        previous_public_keys=previous_public_keys,
-        leaving_node_id=leaving_node_id
-    )
+        rotation_data = RotationData(skale, schain_name)
+        _add_current_schain_state(
+            skale,
+            node_groups,
+            rotation,
+            schain_name,
+            current_public_key,
+            rotation_data
+        )
+        if rotation.rotation_counter == 0:
+            return node_groups
+
+        _add_previous_schain_rotations_state(
+            skale=skale,
+            node_groups=node_groups,
+            rotation=rotation,
+            schain_name=schain_name,
+            previous_public_keys=previous_public_keys,
+            leaving_node_id=leaving_node_id,
+            rotation_data=rotation_data
+        )
 
     return node_groups
 
@@ -79,16 +135,19 @@ def _add_current_schain_state(
     node_groups: dict[int, NodesGroup],
     rotation: Rotation,
     schain_name: SchainName,
-    current_public_key: G2Point
+    current_public_key: G2Point,
+    rotation_data: RotationData | None = None
 ) -> None:
     """
     Internal function, composes the initial info about the current sChain state and adds it to the
     node_groups dictionary
     """
+    rotation_data = rotation_data or RotationData(skale, schain_name)
     current_nodes = {}
     ids = skale.schains_internal.get_node_ids_for_schain(schain_name)
+    rotation_data.prefetch_public_keys(ids)
     for (index, node_id) in enumerate(ids):
-        public_key = skale.nodes.get_node_public_key(node_id)
+        public_key = rotation_data.public_keys[node_id]
         current_nodes[node_id] = RotationNodeData(index, node_id, public_key)
 
     node_groups[rotation.rotation_counter] = {
@@ -105,22 +164,26 @@ def _add_previous_schain_rotations_state(
     rotation: Rotation,
     schain_name: SchainName,
     previous_public_keys: list[G2Point],
-    leaving_node_id: NodeId | None = None
+    leaving_node_id: NodeId | None = None,
+    rotation_data: RotationData | None = None
 ) -> None:
     """
     Internal function, handles rotations from (rotation_counter - 2) to 0 and adds them to the
     node_groups dictionary
     """
-
+    rotation_data = rotation_data or RotationData(skale, schain_name)
     previous_nodes: Dict[NodeId, PreviousNodeData] = {}
 
     for rotation_id in range(rotation.rotation_counter - 1, -1, -1):
         nodes = node_groups[rotation_id + 1]['nodes'].copy()
+        rotation_data.prefetch_previous_nodes(
+            node_id for node_id in nodes if node_id not in previous_nodes
+        )
         for node_id in nodes:
             if node_id not in previous_nodes:
-                previous_node = skale.node_rotation.get_previous_node(schain_name, node_id)
+                previous_node = rotation_data.previous_nodes[node_id]
                 if previous_node is not None:
-                    finish_ts = skale.node_rotation.get_schain_finish_ts(previous_node, schain_name)
+                    finish_ts = rotation_data.finish_ts[previous_node]
                     previous_nodes[node_id] = {
                         'finish_ts': finish_ts or 0,
                         'previous_node_id': previous_node
@@ -128,7 +191,7 @@ def _add_previous_schain_rotations_state(
 
         new_node_id = max(previous_nodes.items(), key=lambda x: x[1]['finish_ts'])[0]
         previous_node_id = previous_nodes[new_node_id]['previous_node_id']
-        public_key = skale.nodes.get_node_public_key(previous_node_id)
+        public_key = rotation_data.public_keys[previous_node_id]
 
         current_finish_ts = previous_nodes[new_node_id]['finish_ts']
         next_dkg_is_failed = current_finish_ts + 1 == node_groups[rotation_id + 1]['finish_ts']
@@ -21,16 +21,30 @@ from __future__ import annotations
 
 import abc
 import logging
-from typing import TYPE_CHECKING, Dict, Self, Type
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Self, Type
 
 from skale_contracts import skale_contracts
 
+import skale.config as config
+from skale.transactions.fee_oracle import FeeOracle, get_fee_oracle
+from skale.transactions.gas_estimate_cache import GasEstimateCache
+from skale.transactions.nonce_manager import NonceManager, get_nonce_manager
+from skale.transactions.tx_batch import TxBatch
+from skale.utils.batch_utils import CallBatch, call_batch_context
 from skale.utils.exceptions import InvalidWalletError, EmptyWalletError
-from skale.utils.web3_utils import default_gas_price, init_web3
+from skale.utils.web3_utils import (
+    BlockSession,
+    CallCache,
+    async_default_gas_price,
+    block_session,
+    init_async_web3,
+    init_web3
+)
 from skale.wallets import BaseWallet
 
 if TYPE_CHECKING:
-    from eth_typing import ChecksumAddress
+    from eth_typing import BlockNumber, ChecksumAddress
     from skale.contracts.base_contract import BaseContract
     from skale.utils.contract_info import ContractInfo
 
@@ -52,14 +66,24 @@ class SkaleBase:
             wallet: BaseWallet | None = None,
             state_path: str | None = None,
             ts_diff: int | None = None,
-            provider_timeout: int = 30):
+            provider_timeout: int = 30,
+            call_cache: CallCache | None = None,
+            nonce_manager: NonceManager | None = None,
+            gas_estimate_cache: GasEstimateCache | None = None,
+            fee_oracle: FeeOracle | None = None):
         logger.info('Initializing skale.py, endpoint: %s, wallet: %s',
                     endpoint, type(wallet).__name__)
         self._endpoint = endpoint
         self.web3 = init_web3(endpoint,
                               state_path=state_path,
                               ts_diff=ts_diff,
-                              provider_timeout=provider_timeout)
+                              provider_timeout=provider_timeout,
+                              call_cache=call_cache)
+        if nonce_manager is None and config.LOCAL_NONCE_ALLOCATION:
+            nonce_manager = get_nonce_manager(self.web3)
+        self.nonce_manager = nonce_manager
+        self.gas_estimate_cache = gas_estimate_cache
+        self.fee_oracle = fee_oracle or get_fee_oracle(self.web3)
         self.network = skale_contracts.get_network_by_provider(self.web3.provider)
         self.project = self.network.get_project(self.project_name)
         self.instance = self.project.get_instance(alias_or_address)
@@ -76,7 +100,17 @@ class SkaleBase:
 
     @property
     def gas_price(self) -> int:
-        return default_gas_price(self.web3)
+        return self.fee_oracle.gas_price()
+
+    @property
+    def tx_nonce_manager(self) -> NonceManager | None:
+        """
+        Nonce manager used for the wallet transactions.
+        None if nonces are assigned by the wallet backend or fetched from the chain.
+        """
+        if self.wallet.external_nonces:
+            return None
+        return self.nonce_manager
 
     @property
     def wallet(self) -> BaseWallet:
@@ -92,6 +126,50 @@ class SkaleBase:
             raise InvalidWalletError(f'Wrong wallet class: {type(wallet).__name__}. \
                                        Must be one of the BaseWallet subclasses')
 
+    @contextmanager
+    def batch(self, chunk_size: int | None = None) -> Iterator[CallBatch]:
+        """
+        Collects contract reads added with call_batch.call()
+        and sends them as JSON-RPC batches when the block exits.
+        Added reads return BatchFuture objects resolved after the block,
+        other reads inside the block are made as usual.
+
+        Usage:
+        with skale.batch() as call_batch:
+            address = call_batch.call(skale.nodes.get_node_address, node_id)
+        address.result()
+        """
+        with call_batch_context(self.web3, chunk_size=chunk_size) as call_batch:
+            yield call_batch
+
+    @contextmanager
+    def tx_batch(self, **kwargs: Any) -> Iterator[TxBatch]:
+        """
+        Collects contract transactions and sends them as a pipeline when the block exits.
+        Keyword arguments are passed to TxBatch, results are available in tx_batch.results.
+
+        Usage:
+        with skale.tx_batch() as tx_batch:
+            tx_batch.add(skale.constants_holder.set_rotation_delay, delay)
+        tx_batch.results
+        """
+        tx_batch = TxBatch(self, **kwargs)
+        yield tx_batch
+        tx_batch.execute()
+
+    @contextmanager
+    def at_block(self, block_number: BlockNumber | None = None) -> Iterator[BlockSession]:
+        """
+        Pins all contract reads made in the current thread to block_number
+        (the latest block by default), so they return a consistent snapshot.
+
+        Usage:
+        with skale.at_block():
+            schains = skale.schains.get_schains_for_node(node_id)
+        """
+        with block_session(self.web3, block_number) as session:
+            yield session
+
     @abc.abstractmethod
     def set_contracts_info(self) -> None:
         pass
@@ -151,3 +229,44 @@ class SkaleBase:
 
     def __getattr__(self, name: str) -> BaseContract[Self]:
         return self._get_contract(name)
+
+
+class AsyncSkaleBase(SkaleBase):
+    """
+    SkaleBase with AsyncWeb3 client used by the async contract wrappers.
+    Contracts metadata and wallets keep using the synchronous web3 client.
+    """
+
+    def __init__(
+            self,
+            endpoint: str,
+            alias_or_address: str,
+            wallet: BaseWallet | None = None,
+            state_path: str | None = None,
+            ts_diff: int | None = None,
+            provider_timeout: int = 30,
+            call_cache: CallCache | None = None,
+            nonce_manager: NonceManager | None = None,
+            gas_estimate_cache: GasEstimateCache | None = None,
+            fee_oracle: FeeOracle | None = None):
+        self.async_web3 = init_async_web3(
+            endpoint,
+            provider_timeout=provider_timeout,
+            state_path=state_path,
+            ts_diff=ts_diff
+        )
+        super().__init__(
+            endpoint,
+            alias_or_address,
+            wallet=wallet,
+            state_path=state_path,
+            ts_diff=ts_diff,
+            provider_timeout=provider_timeout,
+            call_cache=call_cache,
+            nonce_manager=nonce_manager,
+            gas_estimate_cache=gas_estimate_cache,
+            fee_oracle=fee_oracle
+        )
+
+    async def get_gas_price(self) -> int:
+        return await async_default_gas_price(self.async_web3)
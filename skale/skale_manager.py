@@ -19,15 +19,17 @@
 
 from __future__ import annotations
 import logging
-from typing import List, TYPE_CHECKING, cast
+from typing import List, Type, TYPE_CHECKING, cast
 
-from skale.skale_base import SkaleBase
+from skale.skale_base import AsyncSkaleBase, SkaleBase
 from skale.utils.contract_info import ContractInfo
 from skale.utils.contract_types import ContractTypes
 from skale.utils.helper import get_contracts_info
 
 if TYPE_CHECKING:
+    from skale.contracts.base_contract import BaseContract
     import skale.contracts.manager as contracts
+    import skale.contracts.manager.aio as async_contracts
 
 
 logger = logging.getLogger(__name__)
@@ -182,6 +184,60 @@ class SkaleManager(SkaleBase):
         self._SkaleBase__contracts_info = get_contracts_info(self.contracts_info())
 
 
+class AsyncSkaleManager(AsyncSkaleBase):
+    """
+    Represents skale-manager smart contracts with async contract wrappers.
+    Contracts without dedicated async wrapper support async fallback calls only.
+    """
+    @property
+    def project_name(self) -> str:
+        return 'skale-manager'
+
+    @staticmethod
+    def contracts_info() -> List[ContractInfo[AsyncSkaleManager]]:
+        import skale.contracts.manager.aio as async_contracts
+        async_classes = {
+            'nodes': async_contracts.AsyncNodes,
+            'schains': async_contracts.AsyncSChains,
+            'schains_internal': async_contracts.AsyncSChainsInternal
+        }
+        return [
+            cast(ContractInfo['AsyncSkaleManager'], contract_info._replace(
+                # async wrappers are instantiated the same way as sync ones
+                contract_class=cast('Type[BaseContract[SkaleManager]]', async_classes.get(
+                    contract_info.name,
+                    async_contracts.AsyncSkaleManagerContract
+                ))
+            ))
+            for contract_info in SkaleManager.contracts_info()
+        ]
+
+    @property
+    def nodes(self) -> async_contracts.AsyncNodes:
+        return cast('async_contracts.AsyncNodes', self._get_contract('nodes'))
+
+    @property
+    def schains(self) -> async_contracts.AsyncSChains:
+        return cast('async_contracts.AsyncSChains', self._get_contract('schains'))
+
+    @property
+    def schains_internal(self) -> async_contracts.AsyncSChainsInternal:
+        return cast(
+            'async_contracts.AsyncSChainsInternal',
+            self._get_contract('schains_internal')
+        )
+
+    def set_contracts_info(self) -> None:
+        self._SkaleBase__contracts_info = get_contracts_info(self.contracts_info())
+
+
 def spawn_skale_manager_lib(skale: SkaleManager) -> SkaleManager:
     """ Clone skale manager object with the same wallet """
-    return SkaleManager(skale._endpoint, skale.instance.address, skale.wallet)
+    return SkaleManager(
+        skale._endpoint,
+        skale.instance.address,
+        skale.wallet,
+        nonce_manager=skale.nonce_manager,
+        gas_estimate_cache=skale.gas_estimate_cache,
+        fee_oracle=skale.fee_oracle
+    )
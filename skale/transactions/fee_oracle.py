@@ -0,0 +1,160 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE.py
+#
+#   Copyright (C) 2019-Present SKALE Labs
+#
+#   SKALE.py is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   SKALE.py is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
+""" SKALE transaction fees oracle """
+
+from __future__ import annotations
+
+import logging
+import statistics
+import threading
+import time
+import weakref
+from typing import Any, Dict, NamedTuple
+
+from web3 import Web3
+from web3.types import FeeHistory, Wei
+
+import skale.config as config
+from skale.utils.web3_utils import adjust_gas_price
+
+
+logger = logging.getLogger(__name__)
+
+
+class Fees(NamedTuple):
+    gas_price: Wei | None = None
+    max_fee_per_gas: Wei | None = None
+    max_priority_fee_per_gas: Wei | None = None
+
+    def as_kwargs(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+class CachedFees(NamedTuple):
+    fetched_at: float
+    block_number: int | None
+    fees: Fees
+
+
+class FeeOracle:
+    """
+    Suggests transaction fees.
+    Legacy gas price is the node gas price multiplied by GAS_PRICE_COEFFICIENT.
+    In EIP-1559 mode max priority fee is the median of reward percentile
+    paid in the last history_blocks blocks (eth_feeHistory)
+    and max fee covers doubled base fee of the next block.
+    If the current block number is provided, fees are reused only within the block
+    they were fetched at, otherwise they are reused for refresh_interval seconds.
+    """
+
+    def __init__(
+            self,
+            web3: Web3,
+            eip1559: bool | None = None,
+            percentile: float | None = None,
+            history_blocks: int | None = None,
+            refresh_interval: float | None = None
+    ) -> None:
+        self._web3_ref = weakref.ref(web3)
+        self.eip1559 = config.EIP1559_FEES if eip1559 is None else eip1559
+        self.percentile = percentile or config.FEE_HISTORY_PERCENTILE
+        self.history_blocks = history_blocks or config.FEE_HISTORY_BLOCKS
+        if refresh_interval is None:
+            refresh_interval = config.FEE_ORACLE_REFRESH_INTERVAL
+        self.refresh_interval = refresh_interval
+        self._gas_price: CachedFees | None = None
+        self._eip1559_fees: CachedFees | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def web3(self) -> Web3:
+        web3 = self._web3_ref()
+        if web3 is None:
+            raise ReferenceError('Web3 instance of the fee oracle was destroyed')
+        return web3
+
+    def _is_fresh(self, cached: CachedFees, block_number: int | None) -> bool:
+        if block_number is not None:
+            return cached.block_number is not None and cached.block_number >= block_number
+        return time.monotonic() - cached.fetched_at < self.refresh_interval
+
+    def gas_price(self, block_number: int | None = None) -> Wei:
+        with self._lock:
+            cached = self._gas_price
+            if cached is not None and cached.fees.gas_price is not None and \
+                    self._is_fresh(cached, block_number):
+                return cached.fees.gas_price
+            gas_price = Wei(adjust_gas_price(self.web3.eth.gas_price))
+            self._gas_price = CachedFees(
+                time.monotonic(),
+                block_number,
+                Fees(gas_price=gas_price)
+            )
+            return gas_price
+
+    def eip1559_fees(self, block_number: int | None = None) -> Fees:
+        with self._lock:
+            cached = self._eip1559_fees
+            if cached is not None and self._is_fresh(cached, block_number):
+                return cached.fees
+            history = self.web3.eth.fee_history(
+                self.history_blocks,
+                'latest',
+                [self.percentile]
+            )
+            return self._update_eip1559_fees(history)
+
+    def observe_fee_history(self, history: FeeHistory) -> Fees:
+        """Updates EIP-1559 fees with fee history fetched elsewhere"""
+        with self._lock:
+            return self._update_eip1559_fees(history)
+
+    def _update_eip1559_fees(self, history: FeeHistory) -> Fees:
+        next_base_fee = history['baseFeePerGas'][-1]
+        rewards = [reward[0] for reward in history.get('reward') or [] if reward]
+        priority_fee = int(statistics.median(rewards)) if rewards else 0
+        fees = Fees(
+            max_fee_per_gas=Wei(2 * next_base_fee + priority_fee),
+            max_priority_fee_per_gas=Wei(priority_fee)
+        )
+        # the last block in the history is the latest one
+        block_number = history['oldestBlock'] + len(history['gasUsedRatio']) - 1
+        logger.debug(
+            'Fees updated at block %d: %s, next base fee: %d',
+            block_number, fees, next_base_fee
+        )
+        self._eip1559_fees = CachedFees(time.monotonic(), block_number, fees)
+        return fees
+
+    def get_fees(self, block_number: int | None = None) -> Fees:
+        if self.eip1559:
+            return self.eip1559_fees(block_number)
+        return Fees(gas_price=self.gas_price(block_number))
+
+
+_fee_oracles: weakref.WeakKeyDictionary[Web3, FeeOracle] = weakref.WeakKeyDictionary()
+_fee_oracles_lock = threading.Lock()
+
+
+def get_fee_oracle(web3: Web3) -> FeeOracle:
+    """Returns fee oracle shared by all users of the web3 instance"""
+    with _fee_oracles_lock:
+        if web3 not in _fee_oracles:
+            _fee_oracles[web3] = FeeOracle(web3)
+        return _fee_oracles[web3]
@@ -0,0 +1,146 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE.py
+#
+#   Copyright (C) 2019-Present SKALE Labs
+#
+#   SKALE.py is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   SKALE.py is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
+""" SKALE gas estimates cache """
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Tuple
+
+from web3 import Web3
+from web3.contract.contract import ContractFunction
+from web3.types import TxParams
+
+import skale.config as config
+
+
+class GasEstimate(NamedTuple):
+    gas: int
+    block_number: int
+    created_at: float
+
+
+def argument_shape(value: Any) -> Any:
+    """Describes the value by its type and size, so calls of similar cost share the shape"""
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(argument_shape(item) for item in value)
+    if isinstance(value, (bytes, str)):
+        return type(value).__name__, len(value)
+    return type(value).__name__
+
+
+class GasEstimateCache:
+    """
+    Caches gas estimates keyed by contract, function selector, sender and arguments shape.
+    An estimate is valid for ttl seconds and max_blocks blocks.
+    Cached estimate should be verified by the caller before use (e.g. with eth_call).
+    Also keeps block gas limit of the latest observed block.
+    """
+
+    def __init__(
+            self,
+            ttl: float | None = None,
+            max_blocks: int | None = None,
+            max_size: int | None = None
+    ) -> None:
+        self.ttl = ttl or config.GAS_ESTIMATE_CACHE_TTL
+        self.max_blocks = max_blocks or config.GAS_ESTIMATE_CACHE_BLOCKS
+        self.max_size = max_size or config.GAS_ESTIMATE_CACHE_SIZE
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Tuple[Any, ...], GasEstimate] = OrderedDict()
+        self._block_gas_limit: Tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f'GasEstimateCache(size={len(self)}, hits={self.hits}, misses={self.misses})'
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._block_gas_limit = None
+
+    @staticmethod
+    def make_key(method: ContractFunction, opts: TxParams) -> Tuple[Any, ...]:
+        return (
+            method.address,
+            method._encode_transaction_data()[:10],
+            opts.get('from'),
+            bool(opts.get('value')),
+            argument_shape(tuple(method.args or ())),
+            argument_shape(tuple(sorted((method.kwargs or {}).items())))
+        )
+
+    def get(self, key: Tuple[Any, ...], block_number: int) -> int | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                time.monotonic() - entry.created_at > self.ttl or
+                block_number - entry.block_number > self.max_blocks
+            ):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.gas
+
+    def peek(self, key: Tuple[Any, ...]) -> int | None:
+        """Returns cached estimate without checking its age, missing estimate counts as a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            return entry.gas
+
+    def set(self, key: Tuple[Any, ...], gas: int, block_number: int) -> None:
+        with self._lock:
+            self._entries[key] = GasEstimate(gas, block_number, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Tuple[Any, ...]) -> None:
+        """Removes estimate that turned out to be invalid, it counts as a miss"""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.misses += 1
+
+    def get_block_gas_limit(self, web3: Web3, block_number: int) -> int:
+        """Returns gas limit of the block, fetching it only when a new block is observed"""
+        with self._lock:
+            cached = self._block_gas_limit
+        if cached is not None and cached[0] >= block_number:
+            return cached[1]
+        gas_limit = web3.eth.get_block(block_number)['gasLimit']
+        self.set_block_gas_limit(block_number, gas_limit)
+        return gas_limit
+
+    def set_block_gas_limit(self, block_number: int, gas_limit: int) -> None:
+        with self._lock:
+            if self._block_gas_limit is None or self._block_gas_limit[0] < block_number:
+                self._block_gas_limit = (block_number, gas_limit)
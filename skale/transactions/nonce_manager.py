@@ -0,0 +1,219 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE.py
+#
+#   Copyright (C) 2019-Present SKALE Labs
+#
+#   SKALE.py is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   SKALE.py is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
+""" Local nonce allocation """
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import weakref
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, List
+
+from eth_typing import ChecksumAddress
+from web3 import AsyncWeb3, Web3
+from web3.types import Nonce
+
+import skale.config as config
+from skale.utils.web3_utils import get_eth_nonce
+
+
+logger = logging.getLogger(__name__)
+
+
+class NonceManager:
+    """
+    Thread-safe per-address nonce allocator.
+    Nonces are reserved in-process, the local counter is synced with the pending
+    transaction count on the first use, every sync_interval seconds and after failures.
+    Transactions sent from the same address by other processes are not accounted
+    between syncs, so the manager should be used only by the single sender.
+    """
+
+    def __init__(self, web3: Web3, sync_interval: float | None = None) -> None:
+        self._web3_ref = weakref.ref(web3)
+        if sync_interval is None:
+            sync_interval = config.NONCE_SYNC_INTERVAL
+        self.sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._address_locks: Dict[ChecksumAddress, threading.Lock] = {}
+        self._next_nonces: Dict[ChecksumAddress, int] = {}
+        self._synced_at: Dict[ChecksumAddress, float] = {}
+        self._in_flight: Dict[ChecksumAddress, int] = defaultdict(int)
+
+    @property
+    def web3(self) -> Web3:
+        web3 = self._web3_ref()
+        if web3 is None:
+            raise ReferenceError('Web3 instance of the nonce manager was destroyed')
+        return web3
+
+    def _get_address_lock(self, address: ChecksumAddress) -> threading.Lock:
+        with self._lock:
+            return self._address_locks.setdefault(address, threading.Lock())
+
+    def _sync(self, address: ChecksumAddress) -> None:
+        chain_nonce: int = self.web3.eth.get_transaction_count(address, 'pending')
+        local_nonce = self._next_nonces.get(address)
+        # reserved nonces may not be sent yet, so the local counter
+        # is moved back only if there are no transactions in flight
+        if local_nonce is not None and local_nonce > chain_nonce and self._in_flight[address]:
+            chain_nonce = local_nonce
+        if local_nonce is not None and local_nonce != chain_nonce:
+            logger.info('Nonce for %s synced: %d -> %d', address, local_nonce, chain_nonce)
+        self._next_nonces[address] = chain_nonce
+        self._synced_at[address] = time.monotonic()
+
+    def allocate(self, address: ChecksumAddress) -> Nonce:
+        """Reserves the next nonce for the address"""
+        return self.allocate_many(address, 1)[0]
+
+    def allocate_many(self, address: ChecksumAddress, number: int) -> List[Nonce]:
+        """Reserves number of consecutive nonces for the address"""
+        with self._get_address_lock(address):
+            synced_at = self._synced_at.get(address, float('-inf'))
+            if address not in self._next_nonces or \
+                    time.monotonic() - synced_at >= self.sync_interval:
+                self._sync(address)
+            nonce = self._next_nonces[address]
+            self._next_nonces[address] = nonce + number
+            self._in_flight[address] += number
+            return [Nonce(nonce + index) for index in range(number)]
+
+    def complete(self, address: ChecksumAddress) -> None:
+        """Marks allocated nonce as used by the sent transaction"""
+        with self._get_address_lock(address):
+            self._in_flight[address] = max(self._in_flight[address] - 1, 0)
+
+    def release(self, address: ChecksumAddress, nonce: Nonce) -> None:
+        """
+        Returns allocated nonce of the transaction that wasn't sent.
+        The counter is synced with the chain on the next allocation,
+        so the released nonce is reused if no other transactions are in flight.
+        """
+        with self._get_address_lock(address):
+            self._in_flight[address] = max(self._in_flight[address] - 1, 0)
+            if self._next_nonces.get(address) == nonce + 1:
+                self._next_nonces[address] = nonce
+            self._synced_at[address] = float('-inf')
+
+    def use(self, address: ChecksumAddress, nonce: Nonce) -> None:
+        """Accounts explicitly provided nonce"""
+        with self._get_address_lock(address):
+            if address in self._next_nonces and nonce >= self._next_nonces[address]:
+                self._next_nonces[address] = nonce + 1
+
+    def reset(self, address: ChecksumAddress | None = None) -> None:
+        """
+        Drops local counters, nonces are fetched from the chain on the next allocation.
+        Counters of each address are dropped under its lock, so allocations in progress
+        are completed before the reset.
+        """
+        if address is None:
+            with self._lock:
+                addresses = list(self._address_locks)
+        else:
+            addresses = [address]
+        for reset_address in addresses:
+            with self._get_address_lock(reset_address):
+                self._next_nonces.pop(reset_address, None)
+                self._in_flight.pop(reset_address, None)
+
+    @contextmanager
+    def reserve(self, address: ChecksumAddress, nonce: Nonce | None = None) -> Iterator[Nonce]:
+        """
+        Yields provided or newly allocated nonce.
+        Allocated nonce is released if the block raises an exception.
+        """
+        if nonce is not None:
+            self.use(address, nonce)
+            yield nonce
+            return
+        nonce = self.allocate(address)
+        try:
+            yield nonce
+        except Exception:
+            self.release(address, nonce)
+            raise
+        self.complete(address)
+
+    @asynccontextmanager
+    async def async_reserve(
+        self,
+        address: ChecksumAddress,
+        nonce: Nonce | None = None
+    ) -> AsyncIterator[Nonce]:
+        """Async version of reserve, the chain sync is run in a thread"""
+        if nonce is not None:
+            self.use(address, nonce)
+            yield nonce
+            return
+        nonce = await asyncio.to_thread(self.allocate, address)
+        try:
+            yield nonce
+        except Exception:
+            self.release(address, nonce)
+            raise
+        self.complete(address)
+
+
+_nonce_managers: weakref.WeakKeyDictionary[Web3, NonceManager] = weakref.WeakKeyDictionary()
+_nonce_managers_lock = threading.Lock()
+
+
+def get_nonce_manager(web3: Web3) -> NonceManager:
+    """Returns nonce manager shared by all users of the web3 instance"""
+    with _nonce_managers_lock:
+        if web3 not in _nonce_managers:
+            _nonce_managers[web3] = NonceManager(web3)
+        return _nonce_managers[web3]
+
+
+@contextmanager
+def reserve_nonce(
+    web3: Web3,
+    nonce_manager: NonceManager | None,
+    address: ChecksumAddress,
+    nonce: Nonce | None = None
+) -> Iterator[Nonce]:
+    """Reserves nonce with the nonce manager or takes the transaction count from the chain"""
+    if nonce_manager is None:
+        yield nonce if nonce is not None else get_eth_nonce(web3, address)
+    else:
+        with nonce_manager.reserve(address, nonce) as tx_nonce:
+            yield tx_nonce
+
+
+@asynccontextmanager
+async def async_reserve_nonce(
+    async_web3: AsyncWeb3,
+    nonce_manager: NonceManager | None,
+    address: ChecksumAddress,
+    nonce: Nonce | None = None
+) -> AsyncIterator[Nonce]:
+    """Async version of reserve_nonce"""
+    if nonce_manager is None:
+        yield nonce if nonce is not None else \
+            await async_web3.eth.get_transaction_count(address)
+    else:
+        async with nonce_manager.async_reserve(address, nonce) as tx_nonce:
+            yield tx_nonce
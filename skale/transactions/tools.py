@@ -21,22 +21,31 @@ from __future__ import annotations
 import logging
 import time
 from functools import partial, wraps
-from typing import Any, Callable, Optional, TYPE_CHECKING
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from eth_typing import ChecksumAddress
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
+from web3.contract.async_contract import AsyncContractFunction
 from web3.contract.contract import ContractFunction
 from web3.exceptions import ContractLogicError, Web3Exception
 from web3._utils.transactions import get_block_gas_limit
-from web3.types import Nonce, TxParams, Wei
+from web3.types import Nonce, RPCEndpoint, TxParams, Wei
 
 import skale.config as config
 from skale.transactions.exceptions import TransactionError
+from skale.transactions.fee_oracle import FeeOracle, Fees
+from skale.transactions.gas_estimate_cache import GasEstimateCache
 from skale.transactions.result import TxCallResult, TxRes, TxStatus
-from skale.utils.web3_utils import get_eth_nonce
+from skale.utils.batch_utils import (
+    RpcRequest,
+    batch_request,
+    format_batch_response,
+    make_batch_request
+)
+from skale.utils.web3_utils import adjust_gas_price, get_eth_nonce
 
 if TYPE_CHECKING:
-    from skale.skale_base import SkaleBase
+    from skale.skale_base import AsyncSkaleBase, SkaleBase
 
 
 logger = logging.getLogger(__name__)
@@ -51,29 +60,224 @@ def make_dry_run_call(
         gas_limit: int | None = None,
         value: Wei = Wei(0)
 ) -> TxCallResult:
-    opts = TxParams({
-        'from': skale.wallet.address,
-        'value': value
-    })
-    logger.info(
-        f'Dry run tx: {method.fn_name}, '
-        f'sender: {skale.wallet.address}, '
-        f'wallet: {skale.wallet.__class__.__name__}, '
-        f'value: {value}, '
-    )
+    opts = compose_dry_run_opts(skale, method, value)
+    estimated_gas, gas_price, block_number = 0, None, None
+
+    try:
+        estimated_gas, gas_price, block_number = dry_run_batch(
+            skale.web3,
+            method,
+            opts,
+            gas_limit,
+            fee_oracle=skale.fee_oracle,
+            gas_estimate_cache=skale.gas_estimate_cache
+        )
+        logger.info(f'Estimated gas for {method.fn_name}: {estimated_gas}')
+    except (ContractLogicError, Web3Exception, ValueError) as e:
+        return dry_run_failed_result(method, e)
+
+    return dry_run_success_result(estimated_gas, gas_price, block_number)
+
+
+def dry_run_batch(
+        web3: Web3,
+        method: ContractFunction,
+        opts: TxParams,
+        gas_limit: int | None = None,
+        fee_oracle: FeeOracle | None = None,
+        gas_estimate_cache: GasEstimateCache | None = None
+) -> Tuple[int, int | None, int]:
+    """
+    Sends dry run request together with the latest block and fee requests
+    as a single JSON-RPC batch. Dry run is eth_call if gas_limit is provided
+    or there is a cached estimate, otherwise it's eth_estimateGas.
+    Cached estimate is used if the call succeeds with it and the estimate isn't expired,
+    otherwise it's invalidated and the estimate is requested from the node.
+    Fee history is requested and passed to the fee oracle if it works in EIP-1559 mode,
+    otherwise the gas price is requested.
+    Returns gas limit for the transaction, the current gas price and block number.
+    """
+    cache = None if gas_limit else gas_estimate_cache
+    key = cache.make_key(method, opts) if cache is not None else None
+    cached_gas = cache.peek(key) if cache is not None and key is not None else None
+    tx = {**opts, 'to': method.address, 'data': method._encode_transaction_data()}
+    call_gas = gas_limit or cached_gas
+    if call_gas:
+        check_request = RpcRequest(RPCEndpoint('eth_call'), [{**tx, 'gas': call_gas}, 'latest'])
+    else:
+        check_request = RpcRequest(RPCEndpoint('eth_estimateGas'), [tx, 'latest'])
+    if fee_oracle is not None and fee_oracle.eip1559:
+        fee_request = RpcRequest(RPCEndpoint('eth_feeHistory'), [
+            hex(fee_oracle.history_blocks),
+            'latest',
+            [fee_oracle.percentile]
+        ])
+    else:
+        fee_request = RpcRequest(RPCEndpoint('eth_gasPrice'), [])
+    requests = [
+        check_request,
+        RpcRequest(RPCEndpoint('eth_getBlockByNumber'), ['latest', False]),
+        fee_request
+    ]
+    check_response, block_response, fee_response = make_batch_request(web3, requests)
+    # block is not formatted to avoid extraData validation, only number and gas limit are needed
+    if 'error' in block_response:
+        raise ValueError(block_response['error'])
+    block_number = int(block_response['result']['number'], 16)
+
+    gas_price = None
+    if fee_request.method == 'eth_gasPrice':
+        gas_price = int(format_batch_response(web3, fee_request, fee_response))
+    elif fee_oracle is not None and 'error' not in fee_response:
+        fee_oracle.observe_fee_history(format_batch_response(web3, fee_request, fee_response))
+
+    if gas_limit:
+        format_batch_response(web3, check_request, check_response)
+        return gas_limit, gas_price, block_number
+
+    block_gas_limit = int(block_response['result']['gasLimit'], 16)
+    if cache is not None:
+        cache.set_block_gas_limit(block_number, block_gas_limit)
+    if cache is None or key is None or cached_gas is None:
+        estimated_gas = int(format_batch_response(web3, check_request, check_response))
+        if cache is not None and key is not None:
+            cache.set(key, estimated_gas, block_number)
+    else:
+        valid_gas = None
+        try:
+            format_batch_response(web3, check_request, check_response)
+            valid_gas = cache.get(key, block_number)
+        except (ContractLogicError, Web3Exception, ValueError) as e:
+            logger.info('Call of %s with cached gas estimate failed: %s', method.fn_name, e)
+            cache.invalidate(key)
+        if valid_gas is None:
+            valid_gas = method.estimate_gas(opts, block_identifier='latest')
+            cache.set(key, valid_gas, block_number)
+        estimated_gas = valid_gas
+    return normalize_estimated_gas(method, estimated_gas, block_gas_limit), gas_price, block_number
+
+
+def get_dry_run_block_number(call_result: TxCallResult | None) -> int | None:
+    """Returns number of the block the dry run was made at"""
+    if call_result is None or call_result.data.get('block_number') is None:
+        return None
+    return int(call_result.data['block_number'])
+
+
+def get_dry_run_gas_price(call_result: TxCallResult | None) -> int | None:
+    """Returns gas price for the transaction fetched during the dry run"""
+    if call_result is None or call_result.data.get('gas_price') is None:
+        return None
+    return adjust_gas_price(int(call_result.data['gas_price']))
+
+
+def resolve_fees(
+        skale: SkaleBase,
+        call_result: TxCallResult | None = None,
+        gas_price: int | None = None,
+        max_fee_per_gas: int | None = None,
+        max_priority_fee_per_gas: int | None = None
+) -> Fees:
+    """
+    Explicitly provided fees take precedence, then DEFAULT_GAS_PRICE_WEI.
+    Otherwise fees are suggested by the fee oracle for the block of the dry run,
+    in legacy mode gas price fetched during the dry run is used if it's available.
+    """
+    if max_fee_per_gas is not None and max_priority_fee_per_gas is not None:
+        return Fees(
+            max_fee_per_gas=Wei(max_fee_per_gas),
+            max_priority_fee_per_gas=Wei(max_priority_fee_per_gas)
+        )
+    gas_price = gas_price or config.DEFAULT_GAS_PRICE_WEI
+    if gas_price:
+        return Fees(gas_price=Wei(gas_price))
+    block_number = get_dry_run_block_number(call_result)
+    if skale.fee_oracle.eip1559:
+        return skale.fee_oracle.eip1559_fees(block_number)
+    gas_price = get_dry_run_gas_price(call_result) or skale.fee_oracle.gas_price(block_number)
+    return Fees(gas_price=Wei(gas_price))
+
+
+def make_dry_run_calls(
+        skale: SkaleBase,
+        methods: Sequence[ContractFunction],
+        values: Sequence[Wei] | None = None
+) -> List[TxCallResult]:
+    """
+    Estimates gas for all methods using JSON-RPC batch of eth_estimateGas requests.
+    Every method is estimated against the current state.
+    """
+    values = values or [Wei(0)] * len(methods)
+    opts = [compose_dry_run_opts(skale, method, value) for method, value in zip(methods, values)]
+    requests = [
+        RpcRequest(RPCEndpoint('eth_estimateGas'), [
+            {**opt, 'to': method.address, 'data': method._encode_transaction_data()},
+            'latest'
+        ])
+        for method, opt in zip(methods, opts)
+    ]
+    block_gas_limit = get_block_gas_limit(skale.web3, 'latest')
+    estimates = batch_request(skale.web3, requests, return_exceptions=True)
+    results = []
+    for method, estimated_gas in zip(methods, estimates):
+        if isinstance(estimated_gas, (ContractLogicError, Web3Exception, ValueError)):
+            results.append(dry_run_failed_result(method, estimated_gas))
+            continue
+        if isinstance(estimated_gas, Exception):
+            raise estimated_gas
+        gas = normalize_estimated_gas(method, estimated_gas, block_gas_limit)
+        logger.info(f'Estimated gas for {method.fn_name}: {gas}')
+        results.append(dry_run_success_result(gas))
+    return results
+
+
+async def async_make_dry_run_call(
+        skale: AsyncSkaleBase,
+        method: AsyncContractFunction,
+        gas_limit: int | None = None,
+        value: Wei = Wei(0)
+) -> TxCallResult:
+    opts = compose_dry_run_opts(skale, method, value)
     estimated_gas = 0
 
     try:
         if gas_limit:
             estimated_gas = gas_limit
             opts.update({'gas': gas_limit})
-            method.call(opts)
+            await method.call(opts)
         else:
-            estimated_gas = estimate_gas(skale.web3, method, opts)
+            estimated_gas = await async_estimate_gas(skale.async_web3, method, opts)
         logger.info(f'Estimated gas for {method.fn_name}: {estimated_gas}')
-    except ContractLogicError as e:
-        message = e.message or 'Contract logic error'
-        error_data = e.data or {}
+    except (ContractLogicError, Web3Exception, ValueError) as e:
+        return dry_run_failed_result(method, e)
+
+    return dry_run_success_result(estimated_gas)
+
+
+def compose_dry_run_opts(
+        skale: SkaleBase,
+        method: ContractFunction | AsyncContractFunction,
+        value: Wei
+) -> TxParams:
+    logger.info(
+        f'Dry run tx: {method.fn_name}, '
+        f'sender: {skale.wallet.address}, '
+        f'wallet: {skale.wallet.__class__.__name__}, '
+        f'value: {value}, '
+    )
+    return TxParams({
+        'from': skale.wallet.address,
+        'value': value
+    })
+
+
+def dry_run_failed_result(
+        method: ContractFunction | AsyncContractFunction,
+        error: Exception
+) -> TxCallResult:
+    if isinstance(error, ContractLogicError):
+        message = error.message or 'Contract logic error'
+        error_data = error.data or {}
         data = {'data': error_data} if isinstance(error_data, str) else error_data
         return TxCallResult(
             status=TxStatus.FAILED,
@@ -81,15 +285,25 @@ def make_dry_run_call(
             message=message,
             data=data
         )
-    except (Web3Exception, ValueError) as e:
-        logger.exception('Dry run for %s failed', method)
-        return TxCallResult(status=TxStatus.FAILED, error='exception', message=str(e), data={})
+    logger.error('Dry run for %s failed', method, exc_info=error)
+    return TxCallResult(status=TxStatus.FAILED, error='exception', message=str(error), data={})
+
 
+def dry_run_success_result(
+        estimated_gas: int,
+        gas_price: int | None = None,
+        block_number: int | None = None
+) -> TxCallResult:
+    data = {'gas': estimated_gas}
+    if gas_price is not None:
+        data['gas_price'] = gas_price
+    if block_number is not None:
+        data['block_number'] = block_number
     return TxCallResult(
         status=TxStatus.SUCCESS,
         error='',
         message='success',
-        data={'gas': estimated_gas}
+        data=data
     )
 
 
@@ -103,6 +317,41 @@ def estimate_gas(web3: Web3, method: ContractFunction, opts: TxParams) -> int:
         opts,
         block_identifier='latest'
     )
+    return normalize_estimated_gas(method, estimated_gas, block_gas_limit)
+
+
+def estimate_gas_cached(
+        web3: Web3,
+        cache: GasEstimateCache,
+        method: ContractFunction,
+        opts: TxParams
+) -> int:
+    """
+    Reuses cached estimate if the call succeeds with it as a gas limit,
+    otherwise the estimate is requested from the node and cached.
+    """
+    estimated_gas, _, _ = dry_run_batch(web3, method, opts, gas_estimate_cache=cache)
+    return estimated_gas
+
+
+async def async_estimate_gas(
+        web3: AsyncWeb3,
+        method: AsyncContractFunction,
+        opts: TxParams
+) -> int:
+    latest_block = await web3.eth.get_block('latest')
+    estimated_gas = await method.estimate_gas(
+        opts,
+        block_identifier='latest'
+    )
+    return normalize_estimated_gas(method, estimated_gas, latest_block['gasLimit'])
+
+
+def normalize_estimated_gas(
+        method: ContractFunction | AsyncContractFunction,
+        estimated_gas: int,
+        block_gas_limit: int
+) -> int:
     normalized_estimated_gas = int(
         estimated_gas * config.DEFAULT_GAS_MULTIPLIER
     )
@@ -158,6 +407,21 @@ def transaction_from_method(
     return tx
 
 
+async def async_transaction_from_method(
+    method: AsyncContractFunction,
+    *,
+    multiplier: Optional[float] = None,
+    priority: Optional[int] = None,
+    **kwargs: Any
+) -> TxParams:
+    tx = await method.build_transaction(compose_base_fields(**kwargs))
+    logger.info(
+        f'Tx: {method.fn_name}, '
+        f'Fields: {tx}, '
+    )
+    return tx
+
+
 def compose_eth_transfer_tx(
     web3: Web3,
     from_address: ChecksumAddress,
@@ -0,0 +1,209 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE.py
+#
+#   Copyright (C) 2019-Present SKALE Labs
+#
+#   SKALE.py is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   SKALE.py is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
+""" SKALE pipelined transactions submission """
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, List, NamedTuple, TYPE_CHECKING
+
+from eth_typing import ChecksumAddress, HexStr
+from web3.contract.contract import ContractFunction
+from web3.types import Nonce, TxReceipt, Wei
+
+import skale.config as config
+from skale.transactions.result import TxCallResult, TxRes, TxStatus
+from skale.transactions.tools import (
+    make_dry_run_calls,
+    resolve_fees,
+    transaction_from_method
+)
+from skale.utils.web3_utils import (
+    get_eth_nonce,
+    suspend_block_session,
+    wait_for_confirmation_blocks
+)
+
+if TYPE_CHECKING:
+    from skale.skale_base import SkaleBase
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueuedTx(NamedTuple):
+    name: str
+    method: ContractFunction
+    value: Wei
+    gas_limit: int | None
+
+
+class TxBatch:
+    """
+    Collects contract transactions and sends them as a pipeline:
+    all transactions are dry run with a single JSON-RPC batch,
+    signed with consecutive nonces, sent back to back
+    and then their receipts are awaited together with wallet.wait_many.
+    Transactions are dry run against the same state,
+    so they should not depend on each other.
+    """
+
+    def __init__(
+            self,
+            skale: SkaleBase,
+            wait_for: bool = True,
+            skip_dry_run: bool = False,
+            raise_for_status: bool = True,
+            gas_price: int | None = None,
+            multiplier: float | None = None,
+            priority: int | None = None,
+            confirmation_blocks: int = 0
+    ) -> None:
+        self.skale = skale
+        self.wait_for = wait_for
+        self.skip_dry_run = skip_dry_run
+        self.raise_for_status = raise_for_status
+        self.gas_price = gas_price
+        self.multiplier = multiplier
+        self.priority = priority
+        self.confirmation_blocks = confirmation_blocks
+        self.results: List[TxRes] = []
+        self._queue: List[QueuedTx] = []
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def add(
+            self,
+            transaction: Callable[..., TxRes],
+            *args: Any,
+            value: Wei = Wei(0),
+            gas_limit: int | None = None,
+            **kwargs: Any
+    ) -> int:
+        """
+        Queues contract transaction method call, returns its index in the results.
+
+        Usage:
+        tx_batch.add(skale.constants_holder.set_rotation_delay, delay)
+        """
+        contract = getattr(transaction, '__self__')
+        method = getattr(transaction, '__wrapped__')(contract, *args, **kwargs)
+        name = f'{contract.name}.{method.abi.get("name")}'
+        self._queue.append(QueuedTx(name, method, value, gas_limit))
+        return len(self._queue) - 1
+
+    def _dry_run(self, queue: List[QueuedTx]) -> List[TxCallResult | None]:
+        if self.skip_dry_run or config.DISABLE_DRY_RUN:
+            return [None] * len(queue)
+        return list(make_dry_run_calls(
+            self.skale,
+            [tx.method for tx in queue],
+            [tx.value for tx in queue]
+        ))
+
+    @staticmethod
+    def _get_gas_limit(tx: QueuedTx, call_result: TxCallResult | None) -> int:
+        estimated_gas = call_result.data['gas'] if call_result is not None else None
+        return int(tx.gas_limit or estimated_gas or config.DEFAULT_GAS_LIMIT)
+
+    def _allocate_nonces(self, address: ChecksumAddress, number: int) -> List[Nonce]:
+        nonce_manager = self.skale.tx_nonce_manager
+        if nonce_manager is not None:
+            return nonce_manager.allocate_many(address, number)
+        first_nonce = get_eth_nonce(self.skale.web3, address)
+        return [Nonce(first_nonce + index) for index in range(number)]
+
+    def _send(self, queue: List[QueuedTx], gas_limits: List[int]) -> List[HexStr]:
+        if not queue:
+            return []
+        address = self.skale.wallet.address
+        nonce_manager = self.skale.tx_nonce_manager
+        fees = resolve_fees(self.skale, gas_price=self.gas_price)
+        nonces = self._allocate_nonces(address, len(queue))
+        tx_hashes: List[HexStr] = []
+        try:
+            for tx, gas_limit, nonce in zip(queue, gas_limits, nonces):
+                tx_dict = transaction_from_method(
+                    method=tx.method,
+                    gas_limit=gas_limit,
+                    nonce=nonce,
+                    value=tx.value,
+                    **fees.as_kwargs()
+                )
+                tx_hashes.append(self.skale.wallet.sign_and_send(
+                    tx_dict,
+                    multiplier=self.multiplier,
+                    priority=self.priority,
+                    method=tx.name
+                ))
+                if nonce_manager is not None:
+                    nonce_manager.complete(address)
+        except Exception:
+            logger.error('Pipeline interrupted, sent transactions: %s', tx_hashes)
+            if nonce_manager is not None:
+                for nonce in reversed(nonces[len(tx_hashes):]):
+                    nonce_manager.release(address, nonce)
+            raise
+        return tx_hashes
+
+    def _wait(self, tx_hashes: List[HexStr]) -> List[TxReceipt]:
+        if not tx_hashes:
+            return []
+        receipts = self.skale.wallet.wait_many(tx_hashes)
+        if self.confirmation_blocks > 0:
+            wait_for_confirmation_blocks(self.skale.web3, self.confirmation_blocks)
+        return receipts
+
+    def execute(self) -> List[TxRes]:
+        """
+        Sends queued transactions and returns TxRes for each of them.
+        Transactions with failed dry run are not sent.
+        If raise_for_status is set, the first failure is raised
+        after all sent transactions are mined.
+        """
+        queue, self._queue = self._queue, []
+        with suspend_block_session(self.skale.web3):
+            call_results = self._dry_run(queue)
+
+            to_send = [
+                index for index, call_result in enumerate(call_results)
+                if call_result is None or call_result.status == TxStatus.SUCCESS
+            ]
+            gas_limits = [
+                self._get_gas_limit(queue[index], call_results[index])
+                for index in to_send
+            ]
+            tx_hashes = self._send([queue[index] for index in to_send], gas_limits)
+            receipts: List[TxReceipt | None] = [None] * len(tx_hashes)
+            if self.wait_for:
+                receipts = list(self._wait(tx_hashes))
+
+        sent = {
+            index: (tx_hash, receipt)
+            for index, tx_hash, receipt in zip(to_send, tx_hashes, receipts)
+        }
+        self.results = [
+            TxRes(call_result, *sent.get(index, (None, None)))
+            for index, call_result in enumerate(call_results)
+        ]
+        if self.raise_for_status:
+            for tx_res in self.results:
+                tx_res.raise_for_status()
+        return self.results
@@ -17,7 +17,7 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import NewType, TypedDict
+from typing import List, NewType, TypedDict
 
 from eth_typing import ChecksumAddress
 from web3.types import Wei
@@ -40,3 +40,8 @@ class Validator(TypedDict):
 
 class ValidatorWithId(Validator):
     id: ValidatorId
+
+
+class ValidatorSnapshot(ValidatorWithId):
+    linked_addresses: List[ChecksumAddress]
+    bond_amount: Wei
@@ -27,13 +27,13 @@ from eth_typing import ChecksumAddress
 from web3 import Web3
 from web3.types import TxReceipt, Wei
 
+from skale.transactions.fee_oracle import Fees, get_fee_oracle
 from skale.transactions.result import TxRes
 from skale.transactions.tools import compose_eth_transfer_tx
 from skale.utils.constants import LONG_LINE
 from skale.wallets import LedgerWallet, Web3Wallet
 from skale.utils.web3_utils import (
     check_receipt,
-    default_gas_price,
     wait_for_confirmation_blocks
 )
 
@@ -103,15 +103,14 @@ def send_eth(
         f'{receiver_address}'
     )
     wei_amount = web3.to_wei(amount, 'ether')
-    gas_price = gas_price or default_gas_price(web3)
+    fees = Fees(gas_price=Wei(gas_price)) if gas_price else get_fee_oracle(web3).get_fees()
     tx = compose_eth_transfer_tx(
         web3,
         wallet.address,
         receiver_address,
         wei_amount,
-        gas_price=gas_price,
         *args,
-        **kwargs
+        **{**fees.as_kwargs(), **kwargs}
     )
     tx_hash = wallet.sign_and_send(
         tx,
@@ -0,0 +1,478 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE.py
+#
+#   Copyright (C) 2019-Present SKALE Labs
+#
+#   SKALE.py is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   SKALE.py is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
+""" SKALE JSON-RPC batch utilities """
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import Context, copy_context
+from functools import partial
+from typing import (
+    Any, Callable, Dict, Iterator, List, NamedTuple, Protocol, Sequence, TypeVar, cast
+)
+
+from eth_abi.exceptions import DecodingError
+from eth_typing import URI
+from requests.exceptions import ConnectionError, HTTPError, Timeout, TooManyRedirects
+from web3 import HTTPProvider, Web3, WebsocketProvider
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.contracts import parse_block_identifier
+from web3._utils.encoding import Web3JsonEncoder
+from web3._utils.method_formatters import (
+    get_error_formatters,
+    get_null_result_formatters,
+    get_request_formatters,
+    get_result_formatters
+)
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.request import make_post_request
+from web3.contract.contract import ContractFunction
+from web3.exceptions import BadFunctionCallOutput
+from web3.manager import RequestManager
+from web3.middleware.exception_retry_request import check_if_retry_on_failure
+from web3.providers.base import JSONBaseProvider
+from web3.types import BlockIdentifier, RPCEndpoint, RPCResponse
+
+import skale.config as config
+from skale.utils.web3_utils import check_client, get_block_session
+
+
+logger = logging.getLogger(__name__)
+
+
+T = TypeVar('T')
+
+BATCH_RETRY_ERRORS = (ConnectionError, HTTPError, Timeout, TooManyRedirects)
+BATCH_RETRIES = 5
+BATCH_RETRY_BACKOFF = 0.3
+
+
+class BatchNotExecutedError(Exception):
+    """Raised when result of the batched call is requested before the batch execution"""
+
+
+class RpcRequest(NamedTuple):
+    method: RPCEndpoint
+    params: Any
+
+
+def chunks(items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    for pos in range(0, len(items), size):
+        yield items[pos:pos + size]
+
+
+def iter_pages(
+        fetch_page: Callable[[int, int], Sequence[T]],
+        total: int | None = None,
+        page_size: int | None = None,
+        prefetch: bool = True
+) -> Iterator[T]:
+    """
+    Yields items of the collection fetched by pages of page_size items.
+    fetch_page(offset, limit) returns items of the page. If total is unknown
+    iteration stops after the first incomplete page.
+    With prefetch the next page is requested in the background
+    while the current one is consumed.
+    All pages are fetched in the context of the iter_pages call,
+    so the block session active at that moment is applied to them.
+    """
+    return _iter_pages(
+        fetch_page,
+        copy_context(),
+        total=total,
+        page_size=page_size or config.ITER_PAGE_SIZE,
+        prefetch=prefetch
+    )
+
+
+def _iter_pages(
+        fetch_page: Callable[[int, int], Sequence[T]],
+        context: Context,
+        total: int | None,
+        page_size: int,
+        prefetch: bool
+) -> Iterator[T]:
+    def limit_at(offset: int) -> int:
+        if total is None:
+            return page_size
+        return max(min(page_size, total - offset), 0)
+
+    def fetch(offset: int, limit: int) -> Sequence[T]:
+        # context can't be entered twice, so every page gets its copy
+        return context.copy().run(fetch_page, offset, limit)
+
+    if not prefetch:
+        offset = 0
+        while limit_at(offset) > 0:
+            page = fetch(offset, limit_at(offset))
+            yield from page
+            if len(page) < limit_at(offset):
+                return
+            offset += len(page)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    def submit(offset: int) -> Future[Sequence[T]] | None:
+        limit = limit_at(offset)
+        if limit == 0:
+            return None
+        return executor.submit(fetch, offset, limit)
+
+    try:
+        offset = 0
+        future = submit(offset)
+        while future is not None:
+            page = future.result()
+            limit = limit_at(offset)
+            offset += len(page)
+            future = submit(offset) if len(page) == limit else None
+            yield from page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _send_batch(provider: JSONBaseProvider, payload: List[Dict[str, Any]]) -> Any:
+    request_data = json.dumps(payload, cls=Web3JsonEncoder).encode('utf-8')
+    if isinstance(provider, HTTPProvider):
+        raw_response = make_post_request(
+            cast(URI, provider.endpoint_uri),
+            request_data,
+            **provider.get_request_kwargs()
+        )
+        return provider.decode_rpc_response(raw_response)
+    if isinstance(provider, WebsocketProvider):
+        future = asyncio.run_coroutine_threadsafe(
+            provider.coro_make_request(request_data),
+            cast(asyncio.AbstractEventLoop, WebsocketProvider._loop)
+        )
+        return future.result()
+    return None
+
+
+def _send_with_retry(requests: Sequence[RpcRequest], send: Callable[[], Any]) -> Any:
+    # the same policy as http_retry_request_middleware has for single requests
+    retry = all(check_if_retry_on_failure(request.method) for request in requests)
+    retries = BATCH_RETRIES if retry else 1
+    for attempt in range(retries):
+        try:
+            return send()
+        except BATCH_RETRY_ERRORS:
+            if attempt == retries - 1:
+                raise
+            time.sleep(BATCH_RETRY_BACKOFF)
+
+
+def _make_chunk_request(
+        web3: Web3,
+        requests: Sequence[RpcRequest]
+) -> List[RPCResponse]:
+    provider = cast(JSONBaseProvider, web3.provider)
+    payload = [
+        {
+            'jsonrpc': '2.0',
+            'method': request.method,
+            'params': request.params,
+            'id': next(provider.request_counter)
+        }
+        for request in requests
+    ]
+    try:
+        response = _send_with_retry(requests, partial(_send_batch, provider, payload))
+    except BATCH_RETRY_ERRORS as e:
+        logger.warning('Batch request to %s failed: %s, sending sequentially', provider, e)
+        response = None
+    if isinstance(response, list) and len(response) == len(payload):
+        by_id = {item.get('id'): item for item in response}
+        if all(item['id'] in by_id for item in payload):
+            return [by_id[item['id']] for item in payload]
+
+    if response is not None:
+        logger.debug('Batch requests are not supported by %s, sending sequentially', provider)
+    # responses are kept raw, the same as the batch ones
+    return [
+        _send_with_retry(
+            [request],
+            partial(provider.make_request, request.method, request.params)
+        )
+        for request in requests
+    ]
+
+
+def _get_formatter(formatter: Any) -> Callable[[Any], Any]:
+    # web3 formatters are curried functions annotated with the mapping type
+    return cast(Callable[[Any], Any], formatter)
+
+
+def make_batch_request(
+        web3: Web3,
+        requests: Sequence[RpcRequest],
+        chunk_size: int | None = None,
+        workers: int | None = None
+) -> List[RPCResponse]:
+    """
+    Sends requests as JSON-RPC batches of at most chunk_size items,
+    up to workers batches are sent concurrently over HTTP.
+    Raw responses are returned in the order of requests.
+    Batches are sent directly to the provider after the client checks of web3 middlewares,
+    failed batches are retried for the methods retried by the web3 retry middleware.
+    If the provider or the node doesn't support batches or the batch keeps failing,
+    requests are sent to the provider one by one.
+    """
+    chunk_size = chunk_size or config.BATCH_CHUNK_SIZE
+    workers = workers or config.BATCH_WORKERS
+    provider = cast(JSONBaseProvider, web3.provider)
+    for method in {request.method for request in requests}:
+        check_client(web3, method)
+    formatted_requests = [
+        RpcRequest(request.method, _get_formatter(get_request_formatters(request.method))(
+            request.params
+        ))
+        for request in requests
+    ]
+    requests_chunks = list(chunks(formatted_requests, chunk_size))
+    responses: List[RPCResponse] = []
+    if workers > 1 and len(requests_chunks) > 1 and isinstance(provider, HTTPProvider):
+        with ThreadPoolExecutor(max_workers=min(workers, len(requests_chunks))) as executor:
+            for chunk_responses in executor.map(
+                lambda requests_chunk: _make_chunk_request(web3, requests_chunk),
+                requests_chunks
+            ):
+                responses.extend(chunk_responses)
+    else:
+        for requests_chunk in requests_chunks:
+            responses.extend(_make_chunk_request(web3, requests_chunk))
+    return responses
+
+
+def format_batch_response(web3: Web3, request: RpcRequest, response: RPCResponse) -> Any:
+    result = RequestManager.formatted_response(
+        response,
+        request.params,
+        get_error_formatters(request.method),
+        get_null_result_formatters(request.method)
+    )
+    return _get_formatter(get_result_formatters(request.method, web3.eth))(result)
+
+
+def batch_request(
+        web3: Web3,
+        requests: Sequence[RpcRequest],
+        chunk_size: int | None = None,
+        return_exceptions: bool = False,
+        workers: int | None = None
+) -> List[Any]:
+    """
+    Executes requests using JSON-RPC batches and returns formatted results.
+    If return_exceptions is True errors are returned in place of failed results,
+    otherwise the first error is raised.
+    """
+    responses = make_batch_request(web3, requests, chunk_size=chunk_size, workers=workers)
+    results = []
+    for request, response in zip(requests, responses):
+        try:
+            results.append(format_batch_response(web3, request, response))
+        except Exception as e:
+            if not return_exceptions:
+                raise e
+            results.append(e)
+    return results
+
+
+def compose_call_request(
+        function: ContractFunction,
+        block_identifier: BlockIdentifier | None = None
+) -> RpcRequest:
+    transaction = function._get_call_txparams()
+    transaction['data'] = function._encode_transaction_data()
+    if block_identifier is None:
+        session = get_block_session(function.w3)
+        if session is not None:
+            block_identifier = session.block_number
+    if block_identifier is None:
+        block_identifier = function.w3.eth.default_block
+    block_id = parse_block_identifier(function.w3, block_identifier)
+    return RpcRequest(RPCEndpoint('eth_call'), [transaction, block_id])
+
+
+def decode_call_result(function: ContractFunction, return_data: bytes) -> Any:
+    output_types = get_abi_output_types(function.abi)
+    try:
+        output_data = function.w3.codec.decode(output_types, return_data)
+    except DecodingError as e:
+        raise BadFunctionCallOutput(
+            f'Could not decode contract function call to {function.fn_name} '
+            f'with return data: {str(return_data)}, output_types: {output_types}'
+        ) from e
+    normalizers = itertools.chain(
+        BASE_RETURN_NORMALIZERS,
+        function._return_data_normalizers or tuple()
+    )
+    normalized_data = map_abi_data(normalizers, output_types, output_data)
+    if len(normalized_data) == 1:
+        return normalized_data[0]
+    return normalized_data
+
+
+def batch_call(
+        web3: Web3,
+        functions: Sequence[ContractFunction],
+        block_identifier: BlockIdentifier | None = None,
+        chunk_size: int | None = None,
+        return_exceptions: bool = False,
+        workers: int | None = None
+) -> List[Any]:
+    """
+    Executes contract function calls using JSON-RPC batches of eth_call requests.
+    Results are decoded the same way as ContractFunction.call() does it.
+    Calls are pinned to the block of the active block session if there is one.
+    """
+    requests = [
+        compose_call_request(function, block_identifier)
+        for function in functions
+    ]
+    raw_results = batch_request(
+        web3,
+        requests,
+        chunk_size=chunk_size,
+        return_exceptions=return_exceptions,
+        workers=workers
+    )
+    results = []
+    for function, raw_result in zip(functions, raw_results):
+        if isinstance(raw_result, Exception):
+            results.append(raw_result)
+            continue
+        try:
+            results.append(decode_call_result(function, raw_result))
+        except BadFunctionCallOutput as e:
+            if not return_exceptions:
+                raise e
+            results.append(e)
+    return results
+
+
+class BatchFuture:
+    """Result of the contract call that is resolved after the batch execution"""
+
+    def __init__(self, function: ContractFunction) -> None:
+        self.function = function
+        self._done = False
+        self._result: Any = None
+        self._exception: Exception | None = None
+
+    def __repr__(self) -> str:
+        state = 'done' if self._done else 'pending'
+        return f'BatchFuture({self.function.fn_name}, {state})'
+
+    def done(self) -> bool:
+        return self._done
+
+    def set_result(self, result: Any) -> None:
+        self._result, self._done = result, True
+
+    def set_exception(self, exception: Exception) -> None:
+        self._exception, self._done = exception, True
+
+    def result(self) -> Any:
+        if not self._done:
+            raise BatchNotExecutedError(
+                f'{self.function.fn_name} call result is not available before batch execution'
+            )
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+
+class ContractFunctionFactory(Protocol):
+    def function(self, *args: Any, **kwargs: Any) -> ContractFunction:
+        ...
+
+
+class CallBatch:
+    """Collects contract calls and executes them using JSON-RPC batches"""
+
+    def __init__(
+            self,
+            web3: Web3,
+            block_identifier: BlockIdentifier | None = None,
+            chunk_size: int | None = None
+    ) -> None:
+        self.web3 = web3
+        self.block_identifier = block_identifier
+        self.chunk_size = chunk_size
+        self._futures: List[BatchFuture] = []
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def add(self, function: ContractFunction) -> BatchFuture:
+        future = BatchFuture(function)
+        self._futures.append(future)
+        return future
+
+    def call(
+            self,
+            function: ContractFunction | ContractFunctionFactory,
+            *args: Any,
+            **kwargs: Any
+    ) -> BatchFuture:
+        """
+        Defers the contract read until the batch execution.
+        function is either a contract function with arguments
+        or a contract fallback method followed by its arguments.
+        """
+        if not isinstance(function, ContractFunction):
+            function = function.function(*args, **kwargs)
+        return self.add(function)
+
+    def execute(self) -> None:
+        futures, self._futures = self._futures, []
+        if not futures:
+            return
+        logger.debug('Executing batch of %d calls', len(futures))
+        results = batch_call(
+            self.web3,
+            [future.function for future in futures],
+            block_identifier=self.block_identifier,
+            chunk_size=self.chunk_size,
+            return_exceptions=True
+        )
+        for future, result in zip(futures, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+@contextmanager
+def call_batch_context(
+        web3: Web3,
+        block_identifier: BlockIdentifier | None = None,
+        chunk_size: int | None = None
+) -> Iterator[CallBatch]:
+    call_batch = CallBatch(web3, block_identifier=block_identifier, chunk_size=chunk_size)
+    yield call_batch
+    call_batch.execute()
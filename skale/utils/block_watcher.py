@@ -0,0 +1,264 @@
+#   -*- coding: utf-8 -*-
+#
+#   This file is part of SKALE.py
+#
+#   Copyright (C) 2019-Present SKALE Labs
+#
+#   SKALE.py is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU Affero General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   SKALE.py is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU Affero General Public License for more details.
+#
+#   You should have received a copy of the GNU Affero General Public License
+#   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
+""" SKALE shared block watcher for transaction receipts """
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import weakref
+from collections import defaultdict
+from concurrent.futures import Future, wait as wait_futures
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Set, cast
+
+from eth_typing import HexStr
+from hexbytes import HexBytes
+from web3 import Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.types import RPCEndpoint, TxReceipt, _Hash32
+
+from skale.transactions.exceptions import TransactionNotMinedError
+from skale.utils.batch_utils import RpcRequest, batch_request
+from skale.utils.web3_utils import DEFAULT_BLOCKS_TO_WAIT, MAX_WAITING_TIME, BlockTimeTracker
+
+
+logger = logging.getLogger(__name__)
+
+
+MAX_BLOCKS_PER_POLL = 32
+# receipt futures are expired by the watcher thread, the margin covers its slow polls
+WAIT_TIMEOUT_MARGIN = 60
+
+
+@dataclass
+class ReceiptWaiter:
+    future: Future[TxReceipt]
+    blocks_to_wait: int
+    deadline: float
+    last_block: int | None = None
+
+
+@dataclass
+class WatcherState:
+    waiters: Dict[HexStr, List[ReceiptWaiter]] = field(default_factory=lambda: defaultdict(list))
+    unchecked: Set[HexStr] = field(default_factory=set)
+
+
+class BlockWatcher:
+    """
+    Waits for receipts of many transactions with a single background thread.
+    Each new block is fetched once with eth_getBlockReceipts
+    (pending receipts are requested directly if the node doesn't support it)
+    and all transactions found in it are resolved.
+    The thread is started on demand and stops when there is nothing to wait for.
+    """
+
+    def __init__(self, web3: Web3) -> None:
+        self._web3_ref = weakref.ref(web3)
+        self.block_receipts_supported: bool | None = None
+        self._state = WatcherState()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_block: int | None = None
+
+    @property
+    def web3(self) -> Web3:
+        web3 = self._web3_ref()
+        if web3 is None:
+            raise ReferenceError('Web3 instance of the block watcher was destroyed')
+        return web3
+
+    def watch(
+            self,
+            txs: Iterable[_Hash32],
+            blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
+            timeout: int = MAX_WAITING_TIME
+    ) -> List[Future[TxReceipt]]:
+        """Registers transactions, returns futures resolved with their receipts"""
+        deadline = time.monotonic() + (timeout or MAX_WAITING_TIME)
+        futures = []
+        with self._lock:
+            for tx in txs:
+                tx_hash = HexStr(HexBytes(tx).hex())
+                waiter = ReceiptWaiter(
+                    Future(),
+                    blocks_to_wait or DEFAULT_BLOCKS_TO_WAIT,
+                    deadline
+                )
+                self._state.waiters[tx_hash].append(waiter)
+                self._state.unchecked.add(tx_hash)
+                futures.append(waiter.future)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        return futures
+
+    def wait_many(
+            self,
+            txs: Sequence[_Hash32],
+            blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
+            timeout: int = MAX_WAITING_TIME
+    ) -> List[TxReceipt]:
+        futures = self.watch(txs, blocks_to_wait, timeout)
+        _, not_done = wait_futures(
+            futures,
+            timeout=(timeout or MAX_WAITING_TIME) + WAIT_TIMEOUT_MARGIN
+        )
+        receipts = []
+        for tx, future in zip(txs, futures):
+            if future in not_done:
+                raise TransactionNotMinedError(
+                    f'Transaction with hash: {HexBytes(tx).hex()} '
+                    'was not resolved by the block watcher in time.'
+                )
+            receipts.append(future.result())
+        return receipts
+
+    def wait(
+            self,
+            tx: _Hash32,
+            blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
+            timeout: int = MAX_WAITING_TIME
+    ) -> TxReceipt:
+        return self.wait_many([tx], blocks_to_wait, timeout)[0]
+
+    def _run(self) -> None:
+        # the thread keeps web3 alive only while there are transactions to wait for
+        web3 = self.web3
+        tracker = BlockTimeTracker(web3)
+        while True:
+            with self._lock:
+                has_unchecked = bool(self._state.unchecked)
+            current_block = None
+            try:
+                current_block = web3.eth.block_number
+                if tracker.observe(current_block) or has_unchecked:
+                    self._process(current_block)
+            except Exception:
+                logger.exception('Block watcher poll failed')
+            self._expire(current_block)
+            with self._lock:
+                if not self._state.waiters:
+                    self._thread, self._last_block = None, None
+                    return
+            self._wakeup.wait(tracker.poll_interval())
+            self._wakeup.clear()
+
+    def _process(self, current_block: int) -> None:
+        with self._lock:
+            unchecked, self._state.unchecked = self._state.unchecked, set()
+            pending = set(self._state.waiters) - unchecked
+            for tx_hash in unchecked:
+                for waiter in self._state.waiters.get(tx_hash, []):
+                    if waiter.last_block is None:
+                        waiter.last_block = current_block + waiter.blocks_to_wait
+        receipts = self._get_receipts(unchecked)
+        if pending and self._last_block is not None and current_block > self._last_block:
+            receipts.update(self._get_new_blocks_receipts(
+                range(self._last_block + 1, current_block + 1),
+                pending
+            ))
+        self._last_block = current_block
+        self._resolve(receipts)
+
+    def _get_new_blocks_receipts(
+            self,
+            blocks: range,
+            pending: Set[HexStr]
+    ) -> Dict[HexStr, TxReceipt]:
+        if self.block_receipts_supported is False or len(blocks) > MAX_BLOCKS_PER_POLL:
+            return self._get_receipts(pending)
+        requests = [
+            RpcRequest(RPCEndpoint('eth_getBlockReceipts'), [hex(block)])
+            for block in blocks
+        ]
+        results = batch_request(self.web3, requests, return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            if self.block_receipts_supported is None:
+                logger.info('eth_getBlockReceipts is not available: %s', errors[0])
+                self.block_receipts_supported = False
+            return self._get_receipts(pending)
+        self.block_receipts_supported = True
+        receipts = {}
+        for block_receipts in results:
+            for receipt in block_receipts or []:
+                tx_hash = HexStr(receipt['transactionHash'].lower())
+                if tx_hash in pending:
+                    receipts[tx_hash] = self._format_receipt(receipt_formatter(receipt))
+        return receipts
+
+    def _get_receipts(self, tx_hashes: Set[HexStr]) -> Dict[HexStr, TxReceipt]:
+        if not tx_hashes:
+            return {}
+        hashes = list(tx_hashes)
+        requests = [
+            RpcRequest(RPCEndpoint('eth_getTransactionReceipt'), [tx_hash])
+            for tx_hash in hashes
+        ]
+        results = batch_request(self.web3, requests, return_exceptions=True)
+        return {
+            tx_hash: self._format_receipt(receipt)
+            for tx_hash, receipt in zip(hashes, results)
+            if receipt is not None and not isinstance(receipt, Exception)
+        }
+
+    @staticmethod
+    def _format_receipt(receipt: TxReceipt) -> TxReceipt:
+        return cast(TxReceipt, AttributeDict.recursive(receipt))
+
+    def _resolve(self, receipts: Dict[HexStr, TxReceipt]) -> None:
+        with self._lock:
+            for tx_hash, receipt in receipts.items():
+                for waiter in self._state.waiters.pop(tx_hash, []):
+                    waiter.future.set_result(receipt)
+
+    def _expire(self, current_block: int | None) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for tx_hash, waiters in list(self._state.waiters.items()):
+                for waiter in list(waiters):
+                    blocks_passed = waiter.last_block is not None and \
+                        current_block is not None and current_block > waiter.last_block
+                    if blocks_passed or now > waiter.deadline:
+                        waiters.remove(waiter)
+                        waiter.future.set_exception(TransactionNotMinedError(
+                            f'Transaction with hash: {tx_hash} not found '
+                            f'in {waiter.blocks_to_wait} blocks.'
+                        ))
+                if not waiters:
+                    del self._state.waiters[tx_hash]
+
+
+_watchers: weakref.WeakKeyDictionary[Web3, BlockWatcher] = weakref.WeakKeyDictionary()
+_watchers_lock = threading.Lock()
+
+
+def get_block_watcher(web3: Web3) -> BlockWatcher:
+    """Returns block watcher shared by all users of the web3 instance"""
+    with _watchers_lock:
+        watcher = _watchers.get(web3)
+        if watcher is None:
+            watcher = _watchers[web3] = BlockWatcher(web3)
+        return watcher
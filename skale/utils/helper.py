@@ -20,6 +20,7 @@
 
 from __future__ import annotations
 
+import functools
 import ipaddress
 import json
 import logging
@@ -29,7 +30,9 @@ import string
 import sys
 from logging import Formatter, StreamHandler
 from random import randint
-from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, Iterable, List, cast
+
+from Crypto.Hash import keccak
 
 from skale.config import ENV
 from skale.types.node import Port
@@ -42,6 +45,9 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+NAME_TO_ID_CACHE_SIZE = 4096
+
+
 def decapitalize(s: str) -> str:
     return s[:1].lower() + s[1:] if s else ''
 
@@ -224,6 +230,16 @@ def get_contracts_info(
     return contracts_info
 
 
+@functools.lru_cache(maxsize=NAME_TO_ID_CACHE_SIZE)
+def name_to_id(name: str) -> bytes:
+    """Returns keccak256 digest of the name, results are memoized"""
+    return keccak.new(data=name.encode('utf8'), digest_bits=256).digest()
+
+
+def names_to_ids(names: Iterable[str]) -> List[bytes]:
+    return [name_to_id(name) for name in names]
+
+
 def to_camel_case(snake_str: str) -> str:
     components = snake_str.split('_')
     return components[0] + ''.join(x.title() for x in components[1:])
@@ -20,20 +20,29 @@
 
 import logging
 import os
+import threading
 import time
-from typing import Any, Callable, Dict, Iterable
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
 from urllib.parse import urlparse
 
 from eth_keys.main import lazy_key_api as keys
 from eth_typing import Address, AnyAddress, BlockNumber, ChecksumAddress, HexStr
-from web3 import Web3, WebsocketProvider, HTTPProvider
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3, WebsocketProvider, HTTPProvider
 from web3.exceptions import TransactionNotFound
-from web3.middleware.attrdict import attrdict_middleware
-from web3.middleware.exception_retry_request import http_retry_request_middleware
-from web3.middleware.geth_poa import geth_poa_middleware
+from web3.middleware.attrdict import async_attrdict_middleware, attrdict_middleware
+from web3.middleware.exception_retry_request import (
+    async_http_retry_request_middleware,
+    http_retry_request_middleware
+)
+from web3.middleware.geth_poa import async_geth_poa_middleware, geth_poa_middleware
 from web3.providers.base import JSONBaseProvider
 from web3.types import (
     _Hash32,
+    AsyncMiddlewareCoroutine,
     ENS,
     Middleware,
     Nonce,
@@ -89,6 +98,253 @@ class BlockWaitTimeoutError(Exception):
     pass
 
 
+CLIENT_CHECK_SKIPPED_METHODS = {
+    RPCEndpoint('eth_blockNumber'),
+    RPCEndpoint('eth_getBlockByNumber')
+}
+
+BLOCK_PINNED_METHODS = {
+    RPCEndpoint('eth_call'): 1,
+    RPCEndpoint('eth_getBalance'): 1,
+    RPCEndpoint('eth_getCode'): 1,
+    RPCEndpoint('eth_getStorageAt'): 2
+}
+
+
+class BlockSession:
+    """
+    Read session pinned to the particular block.
+    Results of eth_call requests made in the session are immutable
+    so they are cached by (address, calldata) for the session lifetime.
+    """
+
+    def __init__(self, block_number: BlockNumber) -> None:
+        self.block_number = block_number
+        self.cache: Dict[Tuple[str, str], RPCResponse] = {}
+
+    def __repr__(self) -> str:
+        return f'BlockSession(block_number={self.block_number})'
+
+
+_block_sessions: ContextVar[Mapping[Web3, BlockSession]] = ContextVar(
+    'block_sessions',
+    default={}
+)
+
+
+def get_block_session(web3: Web3) -> BlockSession | None:
+    """Returns block session for the web3 instance active in the current context"""
+    return _block_sessions.get().get(web3)
+
+
+def get_pinned_block_number(
+        web3: Web3,
+        block_number: BlockNumber | None = None
+) -> BlockNumber | None:
+    """
+    Returns provided block number or the block of the active block session.
+    None means the latest block, it's not requested to avoid an extra RPC call.
+    """
+    if block_number is not None:
+        return block_number
+    session = get_block_session(web3)
+    if session is not None:
+        return session.block_number
+    return None
+
+
+@contextmanager
+def block_session(web3: Web3, block_number: BlockNumber | None = None) -> Iterator[BlockSession]:
+    """
+    Pins all reads made with the web3 instance in the current context to block_number.
+    If block_number is not provided the block of the active session
+    or the latest block is used.
+    """
+    active_session = get_block_session(web3)
+    if block_number is None and active_session is not None:
+        yield active_session
+        return
+    if block_number is None:
+        block_number = web3.eth.block_number
+    session = BlockSession(block_number)
+    token = _block_sessions.set({**_block_sessions.get(), web3: session})
+    try:
+        yield session
+    finally:
+        _block_sessions.reset(token)
+
+
+@contextmanager
+def suspend_block_session(web3: Web3) -> Iterator[None]:
+    """
+    Unpins requests made with the web3 instance in the current context.
+    Used for sending transactions, they are dry-run and priced against the latest state.
+    """
+    sessions = _block_sessions.get()
+    if web3 not in sessions:
+        yield
+        return
+    token = _block_sessions.set({
+        session_web3: session
+        for session_web3, session in sessions.items()
+        if session_web3 is not web3
+    })
+    try:
+        yield
+    finally:
+        _block_sessions.reset(token)
+
+
+def _call_cache_key(params: Any) -> Tuple[str, str] | None:
+    if len(params) != 2 or not isinstance(params[0], dict):
+        return None
+    transaction = params[0]
+    if set(transaction) - {'to', 'data', 'from'}:
+        return None
+    return str(transaction.get('to')).lower(), str(transaction.get('data'))
+
+
+class CallCache:
+    """
+    Middleware that caches eth_call results keyed by block, target and calldata.
+    Results for the latest block are dropped as soon as a new block is observed.
+    The latest block number is sampled at most once per block_check_interval seconds.
+    """
+
+    def __init__(
+            self,
+            max_size: int | None = None,
+            block_check_interval: float | None = None
+    ) -> None:
+        self.max_size = max_size or config.CALL_CACHE_SIZE
+        if block_check_interval is None:
+            block_check_interval = config.CALL_CACHE_BLOCK_CHECK_INTERVAL
+        self.block_check_interval = block_check_interval
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Tuple[Any, ...], RPCResponse] = OrderedDict()
+        self._block_number: int | None = None
+        self._block_checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f'CallCache(size={len(self)}, hits={self.hits}, misses={self.misses})'
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _observe_block(self, block_number: int) -> None:
+        with self._lock:
+            self._block_checked_at = time.monotonic()
+            if self._block_number is not None and block_number <= self._block_number:
+                return
+            self._block_number = block_number
+            for key in [key for key in self._entries if key[0] == 'latest']:
+                del self._entries[key]
+
+    def _latest_block_number(
+            self,
+            make_request: Callable[[RPCEndpoint, Any], RPCResponse]
+    ) -> int | None:
+        if self._block_number is None or \
+                time.monotonic() - self._block_checked_at >= self.block_check_interval:
+            response = make_request(RPCEndpoint('eth_blockNumber'), [])
+            if 'result' not in response:
+                return None
+            self._observe_block(int(response['result'], 16))
+        return self._block_number
+
+    def _get_key(
+            self,
+            params: Any,
+            make_request: Callable[[RPCEndpoint, Any], RPCResponse]
+    ) -> Tuple[Any, ...] | None:
+        if len(params) != 2 or not isinstance(params[0], dict):
+            return None
+        transaction, block = params
+        call_key = tuple(sorted((key, str(value)) for key, value in transaction.items()))
+        if block == 'latest':
+            block_number = self._latest_block_number(make_request)
+            if block_number is None:
+                return None
+            return ('latest', block_number, call_key)
+        if isinstance(block, str) and block.startswith('0x'):
+            return (block, call_key)
+        return None
+
+    def _get(self, key: Tuple[Any, ...]) -> RPCResponse | None:
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return response
+
+    def _put(self, key: Tuple[Any, ...], response: RPCResponse) -> None:
+        with self._lock:
+            if key[0] == 'latest' and key[1] != self._block_number:
+                return
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __call__(
+            self,
+            make_request: Callable[[RPCEndpoint, Any], RPCResponse],
+            web3: Web3
+    ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method == 'eth_blockNumber':
+                response = make_request(method, params)
+                if 'result' in response:
+                    self._observe_block(int(response['result'], 16))
+                return response
+            if method != 'eth_call':
+                return make_request(method, params)
+
+            key = self._get_key(params, make_request)
+            if key is None:
+                return make_request(method, params)
+            cached_response = self._get(key)
+            if cached_response is not None:
+                return cached_response
+            response = make_request(method, params)
+            if 'error' not in response:
+                self._put(key, response)
+            return response
+        return middleware
+
+
+def block_session_middleware(
+        make_request: Callable[[RPCEndpoint, Any], RPCResponse],
+        web3: Web3
+) -> Callable[[RPCEndpoint, Any], RPCResponse]:
+    def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+        session = get_block_session(web3)
+        block_index = BLOCK_PINNED_METHODS.get(method)
+        if session is None or block_index is None or len(params) <= block_index \
+                or params[block_index] != 'latest':
+            return make_request(method, params)
+
+        params = list(params)
+        params[block_index] = hex(session.block_number)
+        cache_key = _call_cache_key(params) if method == 'eth_call' else None
+        if cache_key is not None and cache_key in session.cache:
+            return session.cache[cache_key]
+        response = make_request(method, params)
+        if cache_key is not None and 'error' not in response:
+            session.cache[cache_key] = response
+        return response
+    return middleware
+
+
 def get_last_known_block_number(state_path: str) -> int:
     if not os.path.isfile(state_path):
         return 0
@@ -97,8 +353,10 @@ def get_last_known_block_number(state_path: str) -> int:
 
 
 def save_last_known_block_number(state_path: str, block_number: int) -> None:
-    with open(state_path, 'w') as last_block_file:
+    tmp_path = f'{state_path}.tmp'
+    with open(tmp_path, 'w') as last_block_file:
         last_block_file.write(str(block_number))
+    os.replace(tmp_path, state_path)
 
 
 def outdated_client_time_msg(
@@ -122,72 +380,156 @@ def outdated_client_file_msg(
         saved_number: {saved_number}, state_path: {state_path}'
 
 
-def make_client_checking_middleware(
-        allowed_ts_diff: int,
-        state_path: str | None = None
-) -> Callable[
-    [Callable[[RPCEndpoint, Any], RPCResponse], Web3],
-    Callable[[RPCEndpoint, Any], RPCResponse]
-]:
-    def eth_client_checking_middleware(
+class ClientChecker:
+    """
+    Middleware that rejects requests if the eth client is outdated.
+    The latest block is sampled at most once per check_interval seconds,
+    the cached block timestamp is checked against the current time on every request.
+    The state file is checked on each sample and rewritten only when the block advances.
+    """
+
+    def __init__(
+            self,
+            allowed_ts_diff: int,
+            state_path: str | None = None,
+            check_interval: float | None = None
+    ) -> None:
+        self.allowed_ts_diff = allowed_ts_diff
+        self.state_path = state_path
+        if check_interval is None:
+            check_interval = config.CLIENT_CHECK_INTERVAL
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._latest_block: Dict[str, Any] = {}
+        self._sampled_at = 0.0
+        self._saved_block_number = -1
+
+    def _is_time_outdated(self, block: Mapping[str, Any], current_time: float) -> bool:
+        ts_diff: float = current_time - block['timestamp']
+        if not is_test_env():
+            ts_diff = abs(ts_diff)
+        return ts_diff > self.allowed_ts_diff
+
+    def _observe_latest_block(
+            self,
+            block: Mapping[str, Any],
+            method: RPCEndpoint
+    ) -> Mapping[str, Any]:
+        if self.state_path:
+            saved_number = get_last_known_block_number(self.state_path)
+            if block['number'] < saved_number:
+                raise EthClientOutdatedError(outdated_client_file_msg(
+                    method,
+                    block['number'],
+                    saved_number,
+                    self.state_path
+                ))
+            if block['number'] > max(saved_number, self._saved_block_number):
+                save_last_known_block_number(self.state_path, block['number'])
+                self._saved_block_number = block['number']
+        self._latest_block = {'number': block['number'], 'timestamp': block['timestamp']}
+        self._sampled_at = time.monotonic()
+        return self._latest_block
+
+    def _get_sampled_block(self) -> Mapping[str, Any] | None:
+        block: Mapping[str, Any] = self._latest_block
+        sample_age = time.monotonic() - self._sampled_at
+        if not block or not 0 <= sample_age < self.check_interval or \
+                self._is_time_outdated(block, time.time()):
+            return None
+        return block
+
+    def _check_block(self, block: Mapping[str, Any], method: RPCEndpoint) -> None:
+        current_time = time.time()
+        if self._is_time_outdated(block, current_time):
+            raise EthClientOutdatedError(outdated_client_time_msg(
+                method,
+                current_time,
+                block['timestamp'],
+                self.allowed_ts_diff
+            ))
+
+    def check(self, web3: Web3, method: RPCEndpoint) -> None:
+        """Raises EthClientOutdatedError if the client of web3 is outdated"""
+        with self._lock:
+            block = self._get_sampled_block()
+            if block is None:
+                block = self._observe_latest_block(web3.eth.get_block('latest'), method)
+        self._check_block(block, method)
+
+    async def async_check(self, web3: AsyncWeb3, method: RPCEndpoint) -> None:
+        """Async version of check, the latest block is requested without holding the lock"""
+        with self._lock:
+            block = self._get_sampled_block()
+        if block is None:
+            latest_block = await web3.eth.get_block('latest')
+            with self._lock:
+                block = self._observe_latest_block(latest_block, method)
+        self._check_block(block, method)
+
+    def __call__(
+            self,
             make_request: Callable[[RPCEndpoint, Any], RPCResponse],
             web3: Web3
     ) -> Callable[[RPCEndpoint, Any], RPCResponse]:
         def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
-            if method in ('eth_block_number', 'eth_getBlockByNumber'):
-                response = make_request(method, params)
-            else:
-                latest_block = web3.eth.get_block('latest')
-                current_time = time.time()
-
-                ts_diff = current_time - latest_block['timestamp']
-                if not is_test_env():
-                    ts_diff = abs(ts_diff)
-
-                if ts_diff > allowed_ts_diff:
-                    raise EthClientOutdatedError(outdated_client_time_msg(
-                        method,
-                        current_time,
-                        latest_block['timestamp'],
-                        allowed_ts_diff
-                    ))
-
-                if state_path:
-                    saved_number = get_last_known_block_number(state_path)
-                    if latest_block['number'] < saved_number:
-                        raise EthClientOutdatedError(outdated_client_file_msg(
-                            method,
-                            latest_block['number'],
-                            saved_number,
-                            state_path
-                        ))
-                    save_last_known_block_number(state_path,
-                                                 latest_block['number'])
-                response = make_request(method, params)
+            if method not in CLIENT_CHECK_SKIPPED_METHODS:
+                self.check(web3, method)
+            return make_request(method, params)
+        return middleware
+
+    async def async_middleware(
+            self,
+            make_request: Callable[[RPCEndpoint, Any], Any],
+            web3: AsyncWeb3
+    ) -> AsyncMiddlewareCoroutine:
+        async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method not in CLIENT_CHECK_SKIPPED_METHODS:
+                await self.async_check(web3, method)
+            response: RPCResponse = await make_request(method, params)
             return response
         return middleware
-    return eth_client_checking_middleware
+
+
+def make_client_checking_middleware(
+        allowed_ts_diff: int,
+        state_path: str | None = None,
+        check_interval: float | None = None
+) -> ClientChecker:
+    return ClientChecker(allowed_ts_diff, state_path, check_interval)
+
+
+def check_client(web3: Web3, method: RPCEndpoint) -> None:
+    """
+    Runs client checks of the web3 middlewares.
+    Used for requests that are sent bypassing the middlewares, e.g. JSON-RPC batches.
+    """
+    if method in CLIENT_CHECK_SKIPPED_METHODS:
+        return
+    for middleware, _ in web3.middleware_onion.middlewares:
+        if isinstance(middleware, ClientChecker):
+            middleware.check(web3, method)
 
 
 def init_web3(endpoint: str,
               provider_timeout: int = DEFAULT_HTTP_TIMEOUT,
               middlewares: Iterable[Middleware] | None = None,
-              state_path: str | None = None, ts_diff: int | None = None) -> Web3:
+              state_path: str | None = None, ts_diff: int | None = None,
+              call_cache: CallCache | None = None) -> Web3:
     if not middlewares:
         ts_diff = ts_diff or config.ALLOWED_TS_DIFF
         state_path = state_path or config.LAST_BLOCK_FILE
+        middewares: list[Middleware] = [http_retry_request_middleware]
+        # call cache is added inside the client check, so cached calls are checked too
+        if call_cache is not None:
+            middewares.append(call_cache)
         if not ts_diff == config.NO_SYNC_TS_DIFF:
             sync_middleware = make_client_checking_middleware(ts_diff, state_path)
-            middewares = [
-                http_retry_request_middleware,
-                sync_middleware,
-                attrdict_middleware
-            ]
-        else:
-            middewares = [
-                http_retry_request_middleware,
-                attrdict_middleware
-            ]
+            middewares.append(sync_middleware)
+        middewares.extend([
+            block_session_middleware,
+            attrdict_middleware
+        ])
 
     provider = get_provider(endpoint, timeout=provider_timeout)
     web3 = Web3(provider)
@@ -198,6 +540,81 @@ def init_web3(endpoint: str,
     return web3
 
 
+def init_async_web3(
+        endpoint: str,
+        provider_timeout: int = DEFAULT_HTTP_TIMEOUT,
+        state_path: str | None = None,
+        ts_diff: int | None = None
+) -> AsyncWeb3:
+    scheme = urlparse(endpoint).scheme
+    if scheme not in ('http', 'https'):
+        raise ValueError(
+            'Wrong endpoint option.'
+            'Supported endpoint schemes for async web3: http/https'
+        )
+    ts_diff = ts_diff or config.ALLOWED_TS_DIFF
+    state_path = state_path or config.LAST_BLOCK_FILE
+    provider = AsyncHTTPProvider(endpoint, request_kwargs={'timeout': provider_timeout})
+    web3 = AsyncWeb3(provider)
+    web3.middleware_onion.inject(async_geth_poa_middleware, layer=0)
+    web3.middleware_onion.add(async_http_retry_request_middleware)
+    if not ts_diff == config.NO_SYNC_TS_DIFF:
+        client_checker = make_client_checking_middleware(ts_diff, state_path)
+        web3.middleware_onion.add(client_checker.async_middleware)
+    web3.middleware_onion.add(async_attrdict_middleware)
+    return web3
+
+
+_block_times: weakref.WeakKeyDictionary[Web3, float] = weakref.WeakKeyDictionary()
+
+
+class BlockTimeTracker:
+    """
+    Tracks new blocks observed by polling and estimates the block time,
+    so the next poll is made when the next block is expected.
+    If the block is late, the poll interval grows exponentially.
+    The estimation is shared between trackers of the same web3 instance.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        min_interval: float | None = None,
+        max_interval: float | None = None
+    ) -> None:
+        self.web3 = web3
+        self.min_interval = min_interval or config.BLOCK_POLL_MIN_INTERVAL
+        self.max_interval = max_interval or config.BLOCK_POLL_MAX_INTERVAL
+        self.last_block: int | None = None
+        self.last_block_seen_at = time.monotonic()
+        self.misses = 0
+
+    @property
+    def block_time(self) -> float | None:
+        return _block_times.get(self.web3)
+
+    def observe(self, block_number: int) -> bool:
+        """Accounts polled block number, returns True if the block is new"""
+        now = time.monotonic()
+        if self.last_block is not None and block_number <= self.last_block:
+            self.misses += 1
+            return False
+        if self.last_block is not None:
+            interval = (now - self.last_block_seen_at) / (block_number - self.last_block)
+            block_time = self.block_time
+            _block_times[self.web3] = interval if block_time is None \
+                else 0.7 * block_time + 0.3 * interval
+        self.last_block, self.last_block_seen_at, self.misses = block_number, now, 0
+        return True
+
+    def poll_interval(self) -> float:
+        block_time = self.block_time
+        if block_time is not None and self.misses == 0:
+            expected = block_time - (time.monotonic() - self.last_block_seen_at)
+            return max(self.min_interval, min(expected, self.max_interval))
+        return min(self.min_interval * 2.0 ** self.misses, self.max_interval)
+
+
 def get_receipt(web3: Web3, tx: _Hash32) -> TxReceipt:
     return web3.eth.get_transaction_receipt(tx)
 
@@ -212,23 +629,45 @@ def wait_for_receipt_by_blocks(
     blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
     timeout: int = MAX_WAITING_TIME
 ) -> TxReceipt:
+    return wait_for_receipts_by_blocks(web3, [tx], blocks_to_wait, timeout)[0]
+
+
+def wait_for_receipts_by_blocks(
+    web3: Web3,
+    txs: Sequence[_Hash32],
+    blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
+    timeout: int = MAX_WAITING_TIME
+) -> List[TxReceipt]:
+    """
+    Waits for receipts of all transactions.
+    Pending receipts are requested once per new block,
+    block number is polled according to the observed block time.
+    """
     blocks_to_wait = blocks_to_wait or DEFAULT_BLOCKS_TO_WAIT
     timeout = timeout or MAX_WAITING_TIME
-    previous_block = web3.eth.block_number
-    current_block = previous_block
+    receipts: Dict[int, TxReceipt] = {}
+    pending = dict(enumerate(txs))
+    tracker = BlockTimeTracker(web3)
+    start_block = current_block = web3.eth.block_number
     wait_start_time = time.time()
     while time.time() - wait_start_time < timeout and \
-            current_block <= previous_block + blocks_to_wait:
-        try:
-            receipt = get_receipt(web3, tx)
-        except TransactionNotFound:
-            receipt = None
-        if receipt is not None:
-            return receipt
+            current_block <= start_block + blocks_to_wait:
+        if tracker.observe(current_block):
+            for index, tx in list(pending.items()):
+                try:
+                    receipt = get_receipt(web3, tx)
+                except TransactionNotFound:
+                    continue
+                if receipt is not None:
+                    receipts[index] = receipt
+                    del pending[index]
+            if not pending:
+                return [receipts[index] for index in range(len(txs))]
+        time.sleep(tracker.poll_interval())
         current_block = web3.eth.block_number
-        time.sleep(3)
     raise TransactionNotMinedError(
-        f'Transaction with hash: {str(tx)} not found in {blocks_to_wait} blocks.'
+        f'Transactions with hashes: {[str(tx) for tx in pending.values()]} '
+        f'not found in {blocks_to_wait} blocks.'
     )
 
 
@@ -268,11 +707,14 @@ def wait_for_confirmation_blocks(
         f'Current block number is {current_block}, '
         f'waiting for {blocks_to_wait} confimration blocks to be mined'
     )
+    tracker = BlockTimeTracker(web3, max_interval=request_timeout)
+    tracker.observe(current_block)
     wait_start_time = time.time()
     while time.time() - wait_start_time < timeout and \
             current_block <= start_block + blocks_to_wait:
+        time.sleep(tracker.poll_interval())
         current_block = web3.eth.block_number
-        time.sleep(request_timeout)
+        tracker.observe(current_block)
 
 
 def private_key_to_public(pr: HexStr) -> HexStr:
@@ -296,5 +738,13 @@ def to_checksum_address(address: AnyAddress | str | bytes) -> ChecksumAddress:
     return Web3.to_checksum_address(address)
 
 
+def adjust_gas_price(gas_price: int) -> int:
+    return gas_price * GAS_PRICE_COEFFICIENT
+
+
 def default_gas_price(web3: Web3) -> int:
-    return web3.eth.gas_price * GAS_PRICE_COEFFICIENT
+    return adjust_gas_price(web3.eth.gas_price)
+
+
+async def async_default_gas_price(web3: AsyncWeb3) -> int:
+    return adjust_gas_price(await web3.eth.gas_price)
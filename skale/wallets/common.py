@@ -18,7 +18,7 @@
 #   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from eth_account.datastructures import SignedMessage, SignedTransaction
 from eth_typing import ChecksumAddress, HexStr
@@ -44,6 +44,9 @@ class MessageNotSignedError(Exception):
 
 
 class BaseWallet(ABC):
+    # nonces of the sent transactions are assigned by the wallet backend
+    external_nonces: bool = False
+
     @abstractmethod
     def sign(self, tx_dict: TxParams) -> SignedTransaction:
         pass
@@ -75,3 +78,10 @@ class BaseWallet(ABC):
     @abstractmethod
     def wait(self, tx: _Hash32, confirmation_blocks: int = DEFAULT_BLOCKS_TO_WAIT) -> TxReceipt:
         pass
+
+    def wait_many(
+        self,
+        txs: Sequence[_Hash32],
+        confirmation_blocks: int = DEFAULT_BLOCKS_TO_WAIT
+    ) -> List[TxReceipt]:
+        return [self.wait(tx, confirmation_blocks) for tx in txs]
@@ -19,7 +19,7 @@
 
 import logging
 import struct
-from typing import Generator, Tuple, cast
+from typing import Generator, List, Sequence, Tuple, cast
 
 from eth_typing import ChecksumAddress, HexStr
 from hexbytes import HexBytes
@@ -41,13 +41,13 @@ from web3.types import _Hash32, TxParams, TxReceipt
 
 import skale.config as config
 from skale.transactions.exceptions import TransactionNotSentError, TransactionNotSignedError
+from skale.utils.block_watcher import get_block_watcher
 from skale.utils.web3_utils import (
     DEFAULT_BLOCKS_TO_WAIT,
     MAX_WAITING_TIME,
     get_eth_nonce,
     public_key_to_address,
-    to_checksum_address,
-    wait_for_receipt_by_blocks
+    to_checksum_address
 )
 from skale.wallets.common import BaseWallet, ensure_chain_id
 
@@ -234,13 +234,24 @@ class LedgerWallet(BaseWallet):
             blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
             timeout: int = MAX_WAITING_TIME
     ) -> TxReceipt:
-        return wait_for_receipt_by_blocks(
-            self._web3,
+        return get_block_watcher(self._web3).wait(
             tx_hash,
             blocks_to_wait=blocks_to_wait,
             timeout=timeout
         )
 
+    def wait_many(
+            self,
+            tx_hashes: Sequence[_Hash32],
+            blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
+            timeout: int = MAX_WAITING_TIME
+    ) -> List[TxReceipt]:
+        return get_block_watcher(self._web3).wait_many(
+            tx_hashes,
+            blocks_to_wait=blocks_to_wait,
+            timeout=timeout
+        )
+
 
 def hardware_sign_and_send(
         web3: Web3,
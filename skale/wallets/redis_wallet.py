@@ -23,11 +23,15 @@ import logging
 import os
 import time
 from enum import Enum
-from typing import Optional, Tuple, TypedDict
+from typing import (
+    Any, Callable, Dict, Iterable, List, NoReturn, Optional, Sequence, Tuple, TypedDict, cast
+)
 
 from eth_account.datastructures import SignedMessage, SignedTransaction
 from eth_typing import ChecksumAddress, HexStr
 from redis import Redis
+from redis.client import Pipeline, PubSub
+from redis.exceptions import RedisError, ResponseError
 from web3 import Web3
 from web3.types import _Hash32, TxParams, TxReceipt
 
@@ -74,6 +78,19 @@ class TxRecordStatus(str, Enum):
         return str.__str__(self)
 
 
+class TxRecordFormat(str, Enum):
+    """
+    JSON records store all fields as a single JSON value.
+    HASH records are redis hashes, so status can be read without the tx params.
+    The transaction manager processing the pool should support the chosen format.
+    """
+    JSON = 'json'
+    HASH = 'hash'
+
+
+FINAL_STATUSES = (TxRecordStatus.DROPPED, TxRecordStatus.SUCCESS, TxRecordStatus.FAILED)
+
+
 TxRecord = TypedDict(
     'TxRecord',
     {
@@ -83,18 +100,27 @@ TxRecord = TypedDict(
 )
 
 
+def is_finished(record: Optional[TxRecord]) -> bool:
+    return record is not None and record.get('status') in FINAL_STATUSES
+
+
 class RedisWalletAdapter(BaseWallet):
     ID_SIZE = 16
+    MIN_POLL_INTERVAL = 0.05
+    MAX_POLL_INTERVAL = 1.0
+    external_nonces = True
 
     def __init__(
         self,
         rs: Redis,
         pool: str,
         web3_wallet: Web3Wallet,
+        record_format: TxRecordFormat | str | None = None
     ) -> None:
         self.rs = rs
         self.pool = pool
         self.wallet = web3_wallet
+        self.record_format = TxRecordFormat(record_format or config.TXRECORD_FORMAT)
 
     def sign(self, tx: TxParams) -> SignedTransaction:
         return self.wallet.sign(tx)
@@ -143,6 +169,27 @@ class RedisWalletAdapter(BaseWallet):
         record = json.dumps(params).encode('utf-8')
         return tx_id, record
 
+    @classmethod
+    def _make_record_fields(
+        cls,
+        tx: TxParams,
+        score: int,
+        multiplier: float = config.DEFAULT_GAS_MULTIPLIER,
+        method: Optional[str] = None
+    ) -> Tuple[bytes, Dict[str, str]]:
+        tx_id = cls._make_raw_id()
+        # Ensure gas will be restimated in TM
+        params = {**tx, 'gas': None}
+        fields = {
+            'status': 'PROPOSED',
+            'score': str(score),
+            'multiplier': str(multiplier),
+            'tx_hash': '',
+            'method': method or '',
+            'tx': json.dumps(params)
+        }
+        return tx_id, fields
+
     @classmethod
     def _to_raw_id(cls, tx_id: _Hash32) -> bytes:
         if isinstance(tx_id, str):
@@ -160,41 +207,170 @@ class RedisWalletAdapter(BaseWallet):
         priority: Optional[int] = None,
         method: Optional[str] = None
     ) -> HexStr:
+        return self.sign_and_send_many(
+            [tx],
+            multiplier=multiplier,
+            priority=priority,
+            method=method
+        )[0]
+
+    def sign_and_send_many(
+        self,
+        txs: Sequence[TxParams],
+        multiplier: Optional[float] = None,
+        priority: Optional[int] = None,
+        method: Optional[str] = None
+    ) -> List[HexStr]:
+        """Adds all transactions to the pool using a single redis pipeline"""
         priority = priority or config.DEFAULT_PRIORITY
         try:
-            logger.info('Sending %s to redis pool, method: %s', tx, method)
-            score = self._make_score(priority)
-            raw_id, tx_record = self._make_record(
-                tx,
-                score,
-                multiplier=multiplier or config.DEFAULT_GAS_MULTIPLIER,
-                method=method
-            )
             pipe = self.rs.pipeline()
-            logger.info('Adding tx %s to the pool', raw_id)
-            pipe.zadd(self.pool, {raw_id: score})
-            logger.info('Saving tx %s record: %s', raw_id, tx_record)
-            pipe.set(raw_id, tx_record, ex=config.TXRECORD_EXPIRATION)
+            raw_ids = []
+            for tx in txs:
+                logger.info('Sending %s to redis pool, method: %s', tx, method)
+                score = self._make_score(priority)
+                raw_id = self._add_record(
+                    pipe,
+                    tx,
+                    score,
+                    multiplier=multiplier or config.DEFAULT_GAS_MULTIPLIER,
+                    method=method
+                )
+                logger.info('Adding tx %s to the pool', raw_id)
+                pipe.zadd(self.pool, {raw_id: score})
+                raw_ids.append(raw_id)
             pipe.execute()
-            return self._to_id(raw_id)
+            return [self._to_id(raw_id) for raw_id in raw_ids]
         except Exception as err:
-            logger.exception(f'Sending {tx} with redis wallet errored')
+            logger.exception(f'Sending {txs} with redis wallet errored')
             raise RedisWalletNotSentError(err)
 
+    def _add_record(
+        self,
+        pipe: Pipeline,
+        tx: TxParams,
+        score: int,
+        multiplier: float,
+        method: Optional[str]
+    ) -> bytes:
+        if self.record_format == TxRecordFormat.HASH:
+            raw_id, fields = self._make_record_fields(tx, score, multiplier, method)
+            logger.info('Saving tx %s record: %s', raw_id, fields)
+            # redis accepts bytes keys, the client annotation is narrower
+            pipe.hset(cast(str, raw_id), mapping=fields)
+            pipe.expire(raw_id, config.TXRECORD_EXPIRATION)
+        else:
+            raw_id, tx_record = self._make_record(tx, score, multiplier, method)
+            logger.info('Saving tx %s record: %s', raw_id, tx_record)
+            pipe.set(raw_id, tx_record, ex=config.TXRECORD_EXPIRATION)
+        return raw_id
+
     def get_status(self, tx_id: _Hash32) -> str:
         return self.get_record(tx_id)['status']
 
+    @classmethod
+    def _parse_record(cls, response: bytes) -> TxRecord:
+        parsed_json = json.loads(response.decode('utf-8'))
+        return TxRecord({
+            'status': parsed_json['status'],
+            'tx_hash': parsed_json['tx_hash']
+        })
+
+    @classmethod
+    def _parse_record_fields(
+        cls,
+        status: Optional[bytes],
+        tx_hash: Optional[bytes]
+    ) -> Optional[TxRecord]:
+        if status is None:
+            return None
+        return TxRecord({
+            'status': cast(TxRecordStatus, status.decode('utf-8')),
+            'tx_hash': cast(HexStr, tx_hash.decode('utf-8') if tx_hash else None)
+        })
+
     def get_record(self, tx_id: _Hash32) -> TxRecord:
         rid = self._to_raw_id(tx_id)
+        if self.record_format == TxRecordFormat.HASH:
+            record = self._get_hash_records([rid])[0]
+            if record is not None:
+                return record
+            raise ValueError('Record was not found', tx_id)
         response = self.rs.get(rid)
         if isinstance(response, bytes):
-            parsed_json = json.loads(response.decode('utf-8'))
-            return TxRecord({
-                'status': parsed_json['status'],
-                'tx_hash': parsed_json['tx_hash']
-            })
+            return self._parse_record(response)
         raise ValueError('Unknown value was returned from get() call', response)
 
+    def get_records(self, tx_ids: Sequence[_Hash32]) -> List[Optional[TxRecord]]:
+        """Reads records with a single round trip, None is returned for missing records"""
+        if not tx_ids:
+            return []
+        raw_ids = [self._to_raw_id(tx_id) for tx_id in tx_ids]
+        if self.record_format == TxRecordFormat.HASH:
+            return self._get_hash_records(raw_ids)
+        responses = cast(List[Optional[bytes]], self.rs.mget(raw_ids))
+        return [
+            self._parse_record(response) if isinstance(response, bytes) else None
+            for response in responses
+        ]
+
+    def _get_hash_records(self, raw_ids: List[bytes]) -> List[Optional[TxRecord]]:
+        """
+        Reads status and tx_hash fields of hash records.
+        Records stored as JSON values are read with a single MGET afterwards.
+        """
+        pipe = self.rs.pipeline(transaction=False)
+        for raw_id in raw_ids:
+            pipe.hmget(cast(str, raw_id), ['status', 'tx_hash'])
+        responses = cast(Callable[..., List[Any]], pipe.execute)(raise_on_error=False)
+        records: List[Optional[TxRecord]] = []
+        legacy = []
+        for index, response in enumerate(responses):
+            if isinstance(response, ResponseError):
+                legacy.append(index)
+                records.append(None)
+            else:
+                records.append(self._parse_record_fields(*response))
+        if legacy:
+            legacy_responses = cast(
+                List[Optional[bytes]],
+                self.rs.mget([raw_ids[index] for index in legacy])
+            )
+            for index, response in zip(legacy, legacy_responses):
+                if isinstance(response, bytes):
+                    records[index] = self._parse_record(response)
+        return records
+
+    def _keyspace_channel(self, raw_id: bytes) -> bytes:
+        db = self.rs.connection_pool.connection_kwargs.get('db', 0)
+        return f'__keyspace@{db}__:'.encode('utf-8') + raw_id
+
+    def _subscribe(self, tx_ids: Iterable[_Hash32]) -> PubSub | None:
+        """
+        Subscribes to keyspace notifications of the records.
+        Notifications are sent only if the server has notify-keyspace-events
+        with K$ flags (Kh for hash records) enabled, otherwise waiting relies on polling.
+        """
+        try:
+            pubsub = cast(Callable[..., PubSub], self.rs.pubsub)(ignore_subscribe_messages=True)
+            cast(Callable[..., None], pubsub.subscribe)(*[
+                self._keyspace_channel(self._to_raw_id(tx_id))
+                for tx_id in tx_ids
+            ])
+            return pubsub
+        except (RedisError, ValueError):
+            logger.warning('Subscription to tx records updates failed, polling is used')
+            return None
+
+    @staticmethod
+    def _wait_for_update(pubsub: PubSub | None, timeout: float) -> bool:
+        """Blocks until a record is updated or the timeout, returns True if notified"""
+        if pubsub is None:
+            time.sleep(timeout)
+            return False
+        message = pubsub.get_message(timeout=timeout)
+        return isinstance(message, dict) and message.get('type') == 'message'
+
     def wait(
         self,
         tx_id: _Hash32,
@@ -203,27 +379,84 @@ class RedisWalletAdapter(BaseWallet):
     ) -> TxReceipt:
         start_ts = time.time()
         status, result = None, None
-        while status not in [
-            TxRecordStatus.DROPPED,
-            TxRecordStatus.SUCCESS,
-            TxRecordStatus.FAILED
-        ] and time.time() - start_ts < timeout:
-            try:
-                record = self.get_record(tx_id)
-                if record is not None:
-                    status = record.get('status')
-                    if status in (TxRecordStatus.SUCCESS, TxRecordStatus.FAILED):
-                        result = get_receipt(self.wallet._web3, record['tx_hash'])
-            except Exception as e:
-                logger.exception('Waiting for tx %s errored', tx_id)
-                raise RedisWalletWaitError(e)
+        poll_interval = self.MIN_POLL_INTERVAL
+        pubsub = self._subscribe([tx_id])
+        try:
+            while True:
+                try:
+                    record = self.get_record(tx_id)
+                    if record is not None:
+                        status = record.get('status')
+                        if status in (TxRecordStatus.SUCCESS, TxRecordStatus.FAILED):
+                            result = get_receipt(self.wallet._web3, record['tx_hash'])
+                except Exception as e:
+                    logger.exception('Waiting for tx %s errored', tx_id)
+                    raise RedisWalletWaitError(e)
+                remaining = timeout - (time.time() - start_ts)
+                if status in FINAL_STATUSES or remaining <= 0:
+                    break
+                if not self._wait_for_update(pubsub, min(poll_interval, remaining)):
+                    poll_interval = min(poll_interval * 2, self.MAX_POLL_INTERVAL)
+        finally:
+            if pubsub is not None:
+                pubsub.close()
 
         if result:
             return result
+        self._raise_for_status(status)
 
+    @staticmethod
+    def _raise_for_status(status: Optional[str]) -> NoReturn:
         if status is None:
             raise RedisWalletEmptyStatusError(f'Tx status is {status}')
         elif status == TxRecordStatus.DROPPED:
             raise RedisWalletDroppedError('Tx was dropped after max retries')
         else:
             raise RedisWalletWaitError(f'Tx finished with status {status}')
+
+    def wait_many(
+        self,
+        tx_ids: Sequence[_Hash32],
+        blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
+        timeout: int = MAX_WAITING_TIME
+    ) -> List[TxReceipt]:
+        """
+        Waits for all transactions, pending records are read with a single MGET.
+        If any transaction is not finished successfully,
+        the first error is raised after the others are finished.
+        """
+        start_ts = time.time()
+        records: List[Optional[TxRecord]] = [None] * len(tx_ids)
+        pending = list(range(len(tx_ids)))
+        poll_interval = self.MIN_POLL_INTERVAL
+        pubsub = self._subscribe(tx_ids)
+        try:
+            while True:
+                try:
+                    updated = self.get_records([tx_ids[index] for index in pending])
+                except Exception as e:
+                    logger.exception('Waiting for txs %s errored', tx_ids)
+                    raise RedisWalletWaitError(e)
+                for index, record in zip(pending, updated):
+                    records[index] = record
+                pending = [index for index in pending if not is_finished(records[index])]
+                remaining = timeout - (time.time() - start_ts)
+                if not pending or remaining <= 0:
+                    break
+                if not self._wait_for_update(pubsub, min(poll_interval, remaining)):
+                    poll_interval = min(poll_interval * 2, self.MAX_POLL_INTERVAL)
+        finally:
+            if pubsub is not None:
+                pubsub.close()
+
+        receipts = []
+        for tx_id, record in zip(tx_ids, records):
+            status = record.get('status') if record is not None else None
+            if record is None or status not in (TxRecordStatus.SUCCESS, TxRecordStatus.FAILED):
+                self._raise_for_status(status)
+            try:
+                receipts.append(get_receipt(self.wallet._web3, record['tx_hash']))
+            except Exception as e:
+                logger.exception('Waiting for tx %s errored', tx_id)
+                raise RedisWalletWaitError(e)
+        return receipts
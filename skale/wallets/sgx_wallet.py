@@ -18,7 +18,7 @@
 #   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
-from typing import Tuple, cast
+from typing import List, Sequence, Tuple, cast
 
 from eth_account.datastructures import SignedMessage, SignedTransaction
 from eth_typing import ChecksumAddress, HexStr
@@ -29,11 +29,11 @@ from web3.types import _Hash32, TxParams, TxReceipt
 
 import skale.config as config
 from skale.transactions.exceptions import TransactionNotSentError, TransactionNotSignedError
+from skale.utils.block_watcher import get_block_watcher
 from skale.utils.web3_utils import (
     DEFAULT_BLOCKS_TO_WAIT,
     MAX_WAITING_TIME,
-    get_eth_nonce,
-    wait_for_receipt_by_blocks
+    get_eth_nonce
 )
 from skale.wallets.common import BaseWallet, ensure_chain_id, MessageNotSignedError
 
@@ -128,9 +128,20 @@ class SgxWallet(BaseWallet):
             blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
             timeout: int = MAX_WAITING_TIME
     ) -> TxReceipt:
-        return wait_for_receipt_by_blocks(
-            self._web3,
+        return get_block_watcher(self._web3).wait(
             tx_hash,
             blocks_to_wait=blocks_to_wait,
             timeout=timeout
         )
+
+    def wait_many(
+            self,
+            tx_hashes: Sequence[_Hash32],
+            blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
+            timeout: int = MAX_WAITING_TIME
+    ) -> List[TxReceipt]:
+        return get_block_watcher(self._web3).wait_many(
+            tx_hashes,
+            blocks_to_wait=blocks_to_wait,
+            timeout=timeout
+        )
@@ -17,7 +17,7 @@
 #   You should have received a copy of the GNU Affero General Public License
 #   along with SKALE.py.  If not, see <https://www.gnu.org/licenses/>.
 
-from typing import cast
+from typing import List, Sequence, cast
 from eth_keys.main import lazy_key_api as keys
 from eth_keys.datatypes import PublicKey
 from web3 import Web3
@@ -32,11 +32,11 @@ from skale.transactions.exceptions import (
     TransactionNotSignedError,
     TransactionNotSentError
 )
+from skale.utils.block_watcher import get_block_watcher
 from skale.utils.web3_utils import (
     DEFAULT_BLOCKS_TO_WAIT,
     MAX_WAITING_TIME,
-    get_eth_nonce,
-    wait_for_receipt_by_blocks
+    get_eth_nonce
 )
 from skale.wallets.common import BaseWallet, ensure_chain_id, MessageNotSignedError
 
@@ -70,7 +70,7 @@ class Web3Wallet(BaseWallet):
         self._web3 = web3
 
     def sign(self, tx_dict: TxParams) -> SignedTransaction:
-        if not tx_dict.get('nonce'):
+        if tx_dict.get('nonce') is None:
             tx_dict['nonce'] = get_eth_nonce(self._web3, self._address)
         ensure_chain_id(tx_dict, self._web3)
         try:
@@ -126,13 +126,24 @@ class Web3Wallet(BaseWallet):
             blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
             timeout: int = MAX_WAITING_TIME
     ) -> TxReceipt:
-        return wait_for_receipt_by_blocks(
-            self._web3,
+        return get_block_watcher(self._web3).wait(
             tx_hash,
             blocks_to_wait=blocks_to_wait,
             timeout=timeout
         )
 
+    def wait_many(
+            self,
+            tx_hashes: Sequence[_Hash32],
+            blocks_to_wait: int = DEFAULT_BLOCKS_TO_WAIT,
+            timeout: int = MAX_WAITING_TIME
+    ) -> List[TxReceipt]:
+        return get_block_watcher(self._web3).wait_many(
+            tx_hashes,
+            blocks_to_wait=blocks_to_wait,
+            timeout=timeout
+        )
+
 
 def generate_wallet(web3: Web3) -> Web3Wallet:
     account = web3.eth.account.create()
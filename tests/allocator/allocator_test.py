@@ -1,4 +1,6 @@
 """ Tests for skale/allocator/allocator.py """
+from unittest import mock
+
 import pytest
 
 from skale.wallets.web3_wallet import generate_wallet
@@ -99,6 +101,50 @@ def test_get_all_plans(skale_allocator):
     assert plan_params_with_id == plans[0]
 
 
+def test_get_all_plans_cached(skale_allocator):
+    allocator = skale_allocator.allocator
+    block_number = skale_allocator.web3.eth.block_number
+    plans = allocator.get_all_plans(block_number)
+    assert [plan['planId'] for plan in plans] == list(range(1, len(plans) + 1))
+
+    with mock.patch.object(allocator, '_load_plans') as load_mock:
+        assert allocator.get_all_plans(block_number) == plans
+    load_mock.assert_not_called()
+
+    add_test_plan(skale_allocator)
+    new_plans = allocator.get_all_plans()
+    assert new_plans[:len(plans)] == plans
+    assert len(new_plans) == len(plans) + 1
+    assert new_plans[-1]['planId'] == len(new_plans)
+
+
+def test_get_all_plans_error(skale_allocator):
+    allocator = skale_allocator.allocator
+    block_number = skale_allocator.web3.eth.block_number + 1
+    error = ValueError({'code': -32000, 'message': 'header not found'})
+    with mock.patch(
+        'skale.contracts.allocator.allocator.batch_call',
+        return_value=[error]
+    ):
+        with pytest.raises(ValueError):
+            allocator.get_all_plans(block_number)
+    assert allocator._plans is None or allocator._plans[0] != block_number
+
+
+def test_iter_plans(skale_allocator):
+    allocator = skale_allocator.allocator
+    plans = allocator.get_all_plans()
+    with mock.patch.object(
+        allocator,
+        '_get_plans_range',
+        wraps=allocator._get_plans_range
+    ) as get_range_mock:
+        assert list(allocator.iter_plans(page_size=2)) == plans
+    block_numbers = {call.args[2] for call in get_range_mock.call_args_list}
+    assert len(block_numbers) == 1
+    assert block_numbers.pop() <= skale_allocator.web3.eth.block_number
+
+
 @pytest.mark.skip('test should be updated')
 def test_calculate_vested_amount(skale_allocator):
     wallet = generate_wallet(skale_allocator.web3)
@@ -32,6 +32,24 @@ def _delegate_via_escrow(skale_allocator, wallet):
     skale_allocator.wallet = main_wallet
 
 
+def test_for_beneficiary(skale_allocator):
+    main_wallet = skale_allocator.wallet
+    wallet = generate_wallet(skale_allocator.web3)
+    send_eth(skale_allocator.web3, main_wallet, wallet.address, 0.1)
+    connect_test_beneficiary(skale_allocator, D_PLAN_ID, wallet)
+
+    escrow = skale_allocator.escrow
+    contract = escrow.get_escrow_contract(wallet.address)
+    assert contract.address == skale_allocator.allocator.get_escrow_address(wallet.address)
+    assert escrow.get_escrow_contract(wallet.address) is contract
+
+    beneficiary_escrow = escrow.for_beneficiary(wallet.address)
+    assert beneficiary_escrow.contract is contract
+    assert escrow.contract is skale_allocator.allocator.contract
+    assert beneficiary_escrow.skale is escrow.skale
+    assert beneficiary_escrow._escrow_contracts is escrow._escrow_contracts
+
+
 def test_delegate(skale, skale_allocator):
     main_wallet = skale_allocator.wallet
     wallet = generate_wallet(skale_allocator.web3)
@@ -1,4 +1,6 @@
-from skale.utils.helper import format_fields, is_valid_ipv4_address
+from web3 import Web3
+
+from skale.utils.helper import format_fields, is_valid_ipv4_address, name_to_id, names_to_ids
 
 
 def test_format():
@@ -21,3 +23,13 @@ def test_is_valid_ipv4_address():
     assert is_valid_ipv4_address('257.1.1.1') is False
     assert is_valid_ipv4_address('saddas') is False
     assert is_valid_ipv4_address('0:0:0:0:0:0:0:0') is False
+
+
+def test_name_to_id():
+    assert name_to_id('test_schain') == Web3.keccak(text='test_schain')
+    hits = name_to_id.cache_info().hits
+    assert name_to_id('test_schain') == Web3.keccak(text='test_schain')
+    assert name_to_id.cache_info().hits == hits + 1
+
+    assert names_to_ids(['a', 'b']) == [Web3.keccak(text='a'), Web3.keccak(text='b')]
+    assert names_to_ids([]) == []
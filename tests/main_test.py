@@ -95,3 +95,21 @@ def test_skip_evm_time(skale):
     old_time = _skip_evm_time(skale.web3, 0, mine=False)
     new_time = _skip_evm_time(skale.web3, seconds, mine=False)
     assert new_time - (old_time + seconds) < ALLOWED_SKIP_TIME_GAP
+
+
+def test_at_block(skale):
+    rotation_delay = skale.constants_holder.get_rotation_delay()
+    try:
+        with skale.at_block() as session:
+            skale.constants_holder.set_rotation_delay(rotation_delay + 1)
+            assert session.block_number < skale.web3.eth.block_number
+            assert skale.constants_holder.get_rotation_delay() == rotation_delay
+            with skale.at_block(skale.web3.eth.block_number):
+                assert skale.constants_holder.get_rotation_delay() == rotation_delay + 1
+            assert skale.constants_holder.get_rotation_delay() == rotation_delay
+            # transactions are dry-run against the latest state
+            tx_res = skale.constants_holder.set_rotation_delay(rotation_delay + 2)
+            assert tx_res.receipt['status'] == 1
+        assert skale.constants_holder.get_rotation_delay() == rotation_delay + 2
+    finally:
+        skale.constants_holder.set_rotation_delay(rotation_delay)
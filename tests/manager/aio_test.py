@@ -0,0 +1,52 @@
+""" SKALE async manager test """
+
+import asyncio
+
+import pytest
+
+from skale import AsyncSkaleManager
+from skale.utils.contracts_provision import DEFAULT_DOMAIN_NAME
+from skale.utils.helper import get_skale_manager_address
+
+from tests.constants import DEFAULT_NODE_NAME, DEFAULT_SCHAIN_ID, ENDPOINT, TEST_ABI_FILEPATH
+
+
+@pytest.fixture
+def async_skale(skale):
+    return AsyncSkaleManager(
+        ENDPOINT,
+        get_skale_manager_address(TEST_ABI_FILEPATH),
+        skale.wallet
+    )
+
+
+def test_async_nodes(skale, async_skale, nodes):
+    node_id = skale.nodes.node_name_to_index(DEFAULT_NODE_NAME)
+    node, active_node_ids = asyncio.run(asyncio.gather(
+        async_skale.nodes.get(node_id),
+        async_skale.nodes.get_active_node_ids()
+    ))
+    assert node == skale.nodes.get(node_id)
+    assert active_node_ids == skale.nodes.get_active_node_ids()
+
+
+def test_async_schains(skale, async_skale, schain):
+    node_id = skale.nodes.node_name_to_index(DEFAULT_NODE_NAME)
+    schain_structure = asyncio.run(async_skale.schains.get(DEFAULT_SCHAIN_ID))
+    assert schain_structure == skale.schains.get(DEFAULT_SCHAIN_ID)
+
+    schains_for_node = asyncio.run(async_skale.schains.get_schains_for_node(node_id))
+    assert schains_for_node == skale.schains.get_schains_for_node(node_id)
+
+
+def test_async_fallback_call(skale, async_skale):
+    launch_timestamp = asyncio.run(async_skale.constants_holder.launch_timestamp())
+    assert launch_timestamp == skale.constants_holder.launch_timestamp()
+
+
+def test_async_transaction_method(skale, async_skale, nodes):
+    node_id = skale.nodes.node_name_to_index(DEFAULT_NODE_NAME)
+    tx_res = asyncio.run(async_skale.nodes.set_domain_name(node_id, 'async.skale.test'))
+    assert tx_res.receipt['status'] == 1
+    assert skale.nodes.get_domain_name(node_id) == 'async.skale.test'
+    skale.nodes.set_domain_name(node_id, DEFAULT_DOMAIN_NAME)
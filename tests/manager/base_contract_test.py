@@ -8,6 +8,7 @@ from skale.transactions.exceptions import TransactionNotSentError
 from skale.transactions.result import TxStatus
 from skale.transactions.tools import estimate_gas
 from skale.utils.account_tools import generate_account
+from skale.utils.batch_utils import BatchNotExecutedError
 from skale.utils.contracts_provision.utils import generate_random_schain_data
 from skale.utils.web3_utils import wait_for_receipt_by_blocks
 from tests.constants import TEST_GAS_LIMIT
@@ -190,3 +191,23 @@ def test_value_option(skale, nodes):
         )
     finally:
         skale.manager.delete_schain(name, wait_for=True)
+
+
+def test_batch_fallback_calls(skale, nodes, schain):
+    expected_active_nodes = skale.nodes.number_of_active_nodes()
+    expected_launch_ts = skale.constants_holder.launch_timestamp()
+    node_id = nodes[0]
+    expected_address = skale.nodes.get_node_address(node_id)
+    with skale.batch() as call_batch:
+        active_nodes = call_batch.call(skale.nodes.number_of_active_nodes)
+        launch_ts = call_batch.call(skale.constants_holder.contract.functions.launchTimestamp())
+        address = call_batch.call(skale.nodes.get_node_address, node_id)
+        assert skale.nodes.number_of_active_nodes() == expected_active_nodes
+        assert skale.schains.get_by_name(schain)['name'] == schain
+        assert len(call_batch) == 3
+        assert not active_nodes.done()
+        with pytest.raises(BatchNotExecutedError):
+            active_nodes.result()
+    assert active_nodes.result() == expected_active_nodes
+    assert launch_ts.result() == expected_launch_ts
+    assert address.result() == expected_address
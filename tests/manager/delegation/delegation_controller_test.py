@@ -133,6 +133,30 @@ def test_get_all_delegations_by_validator(skale, validator):
                 for delegation in delegations])
 
 
+def test_get_all_delegations(skale, validator):
+    delegation_ids = skale.delegation_controller._get_delegation_ids_by_validator(validator)
+    delegations = skale.delegation_controller.get_all_delegations(delegation_ids)
+    assert delegations == [
+        skale.delegation_controller.get_delegation_full(delegation_id)
+        for delegation_id in delegation_ids
+    ]
+    assert skale.delegation_controller.get_all_delegations([]) == []
+
+
+def test_iter_delegations(skale, validator):
+    delegations = skale.delegation_controller.iter_delegations(
+        validator_id=validator,
+        page_size=1
+    )
+    assert list(delegations) == \
+        skale.delegation_controller.get_all_delegations_by_validator(validator)
+    delegations = skale.delegation_controller.iter_delegations(address=skale.wallet.address)
+    assert list(delegations) == \
+        skale.delegation_controller.get_all_delegations_by_holder(skale.wallet.address)
+    with pytest.raises(ValueError):
+        skale.delegation_controller.iter_delegations()
+
+
 def test_accept_pending_delegation(skale, validator):
     validator_id = validator
     info = f'{D_DELEGATION_INFO}-{generate_random_name()}'
@@ -85,6 +85,36 @@ def test_number_of_validators(skale):
     assert n_of_validators_after == n_of_validators_before + 1
 
 
+def test_iter_validators(skale, validator):
+    validators = [
+        skale.validator_service.get_with_id(validator_id)
+        for validator_id in range(1, skale.validator_service.number_of_validators() + 1)
+    ]
+    assert list(skale.validator_service.iter_validators(page_size=1)) == validators
+    assert skale.validator_service.get_many([validator]) == [
+        skale.validator_service.get_with_id(validator)
+    ]
+    assert list(skale.validator_service.iter_validators(trusted_only=True)) == \
+        skale.validator_service.ls(trusted_only=True)
+
+
+def test_get_snapshot(skale, validator):
+    block_number = skale.web3.eth.block_number
+    snapshot = skale.validator_service.get_snapshot(block_identifier=block_number)
+    assert len(snapshot) == skale.validator_service.number_of_validators()
+    validator_snapshot = next(v for v in snapshot if v['id'] == validator)
+    assert validator_snapshot == {
+        **skale.validator_service.get_with_id(validator),
+        'linked_addresses': skale.validator_service.get_linked_addresses_by_validator_id(
+            validator
+        ),
+        'bond_amount': skale.validator_service.get_and_update_bond_amount(validator)
+    }
+    trusted_snapshot = skale.validator_service.get_snapshot(trusted_only=True)
+    assert [v['id'] for v in trusted_snapshot] == \
+        skale.validator_service.get_trusted_validator_ids()
+
+
 def test_ls(skale, validator):
     n_of_validators = skale.validator_service.number_of_validators()
     validators = sorted(
@@ -40,6 +40,65 @@ def test_get_leaving_history(skale):
         ]
 
 
+def test_get_leaving_histories(skale):
+    node_ids = [DEFAULT_SCHAIN_INDEX, DEFAULT_SCHAIN_INDEX + 1]
+    assert skale.node_rotation.get_leaving_histories(node_ids) == [
+        skale.node_rotation.get_leaving_history(node_id)
+        for node_id in node_ids
+    ]
+    assert skale.node_rotation.get_leaving_histories([]) == []
+
+    block_number = skale.web3.eth.block_number
+    with mock.patch.object(
+        skale.node_rotation,
+        'get_leaving_histories',
+        wraps=skale.node_rotation.get_leaving_histories
+    ) as histories_mock:
+        indexes = skale.node_rotation.get_leaving_history_indexes(
+            node_ids,
+            block_number=block_number
+        )
+    histories_mock.assert_called_once_with(node_ids, block_identifier=block_number)
+    histories = skale.node_rotation.get_leaving_histories(node_ids, block_identifier=block_number)
+    assert indexes == [
+        {swap['schain_id']: swap['finished_rotation'] for swap in reversed(history)}
+        for history in histories
+    ]
+
+
+def test_get_leaving_history_indexes(skale):
+    block_number = skale.web3.eth.block_number
+    indexes = skale.node_rotation.get_leaving_history_indexes(
+        [DEFAULT_SCHAIN_INDEX],
+        block_number=block_number
+    )
+    assert indexes == [{}]
+
+    with mock.patch('skale.contracts.manager.node_rotation.batch_call') as batch_call_mock:
+        assert skale.node_rotation.get_schain_finish_ts(
+            DEFAULT_SCHAIN_INDEX,
+            DEFAULT_SCHAIN_NAME,
+            block_number=block_number
+        ) is None
+        batch_call_mock.assert_not_called()
+
+    with mock.patch.object(
+        type(skale.web3.eth),
+        'block_number',
+        new_callable=mock.PropertyMock
+    ) as block_number_mock:
+        assert skale.node_rotation.get_leaving_history_indexes([DEFAULT_SCHAIN_INDEX]) == [{}]
+        assert skale.node_rotation.get_schain_finish_ts(
+            DEFAULT_SCHAIN_INDEX,
+            DEFAULT_SCHAIN_NAME
+        ) is None
+    block_number_mock.assert_not_called()
+
+
+def test_get_previous_nodes(skale):
+    assert skale.node_rotation.get_previous_nodes(DEFAULT_SCHAIN_NAME, [0, 1]) == [None, None]
+
+
 def test_is_rotation_in_progress(skale):
     assert skale.node_rotation.is_rotation_in_progress(DEFAULT_SCHAIN_NAME) is False
 
@@ -91,6 +91,22 @@ def test_get_active_node_ips(skale, nodes):
                for node_ip in active_node_ips])
 
 
+def test_get_node_statuses(skale, nodes):
+    statuses = skale.nodes.get_node_statuses(nodes)
+    assert statuses == [skale.nodes.get_node_status(node_id) for node_id in nodes]
+
+    with pytest.raises(InvalidNodeIdError):
+        skale.nodes.get_node_statuses([*nodes, NOT_EXISTING_ID])
+
+
+def test_get_many(skale, nodes):
+    assert skale.nodes.get_many(nodes) == [skale.nodes.get(node_id) for node_id in nodes]
+    assert skale.nodes.get_many([]) == []
+
+    with pytest.raises(InvalidNodeIdError):
+        skale.nodes.get_many([NOT_EXISTING_ID])
+
+
 def test_is_node_name_available(skale, nodes):
     node = skale.nodes.get_by_name(DEFAULT_NODE_NAME)
     unused_name = 'unused_name'
@@ -123,6 +139,15 @@ def test_get_node_public_key(skale, nodes, node_wallets):
         skale.nodes.get_node_public_key(NOT_EXISTING_ID)
 
 
+def test_get_node_public_keys(skale, nodes):
+    assert skale.nodes.get_node_public_keys(nodes) == [
+        skale.nodes.get_node_public_key(node_id)
+        for node_id in nodes
+    ]
+    with pytest.raises(InvalidNodeIdError):
+        skale.nodes.get_node_public_keys([NOT_EXISTING_ID])
+
+
 def test_node_in_maintenance(skale, nodes):
     node_id = skale.nodes.node_name_to_index(DEFAULT_NODE_NAME)
     assert skale.nodes.get_node_status(node_id) == NodeStatus.ACTIVE.value
@@ -1,6 +1,6 @@
 """ SKALE chain test """
 
-from dataclasses import fields
+from dataclasses import asdict, fields
 from hexbytes import HexBytes
 from web3 import Web3
 
@@ -59,6 +59,31 @@ def test_get_schains_for_node(skale, schain):
     assert node_id in schain_node_ids
 
 
+def get_schain_by_single_calls(skale, schain_id):
+    raw_schain = skale.schains_internal.get_raw(schain_id)
+    return SchainStructure(
+        **asdict(raw_schain),
+        chainId=skale.schains.name_to_id(raw_schain.name),
+        options=skale.schains.get_options(schain_id)
+    )
+
+
+def test_get_many(skale, schain):
+    schains_ids = skale.schains_internal.get_all_schains_ids()
+    schains = skale.schains.get_many(schains_ids, workers=2)
+    assert schains == [
+        get_schain_by_single_calls(skale, schain_id)
+        for schain_id in schains_ids
+    ]
+
+    node_id = skale.nodes.node_name_to_index(DEFAULT_NODE_NAME)
+    schains_for_node = skale.schains.get_active_schains_for_node(node_id, workers=2)
+    assert [s.name for s in schains_for_node] == [
+        skale.schains.get(schain_id).name
+        for schain_id in skale.schains_internal.get_active_schain_ids_for_node(node_id)
+    ]
+
+
 def test_name_to_id(skale):
     schain_id = skale.schains.name_to_id(DEFAULT_SCHAIN_NAME)
     assert schain_id == Web3.to_bytes(hexstr=DEFAULT_SCHAIN_ID)
@@ -70,6 +95,15 @@ def test_get_all_schains_ids(skale, schain):
     assert [field.name for field in fields(schain)] == FIELDS
 
 
+def test_iter_schains(skale, schain):
+    schains_ids = skale.schains_internal.get_all_schains_ids()
+    schains = list(skale.schains.iter_schains(page_size=1))
+    assert schains == [
+        get_schain_by_single_calls(skale, schain_id)
+        for schain_id in schains_ids
+    ]
+
+
 def test_get_schain_price(skale):
     schain_price = skale.schains.get_schain_price(1, LIFETIME_SECONDS)
     assert schain_price > 0
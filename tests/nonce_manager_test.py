@@ -0,0 +1,106 @@
+""" SKALE nonce manager test """
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from skale.transactions.nonce_manager import NonceManager, get_nonce_manager
+
+
+def test_reserve(skale):
+    address = skale.wallet.address
+    nonce_manager = NonceManager(skale.web3)
+    chain_nonce = skale.web3.eth.get_transaction_count(address, 'pending')
+
+    with nonce_manager.reserve(address) as nonce:
+        assert nonce == chain_nonce
+    with pytest.raises(ValueError):
+        with nonce_manager.reserve(address) as nonce:
+            raise ValueError('Transaction was not sent')
+    # released nonce is reused, nothing else is in flight
+    assert nonce_manager.allocate(address) == chain_nonce
+
+    with nonce_manager.reserve(address, chain_nonce + 10) as nonce:
+        assert nonce == chain_nonce + 10
+    assert nonce_manager.allocate(address) == chain_nonce + 11
+
+
+def test_concurrent_allocation(skale):
+    address = skale.wallet.address
+    nonce_manager = NonceManager(skale.web3)
+    chain_nonce = skale.web3.eth.get_transaction_count(address, 'pending')
+    nonces = []
+
+    def allocate():
+        for _ in range(10):
+            nonces.append(nonce_manager.allocate(address))
+
+    threads = [threading.Thread(target=allocate) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(nonces) == list(range(chain_nonce, chain_nonce + 50))
+
+
+@pytest.mark.parametrize('reset_all', [True, False])
+def test_concurrent_reset(skale, reset_all):
+    address = skale.wallet.address
+    nonce_manager = NonceManager(skale.web3)
+    sync = nonce_manager._sync
+    syncing, resumed = threading.Event(), threading.Event()
+
+    def slow_sync(sync_address):
+        syncing.set()
+        resumed.wait(timeout=10)
+        sync(sync_address)
+
+    with mock.patch.object(nonce_manager, '_sync', side_effect=slow_sync):
+        allocation = threading.Thread(target=nonce_manager.allocate, args=(address,))
+        allocation.start()
+        assert syncing.wait(timeout=10)
+        reset = threading.Thread(
+            target=nonce_manager.reset,
+            args=() if reset_all else (address,)
+        )
+        reset.start()
+        # reset should wait for the allocation in progress
+        time.sleep(0.5)
+        assert reset.is_alive()
+        resumed.set()
+        allocation.join()
+        reset.join()
+    assert address not in nonce_manager._next_nonces
+    assert nonce_manager._in_flight[address] == 0
+
+
+def test_get_nonce_manager(skale):
+    nonce_manager = get_nonce_manager(skale.web3)
+    assert get_nonce_manager(skale.web3) is nonce_manager
+    assert nonce_manager.web3 is skale.web3
+
+
+def test_multithread_transactions(skale):
+    delay = skale.constants_holder.get_rotation_delay()
+    nonce_manager = NonceManager(skale.web3)
+    initial_nonce_manager = skale.nonce_manager
+    skale.nonce_manager = nonce_manager
+
+    def send():
+        skale.constants_holder.set_rotation_delay(delay, wait_for=True)
+
+    try:
+        assert skale.tx_nonce_manager is nonce_manager
+        threads = [threading.Thread(target=send) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        skale.nonce_manager = initial_nonce_manager
+    address = skale.wallet.address
+    nonce = nonce_manager.allocate(address)
+    nonce_manager.release(address, nonce)
+    assert nonce == skale.web3.eth.get_transaction_count(address, 'pending')
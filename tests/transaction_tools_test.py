@@ -7,9 +7,15 @@ from skale.transactions.exceptions import (
     TransactionFailedError
 )
 from skale import Skale
+from skale.transactions.fee_oracle import FeeOracle, Fees, get_fee_oracle
+from skale.transactions.gas_estimate_cache import GasEstimateCache
 from skale.transactions.tools import (
     get_block_gas_limit,
     estimate_gas,
+    estimate_gas_cached,
+    get_dry_run_gas_price,
+    make_dry_run_call,
+    resolve_fees,
     TxCallResult,
     TxStatus,
     run_tx_with_retry
@@ -145,6 +151,131 @@ def test_estimate_gas(skale):
     skale.wallet = main_wallet
 
 
+def test_make_dry_run_call(skale):
+    delay = skale.constants_holder.get_rotation_delay()
+    method = skale.constants_holder.contract.functions.setRotationDelay(delay)
+    opts = {'from': skale.wallet.address, 'value': 0}
+
+    call_result = make_dry_run_call(skale, method)
+    assert call_result.status == TxStatus.SUCCESS
+    assert call_result.data['gas'] == estimate_gas(skale.web3, method, opts)
+    assert call_result.data['gas_price'] == skale.web3.eth.gas_price
+    assert get_dry_run_gas_price(call_result) == skale.gas_price
+
+    call_result = make_dry_run_call(skale, method, gas_limit=1000000)
+    assert call_result.data['gas'] == 1000000
+
+    call_result = make_dry_run_call(skale, method, gas_limit=1000)
+    assert call_result.status == TxStatus.FAILED
+    assert get_dry_run_gas_price(call_result) is None
+
+
+def test_estimate_gas_cached(skale):
+    cache = GasEstimateCache(ttl=60, max_blocks=10)
+    delay = skale.constants_holder.get_rotation_delay()
+    method = skale.constants_holder.contract.functions.setRotationDelay(delay)
+    opts = {'from': skale.wallet.address, 'value': 0}
+
+    estimated_gas = estimate_gas_cached(skale.web3, cache, method, opts)
+    assert estimated_gas == estimate_gas(skale.web3, method, opts)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    same_shape = skale.constants_holder.contract.functions.setRotationDelay(delay + 1)
+    with mock.patch.object(same_shape, 'estimate_gas') as estimate_mock:
+        assert estimate_gas_cached(skale.web3, cache, same_shape, opts) == estimated_gas
+    estimate_mock.assert_not_called()
+    assert cache.hits == 1
+
+    key = cache.make_key(method, opts)
+    cache.set(key, 1000, skale.web3.eth.block_number)
+    assert estimate_gas_cached(skale.web3, cache, method, opts) == estimated_gas
+    assert cache.peek(key) != 1000
+
+    cache.set(key, cache.peek(key), skale.web3.eth.block_number - 11)
+    assert estimate_gas_cached(skale.web3, cache, method, opts) == estimated_gas
+    assert len(cache) == 1
+
+
+def test_estimate_gas_cached_revert(skale):
+    cache = GasEstimateCache(ttl=60, max_blocks=10)
+    address_to = generate_account(skale.web3)['address']
+    balance = skale.token.get_balance(skale.wallet.address)
+    transfer = skale.token.contract.functions.transfer(address_to, 1)
+    opts = {'from': skale.wallet.address, 'value': 0}
+    estimate_gas_cached(skale.web3, cache, transfer, opts)
+    key = cache.make_key(transfer, opts)
+    assert cache.peek(key) is not None
+
+    gas_estimate_cache = skale.gas_estimate_cache
+    skale.gas_estimate_cache = cache
+    try:
+        reverting_transfer = skale.token.contract.functions.transfer(address_to, balance + 1)
+        call_result = make_dry_run_call(skale, reverting_transfer)
+    finally:
+        skale.gas_estimate_cache = gas_estimate_cache
+    assert call_result.status == TxStatus.FAILED
+    assert call_result.error == 'revert'
+    assert cache.peek(key) is None
+
+
+def test_fee_oracle(skale):
+    oracle = FeeOracle(skale.web3, refresh_interval=60)
+    gas_price = oracle.gas_price()
+    assert gas_price == skale.gas_price
+    with mock.patch.object(type(skale.web3.eth), 'gas_price') as gas_price_mock:
+        assert oracle.gas_price() == gas_price
+    gas_price_mock.assert_not_called()
+    assert oracle.get_fees() == Fees(gas_price=gas_price)
+
+    block_number = skale.web3.eth.block_number
+    assert oracle.gas_price(block_number) == gas_price
+    with mock.patch.object(
+        type(skale.web3.eth),
+        'gas_price',
+        new_callable=mock.PropertyMock,
+        return_value=gas_price
+    ) as gas_price_mock:
+        oracle.gas_price(block_number)
+        oracle.gas_price(block_number + 1)
+    assert gas_price_mock.call_count == 1
+
+    fees = oracle.eip1559_fees()
+    assert fees.gas_price is None
+    assert fees.max_fee_per_gas >= fees.max_priority_fee_per_gas >= 0
+    assert oracle.eip1559_fees(skale.web3.eth.block_number) == fees
+    assert FeeOracle(skale.web3, eip1559=True).get_fees().max_fee_per_gas is not None
+    assert get_fee_oracle(skale.web3) is skale.fee_oracle
+
+
+def test_resolve_fees(skale):
+    assert resolve_fees(skale, gas_price=10 ** 9) == Fees(gas_price=10 ** 9)
+    assert resolve_fees(
+        skale,
+        gas_price=10 ** 9,
+        max_fee_per_gas=2 * 10 ** 9,
+        max_priority_fee_per_gas=10 ** 9
+    ) == Fees(max_fee_per_gas=2 * 10 ** 9, max_priority_fee_per_gas=10 ** 9)
+    assert resolve_fees(skale) == Fees(gas_price=skale.gas_price)
+
+    delay = skale.constants_holder.get_rotation_delay()
+    method = skale.constants_holder.contract.functions.setRotationDelay(delay)
+    call_result = make_dry_run_call(skale, method)
+    assert resolve_fees(skale, call_result).gas_price == get_dry_run_gas_price(call_result)
+
+    with mock.patch.object(skale.fee_oracle, 'eip1559', True):
+        fees = resolve_fees(skale)
+    assert fees.gas_price is None
+    assert fees.max_fee_per_gas is not None
+
+    with mock.patch.object(skale.fee_oracle, 'eip1559', True):
+        call_result = make_dry_run_call(skale, method)
+        assert get_dry_run_gas_price(call_result) is None
+        with mock.patch.object(type(skale.web3.eth), 'fee_history') as fee_history_mock:
+            fees = resolve_fees(skale, call_result)
+    fee_history_mock.assert_not_called()
+    assert fees.max_fee_per_gas is not None
+
+
 def test_tx_fee_options(skale):
     account = generate_account(skale.web3)
     address_to = account['address']
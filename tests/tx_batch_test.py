@@ -0,0 +1,40 @@
+""" SKALE pipelined transactions test """
+
+import pytest
+
+from skale.transactions.result import DryRunRevertError, TxStatus
+
+
+def test_tx_batch(skale):
+    delay = skale.constants_holder.get_rotation_delay()
+    address = skale.wallet.address
+    chain_nonce = skale.web3.eth.get_transaction_count(address, 'pending')
+
+    with skale.tx_batch() as tx_batch:
+        for i in range(3):
+            tx_batch.add(skale.constants_holder.set_rotation_delay, delay + i)
+        assert len(tx_batch) == 3
+
+    assert len(tx_batch.results) == 3
+    assert all(tx_res.receipt['status'] == 1 for tx_res in tx_batch.results)
+    nonces = [
+        skale.web3.eth.get_transaction(tx_res.tx_hash)['nonce']
+        for tx_res in tx_batch.results
+    ]
+    assert nonces == list(range(chain_nonce, chain_nonce + 3))
+    assert skale.constants_holder.get_rotation_delay() == delay + 2
+
+    skale.constants_holder.set_rotation_delay(delay, wait_for=True)
+
+
+def test_tx_batch_dry_run_failed(skale):
+    delay = skale.constants_holder.get_rotation_delay()
+    launch_ts = skale.constants_holder.get_launch_timestamp()
+    with pytest.raises(DryRunRevertError):
+        with skale.tx_batch() as tx_batch:
+            tx_batch.add(skale.constants_holder.set_rotation_delay, delay)
+            tx_batch.add(skale.constants_holder.set_launch_timestamp, launch_ts)
+    sent, failed = tx_batch.results
+    assert sent.receipt['status'] == 1
+    assert failed.tx_call_result.status == TxStatus.FAILED
+    assert failed.tx_hash is None
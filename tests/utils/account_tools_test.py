@@ -4,6 +4,7 @@ from unittest import mock
 import pytest
 
 from skale.transactions.exceptions import TransactionNotMinedError
+from skale.transactions.fee_oracle import get_fee_oracle
 from skale.utils.account_tools import (check_ether_balance, generate_account,
                                        generate_accounts, send_eth,
                                        send_tokens, check_skale_balance)
@@ -75,8 +76,9 @@ def test_send_eth_with_gas_price(skale, empty_account, block_in_seconds):
         )
 
     custom_default_gas_price = 101 * 10 ** 9
-    with mock.patch(
-            'skale.utils.account_tools.default_gas_price',
+    with mock.patch.object(
+            get_fee_oracle(skale.web3),
+            'gas_price',
             return_value=custom_default_gas_price
     ):
         receipt = send_eth(
@@ -0,0 +1,101 @@
+from unittest import mock
+
+import pytest
+from requests.exceptions import ConnectionError
+from web3.exceptions import ContractLogicError
+
+import skale.utils.batch_utils as batch_utils
+from skale.utils.batch_utils import RpcRequest, batch_call, batch_request, iter_pages
+from skale.utils.web3_utils import EthClientOutdatedError, get_block_session
+
+from tests.constants import NOT_EXISTING_ID
+
+
+def test_batch_call(skale, nodes):
+    functions = [
+        skale.nodes.contract.functions.getNodeStatus(node_id)
+        for node_id in nodes
+    ] + [skale.nodes.contract.functions.getNodePublicKey(nodes[0])]
+    expected = [function.call() for function in functions]
+    assert batch_call(skale.web3, functions) == expected
+    assert batch_call(skale.web3, functions, chunk_size=1) == expected
+    assert batch_call(skale.web3, []) == []
+
+
+def test_batch_call_errors(skale, nodes):
+    functions = [
+        skale.nodes.contract.functions.getNodeStatus(nodes[0]),
+        skale.nodes.contract.functions.getNodeStatus(NOT_EXISTING_ID)
+    ]
+    with pytest.raises(ContractLogicError):
+        batch_call(skale.web3, functions)
+    results = batch_call(skale.web3, functions, return_exceptions=True)
+    assert results[0] == functions[0].call()
+    assert isinstance(results[1], ContractLogicError)
+
+
+def test_batch_request(skale):
+    block_number, chain_id = batch_request(skale.web3, [
+        RpcRequest('eth_blockNumber', []),
+        RpcRequest('eth_chainId', [])
+    ])
+    assert block_number <= skale.web3.eth.block_number
+    assert chain_id == skale.web3.eth.chain_id
+
+
+def test_batch_request_middlewares(skale):
+    requests = [RpcRequest('eth_chainId', [])] * 3
+    with mock.patch.object(
+        batch_utils, '_send_batch', side_effect=ConnectionError('Batch failed')
+    ) as send_batch, mock.patch.object(batch_utils, 'BATCH_RETRY_BACKOFF', 0):
+        assert batch_request(skale.web3, requests) == [skale.web3.eth.chain_id] * 3
+        assert send_batch.call_count == batch_utils.BATCH_RETRIES
+        block_response, = batch_utils.make_batch_request(
+            skale.web3,
+            [RpcRequest('eth_getBlockByNumber', ['latest', False])]
+        )
+    assert isinstance(block_response['result']['number'], str)
+
+    with mock.patch.object(
+        batch_utils, 'check_client', side_effect=EthClientOutdatedError
+    ), pytest.raises(EthClientOutdatedError):
+        batch_request(skale.web3, requests)
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_iter_pages_block_session(skale, prefetch):
+    def fetch_page(offset, limit):
+        return [get_block_session(skale.web3).block_number] * limit
+
+    with skale.at_block() as session:
+        items = iter_pages(fetch_page, total=4, page_size=2, prefetch=prefetch)
+    assert list(items) == [session.block_number] * 4
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_iter_pages(prefetch):
+    items = list(range(10))
+    pages = []
+
+    def fetch_page(offset, limit):
+        pages.append((offset, limit))
+        return items[offset:offset + limit]
+
+    assert list(iter_pages(fetch_page, total=10, page_size=4, prefetch=prefetch)) == items
+    assert pages == [(0, 4), (4, 4), (8, 2)]
+
+    pages.clear()
+    assert list(iter_pages(fetch_page, page_size=5, prefetch=prefetch)) == items
+    assert pages == [(0, 5), (5, 5), (10, 5)]
+
+    assert list(iter_pages(fetch_page, total=0, prefetch=prefetch)) == []
+
+    def failing_page(offset, limit):
+        if offset > 0:
+            raise ValueError('Page is not available')
+        return items[:limit]
+
+    iterator = iter_pages(failing_page, total=10, page_size=5, prefetch=prefetch)
+    assert [next(iterator) for _ in range(5)] == items[:5]
+    with pytest.raises(ValueError):
+        next(iterator)
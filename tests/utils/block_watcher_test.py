@@ -0,0 +1,43 @@
+""" SKALE block watcher test """
+
+import gc
+import weakref
+
+import pytest
+
+from skale.transactions.exceptions import TransactionNotMinedError
+from skale.utils.block_watcher import _watchers, get_block_watcher
+from skale.utils.web3_utils import init_web3
+
+from tests.constants import ENDPOINT
+
+
+def test_wait_many(skale):
+    watcher = get_block_watcher(skale.web3)
+    assert get_block_watcher(skale.web3) is watcher
+
+    delay = skale.constants_holder.get_rotation_delay()
+    tx_hashes = [
+        skale.constants_holder.set_rotation_delay(delay, wait_for=False).tx_hash
+        for _ in range(3)
+    ]
+    receipts = watcher.wait_many(tx_hashes)
+    assert [receipt['transactionHash'].hex() for receipt in receipts] == \
+        [skale.web3.to_hex(tx_hash) for tx_hash in tx_hashes]
+    assert all(receipt['status'] == 1 for receipt in receipts)
+    assert watcher.wait(tx_hashes[0]) == receipts[0]
+
+
+def test_wait_not_mined(skale):
+    watcher = get_block_watcher(skale.web3)
+    with pytest.raises(TransactionNotMinedError):
+        watcher.wait('0x' + '00' * 32, blocks_to_wait=1, timeout=3)
+
+
+def test_watcher_released_with_web3():
+    web3 = init_web3(ENDPOINT)
+    watcher = weakref.ref(get_block_watcher(web3))
+    assert web3 in _watchers
+    del web3
+    gc.collect()
+    assert watcher() is None
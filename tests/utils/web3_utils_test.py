@@ -1,19 +1,29 @@
+import asyncio
 import importlib
 import os
 from datetime import datetime
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
 
 import skale.config as config
+from skale import SkaleManager
+from skale.transactions.exceptions import TransactionNotMinedError
+from skale.utils.helper import get_skale_manager_address
 from skale.utils.web3_utils import (
+    CallCache,
     EthClientOutdatedError,
+    get_block_session,
     get_last_known_block_number,
+    init_async_web3,
     init_web3,
-    save_last_known_block_number
+    save_last_known_block_number,
+    suspend_block_session,
+    wait_for_receipts_by_blocks
 )
 
-from tests.constants import ENDPOINT
+from tests.constants import ENDPOINT, TEST_ABI_FILEPATH
 from tests.helper import init_skale
 
 
@@ -21,6 +31,7 @@ from tests.helper import init_skale
 def last_block_file():
     filepath = 'last-block-file'
     os.environ['LAST_BLOCK_FILE'] = filepath
+    os.environ['CLIENT_CHECK_INTERVAL'] = '0'
     importlib.reload(config)
     try:
         yield filepath
@@ -28,6 +39,7 @@ def last_block_file():
         if os.path.isfile(filepath):
             os.remove(filepath)
             os.environ.pop('LAST_BLOCK_FILE')
+        os.environ.pop('CLIENT_CHECK_INTERVAL')
         importlib.reload(config)
 
 
@@ -69,6 +81,25 @@ def test_call_with_last_block_file(skale_block_file, last_block_file):
     assert get_last_known_block_number(state_path) >= needed_block
 
 
+def test_client_check_interval(skale_block_file, last_block_file):
+    state_path = last_block_file
+    w3 = init_web3(ENDPOINT, state_path=state_path)
+    w3.eth.chain_id
+    current_block = get_last_known_block_number(state_path)
+    assert current_block > 0
+
+    with mock.patch.object(config, 'CLIENT_CHECK_INTERVAL', 60):
+        w3 = init_web3(ENDPOINT, state_path=state_path)
+    w3.eth.chain_id
+    save_last_known_block_number(state_path, current_block + 10)
+    # the state file is checked only when the latest block is sampled
+    w3.eth.chain_id
+
+    w3 = init_web3(ENDPOINT, state_path=state_path)
+    with pytest.raises(EthClientOutdatedError):
+        w3.eth.chain_id
+
+
 def test_call_with_outdated_client(skale):
     # because of skipTime in preparation
     current_ts = skale.web3.eth.get_block('latest')['timestamp']
@@ -83,6 +114,15 @@ def test_call_with_outdated_client(skale):
             skale.validator_service.ls()
 
 
+def test_async_call_with_outdated_client(skale):
+    current_ts = skale.web3.eth.get_block('latest')['timestamp']
+    dt = datetime.utcfromtimestamp(current_ts + config.ALLOWED_TS_DIFF + 5)
+    with freeze_time(dt):
+        async_web3 = init_async_web3(ENDPOINT)
+        with pytest.raises(EthClientOutdatedError):
+            asyncio.run(async_web3.eth.chain_id)
+
+
 def test_transaction_with_last_block_file(last_block_file, skale_block_file):
     skale = skale_block_file
     state_path = last_block_file
@@ -124,3 +164,62 @@ def test_transaction_with_outdated_client(skale):
                 new_rotation_delay,
                 wait_for=True
             )
+
+
+def test_call_cache(skale):
+    call_cache = CallCache(max_size=2, block_check_interval=0)
+    cached_skale = SkaleManager(
+        ENDPOINT,
+        get_skale_manager_address(TEST_ABI_FILEPATH),
+        skale.wallet,
+        call_cache=call_cache
+    )
+
+    delay = cached_skale.constants_holder.get_rotation_delay()
+    assert cached_skale.constants_holder.get_rotation_delay() == delay
+    assert call_cache.misses == 1
+    assert call_cache.hits == 1
+
+    skale.constants_holder.set_rotation_delay(delay + 1, wait_for=True)
+    assert cached_skale.constants_holder.get_rotation_delay() == delay + 1
+    assert call_cache.misses == 2
+    skale.constants_holder.set_rotation_delay(delay, wait_for=True)
+
+    cached_skale.constants_holder.launch_timestamp()
+    cached_skale.nodes.get_nodes_number()
+    assert len(call_cache) == 2
+
+    current_ts = skale.web3.eth.get_block('latest')['timestamp']
+    dt = datetime.utcfromtimestamp(current_ts + config.ALLOWED_TS_DIFF + 5)
+    with freeze_time(dt):
+        with pytest.raises(EthClientOutdatedError):
+            cached_skale.constants_holder.launch_timestamp()
+
+    call_cache.clear()
+    assert len(call_cache) == 0
+
+
+def test_suspend_block_session(skale):
+    with skale.at_block() as session:
+        with suspend_block_session(skale.web3):
+            assert get_block_session(skale.web3) is None
+        assert get_block_session(skale.web3) is session
+    with suspend_block_session(skale.web3):
+        assert get_block_session(skale.web3) is None
+
+
+def test_wait_for_receipts_by_blocks(skale):
+    delay = skale.constants_holder.get_rotation_delay()
+    tx_hashes = [
+        skale.constants_holder.set_rotation_delay(delay, wait_for=False).tx_hash
+        for _ in range(2)
+    ]
+    receipts = wait_for_receipts_by_blocks(skale.web3, tx_hashes)
+    assert [receipt['transactionHash'].hex() for receipt in receipts] == \
+        [skale.web3.to_hex(tx_hash) for tx_hash in tx_hashes]
+    assert all(receipt['status'] == 1 for receipt in receipts)
+
+    with pytest.raises(TransactionNotMinedError):
+        wait_for_receipts_by_blocks(
+            skale.web3, ['0x' + '00' * 32], blocks_to_wait=1, timeout=3
+        )
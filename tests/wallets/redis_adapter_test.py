@@ -3,6 +3,7 @@ from datetime import datetime
 from unittest import mock
 import pytest
 from freezegun import freeze_time
+from redis.exceptions import ResponseError
 from web3 import Web3
 
 from skale.wallets.redis_wallet import (
@@ -10,7 +11,8 @@ from skale.wallets.redis_wallet import (
     RedisWalletWaitError,
     RedisWalletDroppedError,
     RedisWalletEmptyStatusError,
-    RedisWalletAdapter
+    RedisWalletAdapter,
+    TxRecordFormat
 )
 
 from tests.helper import in_time
@@ -55,6 +57,20 @@ def test_make_record():
     assert r == b'{"status": "PROPOSED", "score": "51623233060", "multiplier": 2, "tx_hash": null, "method": "createNode", "from": "0x1", "to": "0x2", "value": 1, "gasPrice": 1, "gas": null, "nonce": 1, "chainId": 1}'  # noqa
 
 
+def test_make_record_fields():
+    tx = {'from': '0x1', 'to': '0x2', 'value': 1, 'gas': 22000, 'nonce': 1}
+    tx_id, fields = RedisWalletAdapter._make_record_fields(tx, 51623233060, 2, method='createNode')
+    assert tx_id.startswith(b'tx-') and len(tx_id) == 19
+    assert fields == {
+        'status': 'PROPOSED',
+        'score': '51623233060',
+        'multiplier': '2',
+        'tx_hash': '',
+        'method': 'createNode',
+        'tx': '{"from": "0x1", "to": "0x2", "value": 1, "gas": null, "nonce": 1}'
+    }
+
+
 def test_sign_and_send(rdp):
     tx = {
         'from': '0x1',
@@ -98,3 +114,94 @@ def test_rdp_wait(rdp):
     ):
         with in_time(2):
             assert rdp.wait(tx_id, timeout=100) == fake_receipt
+
+
+def test_rdp_wait_notified(rdp):
+    tx_id = rdp.sign_and_send({'to': '0x2', 'value': 1, 'nonce': 1}, priority=5)
+    rdp.rs.connection_pool.connection_kwargs = {'db': 0}
+    pubsub = rdp.rs.pubsub.return_value
+    pubsub.get_message.return_value = {'type': 'message', 'data': b'set'}
+    rdp.get_record = mock.Mock(side_effect=[
+        {'tx_hash': None, 'status': 'PROPOSED'},
+        {'tx_hash': None, 'status': 'SENT'},
+        {'tx_hash': 'test', 'status': 'SUCCESS'}
+    ])
+    fake_receipt = {'test': 'test'}
+    with mock.patch(
+        'skale.wallets.redis_wallet.get_receipt',
+        return_value=fake_receipt
+    ):
+        with in_time(1):
+            assert rdp.wait(tx_id, timeout=100) == fake_receipt
+    raw_id = Web3.to_bytes(hexstr=tx_id)
+    pubsub.subscribe.assert_called_once_with(b'__keyspace@0__:' + raw_id)
+    assert pubsub.get_message.call_count == 2
+    pubsub.close.assert_called_once()
+
+
+def test_sign_and_send_many(rdp):
+    txs = [{'to': '0x2', 'value': i, 'nonce': i} for i in range(3)]
+    tx_ids = rdp.sign_and_send_many(txs, priority=5, method='transfer')
+    assert len(set(tx_ids)) == 3
+    pipe = rdp.rs.pipeline.return_value
+    assert pipe.zadd.call_count == 3
+    assert pipe.set.call_count == 3
+    pipe.execute.assert_called_once()
+
+
+def test_get_records(rdp):
+    rdp.rs.mget = mock.Mock(return_value=[
+        b'{"status": "SUCCESS", "tx_hash": "0x1", "score": 1}',
+        None
+    ])
+    tx_ids = ['0x' + '01' * 19, '0x' + '02' * 19]
+    assert rdp.get_records(tx_ids) == [{'status': 'SUCCESS', 'tx_hash': '0x1'}, None]
+    rdp.rs.mget.assert_called_once_with([Web3.to_bytes(hexstr=tx_id) for tx_id in tx_ids])
+    assert rdp.get_records([]) == []
+
+
+def test_rdp_wait_many(rdp):
+    tx_ids = ['0x' + '01' * 19, '0x' + '02' * 19]
+    rdp.get_records = mock.Mock(side_effect=[
+        [{'tx_hash': None, 'status': 'PROPOSED'}, {'tx_hash': '0x2', 'status': 'SUCCESS'}],
+        [{'tx_hash': '0x1', 'status': 'SUCCESS'}]
+    ])
+    with mock.patch(
+        'skale.wallets.redis_wallet.get_receipt',
+        side_effect=lambda web3, tx_hash: {'hash': tx_hash}
+    ):
+        with in_time(2):
+            assert rdp.wait_many(tx_ids, timeout=100) == [{'hash': '0x1'}, {'hash': '0x2'}]
+    assert rdp.get_records.call_args_list[1] == mock.call([tx_ids[0]])
+
+    rdp.get_records = mock.Mock(return_value=[
+        {'tx_hash': None, 'status': 'DROPPED'},
+        {'tx_hash': '0x2', 'status': 'SUCCESS'}
+    ])
+    with pytest.raises(RedisWalletDroppedError):
+        rdp.wait_many(tx_ids, timeout=100)
+
+
+def test_hash_records(skale):
+    rdp = RedisWalletAdapter(mock.Mock(), 'transactions', skale.wallet, TxRecordFormat.HASH)
+    tx_ids = rdp.sign_and_send_many([{'to': '0x2', 'value': 1, 'nonce': 1}])
+    pipe = rdp.rs.pipeline.return_value
+    pipe.hset.assert_called_once()
+    pipe.set.assert_not_called()
+
+    tx_ids = ['0x' + '01' * 19, '0x' + '02' * 19, '0x' + '03' * 19]
+    pipe.execute.return_value = [
+        [b'SUCCESS', b'0x1'],
+        ResponseError('WRONGTYPE Operation against a key holding the wrong kind of value'),
+        [None, None]
+    ]
+    rdp.rs.mget = mock.Mock(return_value=[b'{"status": "SENT", "tx_hash": "0x2"}'])
+    assert rdp.get_records(tx_ids) == [
+        {'status': 'SUCCESS', 'tx_hash': '0x1'},
+        {'status': 'SENT', 'tx_hash': '0x2'},
+        None
+    ]
+    rdp.rs.mget.assert_called_once_with([Web3.to_bytes(hexstr=tx_ids[1])])
+
+    pipe.execute.return_value = [[b'PROPOSED', b'']]
+    assert rdp.get_record(tx_ids[0]) == {'status': 'PROPOSED', 'tx_hash': None}